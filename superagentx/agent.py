@@ -1,7 +1,9 @@
 import asyncio
+import copy
 import json
 import logging
 import uuid
+from collections.abc import Callable
 from json import JSONDecodeError
 from typing import Literal, Any
 
@@ -17,8 +19,10 @@ from superagentx.exceptions import StopSuperAgentX
 from superagentx.llm import LLMClient, ChatCompletionParams
 from superagentx.prompt import PromptTemplate
 from superagentx.result import GoalResult
-from superagentx.utils.helper import iter_to_aiter, StatusCallback, _maybe_await
+from superagentx.utils.helper import iter_to_aiter, StatusCallback, _maybe_await, bounded_gather, deadline_exceeded
 from superagentx.utils.observability.span_decorator import agent_span
+from superagentx.utils.retry import is_retryable, sleep_before_retry
+from superagentx.verifiers import GoalVerifier, as_verifier
 
 logger = logging.getLogger(__name__)
 
@@ -49,6 +53,16 @@ Make sure generate the result based on the given output format if provided.
 Always generate the JSON output. Don't include any command lines.
 """
 
+_SINGLE_CALL_VERIFY_PROMPT = """When you reply without calling a tool, e.g. once you have the results of your tool
+calls, review whether your answer and the tool results achieve the following goal for the query instruction.
+
+Goal: {goal}
+
+Then reply only with the below JSON without any other text.
+
+{{"reason": "Set the reason for the review", "result": "Set your answer", "is_goal_satisfied": true or false}}
+"""
+
 ENGINE_RESULT_FORMAT = """
 {{
     reason: Set the reason for result,
@@ -58,6 +72,11 @@ ENGINE_RESULT_FORMAT = """
 """
 
 
+def _clone_engine(engine):
+    clone = getattr(engine, 'clone', None)
+    return clone() if callable(clone) else engine
+
+
 class Agent:
 
     def __init__(
@@ -76,11 +95,17 @@ class Agent:
             tool_args: dict[str, Any] | None = None,
             output_format: str | None = None,
             max_retry: int = 5,
+            retry_delay: float = 0.5,
+            max_retry_delay: float = 30,
             human_approval: bool = False,
             approval_channel: HumanApprovalChannel = None,
             return_engine_result: bool = False,
             capabilities: list[str] | None = None,
-            tags: list[str] | None = None
+            tags: list[str] | None = None,
+            depends_on: list['Agent'] | None = None,
+            max_concurrency: int | None = None,
+            verifiers: list[GoalVerifier | Callable] | None = None,
+            single_call_verify: bool = False
     ):
         """
         Initializes a new Agent instance.
@@ -116,12 +141,29 @@ class Agent:
                 (e.g., text, JSON, or a custom schema).
             max_retry: Maximum number of retry attempts for recoverable failures
                 during execution. Defaults to 5.
+            retry_delay: Seconds of backoff before the first retry of a failed execution, doubled with every retry
+                and randomized. Only the engines which failed are executed again. Defaults to 0.5.
+            max_retry_delay: Maximum seconds of backoff before a retry. Defaults to 30.
             human_approval: Whether certain actions require explicit human
                 approval before proceeding.
             approval_channel: The channel or mechanism used to request and receive
                 human approval when enabled.
             return_engine_result: Whether to return raw engine execution results
                 instead of (or in addition to) post-processed agent output.
+            depends_on: Optional list of upstream agents whose results this agent needs. When any agent in a
+                pipe declares dependencies, the pipe schedules its agents as a dependency graph and starts this
+                agent as soon as the listed agents have finished. `None` keeps the implicit dependency on the
+                previous stage of the pipe, an empty list makes the agent a root of the graph.
+            max_concurrency: Maximum number of engines of a parallel engine group running at the same time.
+                Defaults to `None`, running the whole group concurrently.
+            verifiers: Optional deterministic goal verifiers, e.g. `PydanticVerifier(Answer)` or a callable, run in
+                order before the LLM goal verification. The first verifier which decides accepts or rejects the
+                output without an LLM call, the LLM verifies only when none of them decides.
+            single_call_verify: Whether a simple tool agent, one tool `Engine` without `output_format`, asks for its
+                goal verdict in its final answer, the LLM reply without tool calls, instead of a second LLM call. A
+                verdict reviews the outcome only once the tool results were sent back, see `Engine.max_iterations`,
+                so the separate verification is used when the engine run ends with tool calls, or when the verdict
+                is missing or cannot be parsed. Defaults to False.
         """
         self.role = role
         self.goal = goal
@@ -134,18 +176,40 @@ class Agent:
             Engine | BrowserEngine | TaskEngine | list[Engine | BrowserEngine | TaskEngine]] = engines or []
         self.tool = tool
         self.tool_args = tool_args
+        if not self.engines and self.tool:  # If pass tool via Agent
+            # Built upfront, so concurrent executions never add the engine twice
+            self.engines.append(Engine(handler=self.tool, llm=self.llm, prompt_template=self.prompt_template))
         self.output_format = output_format
         self.max_retry = max_retry if max_retry >= 1 else 1
+        self.retry_delay = retry_delay
+        self.max_retry_delay = max_retry_delay
         self.return_engine_result = return_engine_result
         self.human_approval = human_approval
         self.approval_channel = approval_channel or ConsoleApprovalChannel()
         self.engine_result_format = ENGINE_RESULT_FORMAT
         self.capabilities = capabilities or []
         self.tags = tags or []
+        self.depends_on: list[Agent] | None = list(depends_on) if depends_on is not None else None
+        self.max_concurrency = max_concurrency
+        self.verifiers = [as_verifier(verifier) for verifier in verifiers or []]
+        self.single_call_verify = single_call_verify
         if self.return_engine_result:
             self.engine_result_format = """{{ reason: Set the reason for result, is_goal_satisfied: 'True' if result 
             satisfied based on the given goal. Otherwise set as 'False'. Set only 'True' or 'False' boolean. }}"""
 
+    def clone(self) -> 'Agent':
+        """
+        Returns a copy of the agent for concurrent executions. The copy shares the LLM client, prompt template,
+        handlers, tool schemas and verifiers of this agent, with its own engine instances, so the run state kept on
+        the engines, e.g. by `TaskEngine` and `BrowserEngine`, is not shared. The copy keeps the agent id and name.
+        """
+        agent = copy.copy(self)
+        agent.engines = [
+            [_clone_engine(_engine) for _engine in _engines] if isinstance(_engines, list) else _clone_engine(_engines)
+            for _engines in self.engines
+        ]
+        return agent
+
     def __str__(self):
         return "Agent"
 
@@ -194,9 +258,31 @@ class Agent:
             results: list[Any],
             old_memory: str | None = None,
             pipe_id: str | None = None,
-            status_callback: StatusCallback | None = None
+            status_callback: StatusCallback | None = None,
+            deadline: float | None = None,
+            verdicts: list[str] | None = None
 
     ) -> GoalResult | None:
+        goal_result = await self._verify_deterministic(
+            results=results,
+            query_instruction=query_instruction,
+            pipe_id=pipe_id,
+            status_callback=status_callback
+        )
+        if goal_result:
+            return goal_result
+
+        if verdicts:
+            goal_result = self._parse_verdict(verdict=verdicts[-1], results=results)
+            if goal_result:
+                return goal_result
+            logger.debug(f'Agent `{self.name}` single call verdict cannot be parsed, verifying goal separately')
+
+        if not self.llm:
+            # No verifier decided and there is no LLM to verify the goal
+            logger.debug(f'Agent `{self.name}` goal is not verified, none of its verifiers decided')
+            return self._unverified_result(results)
+
         if old_memory:
             results = f"output_context:\n{old_memory}\n\n{results}"
             logger.debug(f'Updated Output Context with old memory : {results}')
@@ -214,7 +300,8 @@ class Agent:
             messages=prompt_message
         )
         messages = await self.llm.achat_completion(
-            chat_completion_params=chat_completion_params
+            chat_completion_params=chat_completion_params,
+            deadline=deadline
         )
         # Callback: agent execution started
         if status_callback:
@@ -257,6 +344,75 @@ class Agent:
                 is_goal_satisfied=False
             )
 
+    def _uses_single_call(self) -> bool:
+        # Only a lone tool engine answers with the tool results as they are, which its final answer can review
+        return (
+                self.single_call_verify
+                and not self.output_format
+                and len(self.engines) == 1
+                and isinstance(self.engines[0], Engine)
+        )
+
+    def _parse_verdict(
+            self,
+            *,
+            verdict: str,
+            results: list[Any]
+    ) -> GoalResult | None:
+        try:
+            _verdict = json.loads(verdict.replace('```json', '').replace('```', ''))
+        except JSONDecodeError:
+            return None
+        if not isinstance(_verdict, dict) or not isinstance(_verdict.get('is_goal_satisfied'), bool):
+            return None
+        # The verdict carries the final answer of the engine, which replaces the raw JSON among the engine results
+        engine_results = results[-1]
+        if isinstance(engine_results, list) and engine_results and engine_results[-1] == verdict:
+            results = [*results[:-1], [*engine_results[:-1], _verdict.get('result')]]
+        return GoalResult(
+            name=self.name,
+            agent_id=self.agent_id,
+            reason=_verdict.get('reason'),
+            result=results,
+            content=results,
+            is_goal_satisfied=_verdict['is_goal_satisfied']
+        )
+
+    async def _verify_deterministic(
+            self,
+            *,
+            query_instruction: str,
+            results: list[Any],
+            pipe_id: str | None = None,
+            status_callback: StatusCallback | None = None
+    ) -> GoalResult | None:
+        for verifier in self.verifiers:
+            verification = await verifier.verify(results)
+            if verification is None:
+                continue
+            logger.debug(
+                f'Agent `{self.name}` goal verified by {verifier} without LLM: {verification.is_goal_satisfied}'
+            )
+            if status_callback:
+                await _maybe_await(status_callback(
+                    event="agent_verify_goal_deterministic",
+                    pipe_id=pipe_id,
+                    agent_id=self.agent_id,
+                    agent=self.name,
+                    query=query_instruction,
+                    verifier=verifier.name,
+                    is_goal_satisfied=verification.is_goal_satisfied
+                ))
+            return GoalResult(
+                name=self.name,
+                agent_id=self.agent_id,
+                reason=verification.reason,
+                result=verification.result,
+                content=results,
+                is_goal_satisfied=verification.is_goal_satisfied
+            )
+        return None
+
     async def _execute(
             self,
             query_instruction: str,
@@ -267,10 +423,16 @@ class Agent:
             pipe_id: str | None = None,
             storage: StorageAdapter = None,
             conversation_id: str | None = None,
-            status_callback: StatusCallback | None = None
+            status_callback: StatusCallback | None = None,
+            deadline: float | None = None,
+            engine_results: list | None = None,
+            engine_memo: dict | None = None
 
     ) -> GoalResult:
-        results = []
+        # Collected into the caller's list, so the results of finished engines survive a deadline
+        results = engine_results if engine_results is not None else []
+        # Results of the engines which succeeded in an earlier attempt of this execution, keyed by their position
+        memo = engine_memo if engine_memo is not None else {}
 
         params = {
             "input_prompt": query_instruction,
@@ -283,27 +445,43 @@ class Agent:
             "storage": storage,
             "status_callback": status_callback
         }
-        if not self.engines and self.tool: # If pass tool via Agent
-            logger.debug(f'Engine(s) is empty')
-            engine = Engine(handler=self.tool, llm=self.llm, prompt_template=self.prompt_template)
-            await self.add(engine)
-
         if conversation_id:
             params["conversation_id"] = conversation_id
-        async for _engines in iter_to_aiter(self.engines):
+        if deadline is not None:
+            params["deadline"] = deadline
+        verdicts = None
+        if verify_goal and self._uses_single_call():
+            verdicts = []
+            params["verify_prompt"] = _SINGLE_CALL_VERIFY_PROMPT.format(goal=self.goal)
+            params["verdicts"] = verdicts
+        async for stage, _engines in iter_to_aiter(enumerate(self.engines)):
             if isinstance(_engines, list):
-                logger.debug(f'Engine(s) are executing : {",".join([str(_engine) for _engine in _engines])}')
-
-                _res = await asyncio.gather(
-                    *[
-                        _engine.start(**params)
-                        async for _engine in iter_to_aiter(_engines)
-                    ]
-                )
+                pending = [idx for idx in range(len(_engines)) if (stage, idx) not in memo]
+                if pending:
+                    logger.debug(
+                        f'Engine(s) are executing : {",".join([str(_engines[idx]) for idx in pending])}'
+                    )
+                    # Waits for the whole group, so the engines which succeeded are kept when another one fails
+                    outcomes = await bounded_gather(
+                        *[_engines[idx].start(**params) for idx in pending],
+                        limit=self.max_concurrency,
+                        return_exceptions=True
+                    )
+                    errors = []
+                    for idx, outcome in zip(pending, outcomes):
+                        if isinstance(outcome, BaseException):
+                            errors.append(outcome)
+                        else:
+                            memo[(stage, idx)] = outcome
+                    if errors:
+                        raise errors[0]
+                _res = [memo[(stage, idx)] for idx in range(len(_engines))]
                 logger.debug(f'Engine(s) results : {_res}')
             else:
-                logger.debug(f'Engine is executing : {_engines}')
-                _res = await _engines.start(**params)
+                if (stage,) not in memo:
+                    logger.debug(f'Engine is executing : {_engines}')
+                    memo[(stage,)] = await _engines.start(**params)
+                _res = memo[(stage,)]
                 logger.debug(f'Engine result : {_res}')
             results.append(_res)
 
@@ -315,25 +493,30 @@ class Agent:
                 query_instruction=query_instruction,
                 old_memory=old_memory,
                 pipe_id=pipe_id,
-                status_callback=status_callback
+                status_callback=status_callback,
+                deadline=deadline,
+                verdicts=verdicts
             )
             logger.debug(f"Final Goal Result :\n{final_result.model_dump()}")
             if self.return_engine_result:
                 final_result.engine_result = results
             return final_result
         else:
-            engine_result = None
-            if self.return_engine_result:
-                engine_result = results
-            return GoalResult(
-                name=self.name,
-                agent_id=self.agent_id,
-                result=results,
-                content=results,
-                verify_goal=False,
-                is_goal_satisfied=None,
-                engine_result=engine_result
-            )
+            return self._unverified_result(results)
+
+    def _unverified_result(self, results: list[Any]) -> GoalResult:
+        engine_result = None
+        if self.return_engine_result:
+            engine_result = results
+        return GoalResult(
+            name=self.name,
+            agent_id=self.agent_id,
+            result=results,
+            content=results,
+            verify_goal=False,
+            is_goal_satisfied=None,
+            engine_result=engine_result
+        )
 
     async def _request_human_approval(
             self,
@@ -352,6 +535,25 @@ class Agent:
             conversation_id=conversation_id
         )
 
+    async def _checkpoint(
+            self,
+            *,
+            storage: StorageAdapter | None,
+            pipe_id: str | None,
+            query_instruction: str,
+            goal_result: GoalResult
+    ) -> None:
+        # Approved agents keep APPROVED as their final status
+        if storage:
+            await storage.mark_agent_completed(
+                pipe_id=pipe_id,
+                agent_id=self.agent_id,
+                agent_name=self.name,
+                input_content=query_instruction,
+                goal_result=goal_result,
+                status="APPROVED" if self.human_approval else "COMPLETED"
+            )
+
     @agent_span
     async def execute(
             self,
@@ -365,7 +567,8 @@ class Agent:
             stop_if_goal_not_satisfied: bool = False,
             conversation_id: str | None = None,
             storage: StorageAdapter = None,
-            status_callback: StatusCallback | None = None
+            status_callback: StatusCallback | None = None,
+            deadline: float | None = None
     ) -> GoalResult | None:
         """
         Executes the specified query instruction to achieve a defined goal.
@@ -393,6 +596,9 @@ class Agent:
                     approvals are enabled to wait and act after a human action is being performed.
             status_callback: This optional status call back method helps enhance user experience to get live updates of
                 agents executions
+            deadline: Optional event loop deadline (see `asyncio.timeout_at`) propagated to the engines and LLM
+                calls. Once it passes, in-flight work is cancelled, no further retries are made and a partial
+                GoalResult with the results of the finished engines is returned.
 
             Executes the agent with optional human approval.
 
@@ -410,7 +616,7 @@ class Agent:
         _goal_result = None
 
         try:
-            if not self.llm:
+            if not self.llm and not self.verifiers:
                 verify_goal = False
 
             # ------------------------------------------------------------------
@@ -500,7 +706,9 @@ class Agent:
             # ------------------------------------------------------------------
             # EXECUTION LOOP
             # ------------------------------------------------------------------
+            engine_memo = {}
             for retry in range(1, self.max_retry + 1):
+                engine_results = []
                 try:
                     if status_callback:
                         await _maybe_await(status_callback(
@@ -512,27 +720,20 @@ class Agent:
                             conversation_id=conversation_id
                         ))
 
-                    _goal_result = await self._execute(
-                        query_instruction=query_instruction,
-                        pre_result=pre_result,
-                        previous_agent_result=previous_agent_result,
-                        old_memory=old_memory,
-                        pipe_id=pipe_id,
-                        verify_goal=verify_goal,
-                        storage=storage,
-                        conversation_id=conversation_id,
-                        status_callback=status_callback
-                    )
-
-                    # Store COMPLETED only when NO human approval
-                    if storage and not self.human_approval:
-                        await storage.mark_agent_completed(
+                    async with asyncio.timeout_at(deadline):
+                        _goal_result = await self._execute(
+                            query_instruction=query_instruction,
+                            pre_result=pre_result,
+                            previous_agent_result=previous_agent_result,
+                            old_memory=old_memory,
                             pipe_id=pipe_id,
-                            agent_id=self.agent_id,
-                            agent_name=self.name,
-                            input_content=query_instruction,
-                            goal_result=_goal_result,
-                            status="COMPLETED"
+                            verify_goal=verify_goal,
+                            storage=storage,
+                            conversation_id=conversation_id,
+                            status_callback=status_callback,
+                            deadline=deadline,
+                            engine_results=engine_results,
+                            engine_memo=engine_memo
                         )
 
                     if status_callback:
@@ -546,7 +747,13 @@ class Agent:
                             conversation_id=conversation_id
                         ))
 
-                    if not verify_goal or _goal_result.is_goal_satisfied:
+                    if not verify_goal or not _goal_result.verify_goal or _goal_result.is_goal_satisfied:
+                        await self._checkpoint(
+                            storage=storage,
+                            pipe_id=pipe_id,
+                            query_instruction=query_instruction,
+                            goal_result=_goal_result
+                        )
                         if status_callback:
                             await _maybe_await(status_callback(
                                 event="agent_goal_satisfied",
@@ -558,16 +765,54 @@ class Agent:
                             ))
                         return _goal_result
 
+                    # Only the final attempt is checkpointed, so a resume never restores a rejected attempt. The
+                    # stored result keeps `is_goal_satisfied=False`, and the agent runs again on resume.
+                    if stop_if_goal_not_satisfied or retry == self.max_retry:
+                        await self._checkpoint(
+                            storage=storage,
+                            pipe_id=pipe_id,
+                            query_instruction=query_instruction,
+                            goal_result=_goal_result
+                        )
+
                     if stop_if_goal_not_satisfied:
                         raise StopSuperAgentX(
                             message="Goal not satisfied. Stopping execution.",
                             goal_result=_goal_result
                         )
 
+                    # A goal which is not satisfied is retried with fresh engine results
+                    engine_memo.clear()
+
                 except StopSuperAgentX:
                     raise
 
                 except Exception as e:
+                    if deadline_exceeded(deadline):
+                        logger.warning(f"Agent `{self.name}` deadline exceeded on retry {retry}")
+                        # A result of an earlier attempt is more complete than the engines finished in this one
+                        _goal_result = _goal_result or GoalResult(
+                            name=self.name,
+                            agent_id=self.agent_id,
+                            result=engine_results or None,
+                            content=engine_results or None,
+                            error='Deadline exceeded',
+                            verify_goal=False,
+                            is_goal_satisfied=False
+                        )
+                        if status_callback:
+                            await _maybe_await(status_callback(
+                                event="agent_deadline_exceeded",
+                                pipe_id=pipe_id,
+                                agent_id=self.agent_id,
+                                agent=self.name,
+                                retry=retry,
+                                goal_result=_goal_result,
+                                conversation_id=conversation_id
+                            ))
+                        break
+
+                    retryable = is_retryable(e)
                     logger.exception(f"Agent `{self.name}` failed on retry {retry}: {e}")
 
                     # Store ERROR only when NO human approval
@@ -589,9 +834,21 @@ class Agent:
                             agent=self.name,
                             retry=retry,
                             error=str(e),
+                            retryable=retryable,
                             conversation_id=conversation_id
                         ))
 
+                    if not retryable:
+                        logger.warning(f"Agent `{self.name}` stops retrying, `{type(e).__name__}` is not retryable")
+                        break
+                    if retry < self.max_retry:
+                        await sleep_before_retry(
+                            retry,
+                            base_delay=self.retry_delay,
+                            max_delay=self.max_retry_delay,
+                            deadline=deadline
+                        )
+
             return _goal_result
 
             # -----------------------------------
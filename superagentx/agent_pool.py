@@ -0,0 +1,81 @@
+import asyncio
+import logging
+from collections.abc import AsyncIterator
+from contextlib import asynccontextmanager
+
+from superagentx.agent import Agent
+from superagentx.result import GoalResult
+
+logger = logging.getLogger(__name__)
+
+
+class AgentPool:
+    """
+    Pool of warm clones of a configured agent, so one agent definition serves concurrent requests without sharing the
+    run state of its engines.
+
+    Each execution borrows an idle clone, or a new one while fewer than `max_size` clones exist, and returns it to the
+    pool afterwards. Clones share the LLM clients, prompt templates, handlers and tool schemas of the agent, see
+    `Agent.clone`.
+
+    Example:
+        pool = AgentPool(browser_agent, max_size=4)
+        goal_result = await pool.execute(query_instruction=query)
+    """
+
+    def __init__(
+            self,
+            agent: Agent,
+            *,
+            max_size: int = 8,
+            min_size: int = 0
+    ):
+        """
+        Args:
+            agent: The configured agent the pool clones. It is not executed by the pool itself.
+            max_size: Maximum number of clones, executions beyond it wait for a clone to be returned. Default `8`
+            min_size: Number of clones created upfront. Default `0`
+        """
+        if max_size < 1:
+            raise ValueError(f'max_size must be greater than 0, got {max_size}')
+        if not 0 <= min_size <= max_size:
+            raise ValueError(f'min_size must be between 0 and max_size, got {min_size}')
+        self.agent = agent
+        self.max_size = max_size
+        self._idle: list[Agent] = [agent.clone() for _ in range(min_size)]
+        self._size = min_size
+        self._semaphore = asyncio.Semaphore(max_size)
+
+    @property
+    def size(self) -> int:
+        """Number of clones created so far."""
+        return self._size
+
+    @property
+    def idle(self) -> int:
+        """Number of clones waiting for an execution."""
+        return len(self._idle)
+
+    @asynccontextmanager
+    async def acquire(self) -> AsyncIterator[Agent]:
+        """
+        Borrows a clone of the agent for the duration of the context.
+        """
+        async with self._semaphore:
+            if self._idle:
+                agent = self._idle.pop()
+            else:
+                agent = self.agent.clone()
+                self._size += 1
+                logger.debug(f'Agent pool of `{self.agent.name}` grew to {self._size} clone(s)')
+            try:
+                yield agent
+            finally:
+                self._idle.append(agent)
+
+    async def execute(self, **kwargs) -> GoalResult | None:
+        """
+        Executes a borrowed clone of the agent, with the arguments of `Agent.execute`.
+        """
+        async with self.acquire() as agent:
+            return await agent.execute(**kwargs)
@@ -1,18 +1,28 @@
 import asyncio
 import logging
+import math
 import uuid
+from collections.abc import AsyncIterable, AsyncIterator, Iterable
+from contextlib import asynccontextmanager, nullcontext
+from dataclasses import dataclass, field
 from typing import Literal, Any
 
 import yaml
+from pydantic import ValidationError
 
 from superagentx.agent import Agent
 from superagentx.config import is_verbose_enabled
+from superagentx.engine import Engine
+from superagentx.event_bus import EventBus, OverflowPolicy
 from superagentx.router.router_engine import RouterEngine
 from superagentx.constants import SEQUENCE, PARALLEL
 from superagentx.exceptions import StopSuperAgentX
+from superagentx.memory_writer import MemoryWriter
+from superagentx.parallel_group import CompletionPolicy, ParallelGroup
 from superagentx.result import GoalResult
-from superagentx.db_store import ConfigLoader
-from superagentx.utils.helper import iter_to_aiter, StatusCallback, _maybe_await
+from superagentx.result_cache import ResultCache, cache_key, fingerprint
+from superagentx.db_store import ConfigLoader, StorageAdapter
+from superagentx.utils.helper import iter_to_aiter, StatusCallback, deadline_after, deadline_exceeded
 from superagentx.utils.observability.trace_decorator import pipe_trace
 
 
@@ -20,6 +30,40 @@ is_verbose_enabled()
 
 logger = logging.getLogger(__name__)
 
+# Marks the end of a streamed flow
+_STREAM_END = object()
+
+# Rough token estimate of the rendered pre_result, avoids a tokenizer dependency
+_CHARS_PER_TOKEN = 4
+# Results which would be truncated below this size are left out instead
+_MIN_COMPACTED_TOKENS = 32
+
+
+def _estimate_tokens(text: str) -> int:
+    return math.ceil(len(text) / _CHARS_PER_TOKEN)
+
+
+@dataclass
+class PipeRun:
+    """
+    Execution context of a single flow of an `AgentXPipe`.
+
+    Holds everything that belongs to one run, its id, storage session and results, so one pipe instance can
+    execute many flows at the same time. `checkpoints` holds the results restored by a resumed run, keyed by
+    agent name. `deadline` is the event loop time by which the run has to finish. `rendered` caches the
+    results rendered as pre_result, keyed by result id. `memory_task` retrieves the memory of the run once, and
+    `memory_writer` writes the results of the run to the memory in the background.
+    """
+    run_id: str
+    storage: StorageAdapter | None = None
+    results: list[GoalResult] = field(default_factory=list)
+    result_queue: asyncio.Queue | None = None
+    checkpoints: dict[str, GoalResult] = field(default_factory=dict)
+    deadline: float | None = None
+    rendered: dict[int, str] = field(default_factory=dict)
+    memory_task: asyncio.Task | None = None
+    memory_writer: MemoryWriter | None = None
+
 
 class AgentXPipe:
 
@@ -34,6 +78,12 @@ class AgentXPipe:
             memory: Any | None = None,
             stop_if_goal_not_satisfied: bool = False,
             workflow_store: bool = False,
+            max_concurrency: int | None = None,
+            completion_policy: CompletionPolicy | None = None,
+            pre_result_token_budget: int | None = None,
+            result_cache: ResultCache | None = None,
+            status_queue_size: int = 1000,
+            status_overflow: str = OverflowPolicy.COALESCE,
     ):
         """
         Initializes a new instance of the class with specified parameters.
@@ -54,7 +104,8 @@ class AgentXPipe:
             description: An optional description that provides additional context or details about the agentxpipe's
                 purpose and capabilities.
             agents: A list of Agent instances (or lists of Agent instances) that are part of this structure.
-                These agents can perform tasks and contribute to achieving the defined goal.
+                These agents can perform tasks and contribute to achieving the defined goal. If any agent declares
+                `depends_on`, the agents are scheduled as a dependency graph instead of stage by stage.
             memory: An optional memory instance that allows the engine to retain information across interactions.
                 This can enhance the pipe's contextual awareness and improve its performance over time.
             workflow_store: A flag to indicate agentic workflow is required to persist states. This is useful, if a human
@@ -63,6 +114,24 @@ class AgentXPipe:
                 When set to True, the agentxpipe operation will halt if the defined goal is not met,
                 preventing any further actions. Defaults to False, allowing the process to continue regardless
                 of goal satisfaction.
+            max_concurrency: Maximum number of agents of this pipe executing at the same time, across parallel
+                stages and dependency graph branches. Defaults to `None`, running every ready agent at once.
+            completion_policy: Default completion policy of the parallel groups of this pipe, e.g.
+                `CompletionPolicy.first_satisfied()`. A `ParallelGroup` can set its own policy. Defaults to
+                `CompletionPolicy.all()`, waiting for every agent of the group.
+            pre_result_token_budget: Approximate maximum number of tokens of the previous agents' results passed to
+                the next agent. Older results are truncated or left out first. Defaults to `None`, passing every
+                result in full.
+            result_cache: An optional cache of the results of `flow`, e.g. `InMemoryResultCache(ttl=60)`. A repeated
+                query of the same conversation returns the cached results while the configuration of the pipe is
+                unchanged. Only runs whose agents all succeeded are cached, and a failing cache is logged and
+                bypassed. A cached answer sends only the `pipe_flow_start` and `pipe_flow_end` status events, with
+                `cached=True`. Defaults to `None`
+            status_queue_size: Maximum number of status events queued for the `status_callback` of a run. Agents
+                publish their status events without waiting for the callback, which receives them in order from a
+                background task. Default `1000`
+            status_overflow: What a full status queue does with a new event, `drop_oldest`, `drop_newest` or
+                `coalesce`, replacing a queued event of the same name and agent. Default `coalesce`
         """
         self.pipe_id = pipe_id or uuid.uuid4().hex
         self.name = name or f'{self.__str__()}-{self.pipe_id}'
@@ -73,8 +142,20 @@ class AgentXPipe:
         if self.memory:
             self.memory_id = uuid.uuid4().hex
         self.workflow_store = workflow_store
-        self.storage = None
         self.stop_if_goal_not_satisfied = stop_if_goal_not_satisfied
+        self.max_concurrency = max_concurrency
+        self._agent_semaphore = asyncio.Semaphore(max_concurrency) if max_concurrency else None
+        self.completion_policy = completion_policy or CompletionPolicy.all()
+        self.pre_result_token_budget = pre_result_token_budget
+        self.result_cache = result_cache
+        if status_overflow not in OverflowPolicy.ALL:
+            raise ValueError(f'Unknown status overflow policy `{status_overflow}`')
+        self.status_queue_size = status_queue_size
+        self.status_overflow = status_overflow
+        self._active_runs = 0
+        self._runs_started = 0
+        self._storage: StorageAdapter | None = None
+        self._storage_lock = asyncio.Lock()
         logger.debug(
             f'Initiating AgentXPipe...\n'
             f'Id : {self.pipe_id}\n'
@@ -94,7 +175,8 @@ class AgentXPipe:
     async def add(
             self,
             *agents: Agent,
-            execute_type: Literal['SEQUENCE', 'PARALLEL'] = 'SEQUENCE'
+            execute_type: Literal['SEQUENCE', 'PARALLEL'] = 'SEQUENCE',
+            completion_policy: CompletionPolicy | None = None
     ) -> None:
         """
         Adds one or more Agent instances to the current context for processing.
@@ -115,6 +197,8 @@ class AgentXPipe:
                 - 'PARALLEL': All agents are executed concurrently, allowing for
                   simultaneous processing.
                 Default is 'SEQUENCE'.
+            completion_policy: Completion policy of the agents added as 'PARALLEL'. Once the policy is met, the
+                agents which are still running are cancelled. Defaults to the completion policy of the pipe.
 
         Returns:
             None
@@ -123,23 +207,67 @@ class AgentXPipe:
             self.agents += agents
             logger.debug(f'Agent(s) added as {SEQUENCE} : {",".join([str(_agent) for _agent in agents])}')
         else:
-            self.agents.append(list(agents))
+            self.agents.append(ParallelGroup(agents, completion_policy=completion_policy))
             logger.debug(f'Agents added as {PARALLEL} : {",".join([str(_agent) for _agent in agents])}')
 
     @staticmethod
+    def _render_result(result: GoalResult) -> str:
+        return (f'Reason: {result.reason}\n'
+                f'Result: \n{yaml.dump(result.result)}\n'
+                f'Content: \n{result.content}'
+                f'Is Goal Satisfied: {result.is_goal_satisfied}\n\n')
+
     async def _pre_result(
-            results: list[GoalResult] | None = None
+            self,
+            results: list[GoalResult] | None = None,
+            *,
+            run: PipeRun | None = None
     ) -> list[str]:
+        """
+        Renders the results of the previous agents as context of the next agent.
+
+        Every result is rendered only once per run. With a `pre_result_token_budget`, the newest results are kept
+        in full and older results are truncated or left out, so the context stays within the budget.
+        """
         if not results:
             return []
-        return [
-            (f'Reason: {result.reason}\n'
-             f'Result: \n{yaml.dump(result.result)}\n'
-             f'Content: \n{result.content}'
-             f'Is Goal Satisfied: {result.is_goal_satisfied}\n\n')
-
-            async for result in iter_to_aiter(results)
-        ]
+        rendered = []
+        async for result in iter_to_aiter(results):
+            if run is None:
+                rendered.append(self._render_result(result))
+                continue
+            key = id(result)
+            if key not in run.rendered:
+                run.rendered[key] = self._render_result(result)
+            rendered.append(run.rendered[key])
+        return self._fit_token_budget(rendered)
+
+    def _fit_token_budget(
+            self,
+            rendered: list[str]
+    ) -> list[str]:
+        budget = self.pre_result_token_budget
+        if not budget or sum(map(_estimate_tokens, rendered)) <= budget:
+            return rendered
+
+        fitted: list[str] = []
+        remaining = budget
+        omitted = 0
+        # Newest results are the most relevant for the next agent
+        for text in reversed(rendered):
+            tokens = _estimate_tokens(text)
+            if tokens <= remaining:
+                fitted.append(text)
+                remaining -= tokens
+            elif remaining >= _MIN_COMPACTED_TOKENS:
+                fitted.append(f'{text[:remaining * _CHARS_PER_TOKEN]}...(truncated)\n\n')
+                remaining = 0
+            else:
+                omitted += 1
+        if omitted:
+            fitted.append(f'{omitted} earlier result(s) omitted to fit the context budget.\n\n')
+        fitted.reverse()
+        return fitted
 
     async def add_memory(
             self,
@@ -165,14 +293,22 @@ class AgentXPipe:
         """
         logger.debug(f'Add prompt instruction to the memory : {prompt_instruction}')
         async for prompt in iter_to_aiter(prompt_instruction):
-            await self.memory.add(
-                memory_id=self.memory_id,
-                conversation_id=conversation_id,
-                message_id=uuid.uuid4().hex,
-                role=prompt.get("role"),
-                data=prompt.get("content"),
-                reason=prompt.get("reason")
-            )
+            await self.memory.add(**self._memory_item(prompt, conversation_id=conversation_id))
+
+    def _memory_item(
+            self,
+            prompt: dict,
+            *,
+            conversation_id: str | None
+    ) -> dict:
+        return dict(
+            memory_id=self.memory_id,
+            conversation_id=conversation_id,
+            message_id=uuid.uuid4().hex,
+            role=prompt.get("role"),
+            data=prompt.get("content"),
+            reason=prompt.get("reason")
+        )
 
     async def retrieve_memory(
             self,
@@ -207,47 +343,435 @@ class AgentXPipe:
             conversation_id=conversation_id
         )
 
+    def _start_memory(
+            self,
+            run: PipeRun,
+            *,
+            query_instruction: str,
+            conversation_id: str | None
+    ) -> None:
+        """
+        Starts retrieving the memory of the run, so the retrieval overlaps the setup of the run, and opens the
+        background writer of the run.
+        """
+        if not self.memory:
+            return
+        run.memory_task = asyncio.create_task(
+            self.retrieve_memory(
+                query_instruction,
+                conversation_id=conversation_id
+            )
+        )
+        run.memory_writer = MemoryWriter(self.memory)
+
+    @staticmethod
+    async def _old_memory(run: PipeRun) -> list[dict] | None:
+        # Every stage reuses the memory retrieved once for the run
+        if run.memory_task is None:
+            return None
+        try:
+            return await run.memory_task
+        except asyncio.CancelledError:
+            raise
+        except Exception as ex:
+            logger.warning(f'Failed to retrieve memory of pipe {run.run_id}: {ex}')
+            run.memory_task = None
+            return None
+
+    @staticmethod
+    async def _stop_memory(run: PipeRun) -> None:
+        if run.memory_task and not run.memory_task.done():
+            run.memory_task.cancel()
+            await asyncio.gather(run.memory_task, return_exceptions=True)
+        if run.memory_writer:
+            await run.memory_writer.close()
+
+    def _iter_agents(self) -> list[Agent]:
+        agents: list[Agent] = []
+        for _agents in self.agents:
+            if isinstance(_agents, list):
+                agents.extend(_agents)
+            else:
+                agents.append(_agents)
+        return agents
+
+    def _is_dependency_graph(self) -> bool:
+        return any(agent.depends_on is not None for agent in self._iter_agents())
+
+    def _build_dependency_graph(self) -> dict[Agent, list[Agent]]:
+        """
+        Resolves the upstream agents of every agent in the pipe.
+
+        Agents without an explicit `depends_on` keep the implicit dependency on the previous stage, so a plain stage
+        list resolves to the same ordering as the staged execution.
+
+        Returns:
+            dict[Agent, list[Agent]]
+                Upstream agents keyed by agent, in topological order.
+
+        Raises:
+            ValueError: If an agent depends on an agent which is not part of the pipe or the dependencies
+                contain a cycle.
+        """
+        graph: dict[Agent, list[Agent]] = {}
+        previous_stage: list[Agent] = []
+        for _agents in self.agents:
+            stage = list(_agents) if isinstance(_agents, list) else [_agents]
+            for agent in stage:
+                upstream = agent.depends_on if agent.depends_on is not None else previous_stage
+                graph[agent] = list(dict.fromkeys(upstream))
+            previous_stage = stage
+
+        downstream: dict[Agent, list[Agent]] = {agent: [] for agent in graph}
+        for agent, upstream in graph.items():
+            unknown = [str(dep.name) for dep in upstream if dep not in graph]
+            if unknown:
+                raise ValueError(
+                    f'Agent `{agent.name}` depends on agent(s) not in the pipe: {", ".join(unknown)}'
+                )
+            for dep in upstream:
+                downstream[dep].append(agent)
+
+        in_degree = {agent: len(upstream) for agent, upstream in graph.items()}
+        ready = [agent for agent, degree in in_degree.items() if degree == 0]
+        ordered: list[Agent] = []
+        while ready:
+            agent = ready.pop(0)
+            ordered.append(agent)
+            for child in downstream[agent]:
+                in_degree[child] -= 1
+                if in_degree[child] == 0:
+                    ready.append(child)
+
+        if len(ordered) != len(graph):
+            cyclic = [str(agent.name) for agent in graph if agent not in ordered]
+            raise ValueError(f'Agent dependencies contain a cycle: {", ".join(cyclic)}')
+        return {agent: graph[agent] for agent in ordered}
+
+    async def _execute_agent(
+            self,
+            agent: Agent,
+            *,
+            run: PipeRun,
+            query_instruction: str,
+            pre_result: list[str],
+            previous_agent_result: Any,
+            old_memory: list[dict] | None,
+            verify_goal: bool,
+            conversation_id: str | None,
+            status_callback: StatusCallback | None
+    ) -> GoalResult | None:
+        res = run.checkpoints.get(agent.name)
+        if res:
+            logger.info(f'Agent {agent.name} restored from checkpoint of pipe {run.run_id}')
+        else:
+            try:
+                async with self._agent_semaphore or nullcontext():
+                    res = await agent.execute(
+                        query_instruction=query_instruction,
+                        pipe_id=run.run_id,
+                        pre_result=pre_result,
+                        previous_agent_result=previous_agent_result,
+                        old_memory=old_memory,
+                        verify_goal=verify_goal,
+                        stop_if_goal_not_satisfied=self.stop_if_goal_not_satisfied,
+                        conversation_id=conversation_id,
+                        storage=run.storage,
+                        status_callback=status_callback,
+                        deadline=run.deadline
+                    )
+            except StopSuperAgentX as ex:
+                if run.result_queue is not None and ex.goal_result:
+                    run.result_queue.put_nowait(ex.goal_result)
+                raise
+        # Streamed as soon as the agent completes, before the rest of its stage finishes
+        if run.result_queue is not None and res:
+            run.result_queue.put_nowait(res)
+        return res
+
+    async def _execute_group(
+            self,
+            agents: list[Agent],
+            *,
+            completion_policy: CompletionPolicy,
+            **kwargs
+    ) -> list[tuple[Agent, GoalResult | BaseException | None]]:
+        """
+        Executes a parallel group of agents until its completion policy is met, and cancels the agents which are
+        still running at that point.
+
+        Returns:
+            list[tuple[Agent, GoalResult | BaseException | None]]
+                The agents with their result or failure. In agent order when waiting for every agent, otherwise in
+                completion order.
+        """
+        if completion_policy.mode == CompletionPolicy.ALL:
+            results = await asyncio.gather(
+                *[self._execute_agent(agent, **kwargs) for agent in agents],
+                return_exceptions=True  #prevents crash
+            )
+            return list(zip(agents, results))
+
+        tasks = {
+            asyncio.create_task(self._execute_agent(agent, **kwargs)): agent
+            for agent in agents
+        }
+        completed: list[tuple[Agent, GoalResult | BaseException | None]] = []
+        pending = set(tasks)
+        try:
+            while pending and not completion_policy.is_met(
+                    [res for _, res in completed if isinstance(res, GoalResult)]
+            ):
+                done, pending = await asyncio.wait(pending, return_when=asyncio.FIRST_COMPLETED)
+                for task in done:
+                    if task.cancelled():
+                        # Cancelled from within the agent, recorded as its failure
+                        res = asyncio.CancelledError(f'Agent {tasks[task].name} was cancelled')
+                    elif task.exception() is not None:
+                        res = task.exception()
+                    else:
+                        res = task.result()
+                    completed.append((tasks[task], res))
+                    if completion_policy.is_met([res for _, res in completed if isinstance(res, GoalResult)]):
+                        break
+        finally:
+            if pending:
+                logger.debug(
+                    f'Completion policy {completion_policy} met, cancelling agents: '
+                    f'{",".join([str(tasks[task].name) for task in pending])}'
+                )
+            for task in pending:
+                task.cancel()
+            if pending:
+                await asyncio.gather(*pending, return_exceptions=True)
+        return completed
+
+    @staticmethod
+    async def _load_checkpoints(run: PipeRun) -> dict[str, GoalResult]:
+        checkpoints: dict[str, GoalResult] = {}
+        completed = await run.storage.get_completed_agents(pipe_id=run.run_id)
+        for agent_name, result_data in completed.items():
+            try:
+                goal_result = GoalResult.model_validate(result_data)
+            except ValidationError as ex:
+                logger.warning(f"Checkpoint of agent {agent_name} can't be restored, agent runs again: {ex}")
+                continue
+            # The final attempt of an agent whose goal was rejected is recorded too, it runs again
+            if goal_result.is_goal_satisfied is False:
+                logger.debug(f"Checkpoint of agent {agent_name} did not satisfy its goal, agent runs again")
+                continue
+            checkpoints[agent_name] = goal_result
+        logger.debug(f'Restored checkpoints of pipe {run.run_id}: {",".join(checkpoints)}')
+        return checkpoints
+
+    async def _record_result(
+            self,
+            res: GoalResult,
+            *,
+            run: PipeRun,
+            conversation_id: str | None
+    ) -> None:
+        run.results.append(res)
+        if (
+                self.memory
+                and getattr(res, "result", None)
+                and getattr(res, "reason", None)
+        ):
+            assistant = {
+                "role": "assistant",
+                "content": f"{yaml.dump(res.result)}",
+                "reason": res.reason
+            }
+            if run.memory_writer:
+                run.memory_writer.add(**self._memory_item(assistant, conversation_id=conversation_id))
+            else:
+                await self.add_memory(
+                    [assistant],
+                    conversation_id=conversation_id
+                )
+
+    async def _flow_graph(
+            self,
+            *,
+            run: PipeRun,
+            query_instruction: str,
+            verify_goal: bool,
+            conversation_id: str | None,
+            status_callback: StatusCallback | None
+    ) -> bool:
+        """
+        Executes the agents as a dependency graph. Every agent starts as soon as all of its upstream agents
+        have finished, so independent branches never wait for each other.
+
+        Returns:
+            bool
+                `True` if the execution was stopped by `StopSuperAgentX`, otherwise `False`.
+        """
+        graph = self._build_dependency_graph()
+        if self.router:
+            logger.warning('Router is not applied when agents are scheduled by their dependencies')
+        if self.completion_policy.mode != CompletionPolicy.ALL or any(
+                getattr(_agents, 'completion_policy', None) for _agents in self.agents
+        ):
+            logger.warning('Completion policies are not applied when agents are scheduled by their dependencies')
+
+        ancestors: dict[Agent, set[Agent]] = {}
+        for agent, upstream in graph.items():
+            ancestors[agent] = set(upstream).union(*(ancestors[dep] for dep in upstream))
+
+        finished: dict[Agent, GoalResult | None] = {}
+        tasks: dict[Agent, asyncio.Task] = {}
+
+        async def _run(agent: Agent) -> GoalResult | None:
+            upstream = graph[agent]
+            if upstream:
+                await asyncio.wait([tasks[dep] for dep in upstream])
+
+            pre_result = await self._pre_result(
+                run=run,
+                results=[
+                    finished[_agent] for _agent in graph
+                    if _agent in ancestors[agent] and finished.get(_agent)
+                ]
+            )
+            upstream_results = [
+                finished[dep].result for dep in upstream
+                if finished.get(dep) and getattr(finished[dep], "result", None)
+            ]
+            previous_agent_result = None
+            if len(upstream_results) == 1:
+                previous_agent_result = upstream_results[0]
+            elif upstream_results:
+                previous_agent_result = tuple(upstream_results)
+
+            old_memory = await self._old_memory(run)
+
+            if deadline_exceeded(run.deadline):
+                logger.warning(f'Pipe deadline exceeded, agent {agent.name} is skipped')
+                finished[agent] = None
+                return None
+
+            logger.debug(f'Executing Agent: {agent}')
+            try:
+                res = await self._execute_agent(
+                    agent,
+                    run=run,
+                    query_instruction=query_instruction,
+                    pre_result=pre_result,
+                    previous_agent_result=previous_agent_result,
+                    old_memory=old_memory,
+                    verify_goal=verify_goal,
+                    conversation_id=conversation_id,
+                    status_callback=status_callback
+                )
+            except StopSuperAgentX:
+                raise
+            except Exception as ex:
+                # Do NOT crash the pipe, downstream agents still run with the available results
+                logger.error(
+                    f"Agent {agent.name} failed: {ex}",
+                    exc_info=True
+                )
+                res = None
+            finished[agent] = res
+            return res
+
+        # Tasks are created in topological order, so every upstream task exists before it is awaited
+        for _agent in graph:
+            tasks[_agent] = asyncio.create_task(_run(_agent))
+
+        pending = set(tasks.values())
+        try:
+            while pending:
+                done, pending = await asyncio.wait(pending, return_when=asyncio.FIRST_COMPLETED)
+                # Every finished agent is recorded before a stop is applied, so no finished result is lost
+                stop = None
+                for task in done:
+                    try:
+                        res = task.result()
+                    except StopSuperAgentX as ex:
+                        stop = stop or ex
+                        continue
+                    if res:
+                        await self._record_result(
+                            res,
+                            run=run,
+                            conversation_id=conversation_id
+                        )
+                if stop:
+                    raise stop
+        except StopSuperAgentX as ex:
+            logger.warning(ex)
+            if ex.goal_result:
+                run.results.append(ex.goal_result)
+            return True
+        finally:
+            for task in pending:
+                task.cancel()
+            if pending:
+                await asyncio.gather(*pending, return_exceptions=True)
+        return deadline_exceeded(run.deadline)
+
     async def _flow(
             self,
+            run: PipeRun,
             query_instruction: str,
             verify_goal: bool = True,
             conversation_id: str | None = None,
             status_callback: StatusCallback | None = None
     ):
         trigger_break = False
-        results: list[GoalResult] = []
         previous_agent_result: str | None = None,
-        old_memory = None
+        storage = run.storage
+
+        self._start_memory(
+            run,
+            query_instruction=query_instruction,
+            conversation_id=conversation_id
+        )
 
         # ----------------------------
         # Setup Storage (once)
         # ----------------------------
-        if self.workflow_store:
-            self.storage = await ConfigLoader.load_db_config()
-            await self.storage.setup()
-
-            await self.storage.create_pipe(
-                pipe_id=self.pipe_id,
-                conversation_id=conversation_id,
-                input_query=query_instruction,
-                executed_by="Agent_System"
-            )
-
-            await self.storage.update_pipe_status(
-                pipe_id=self.pipe_id,
-                status="In-Progress"
-            )
+        if self.workflow_store and storage:
+            try:
+                await storage.create_pipe(
+                    pipe_id=run.run_id,
+                    conversation_id=conversation_id,
+                    input_query=query_instruction,
+                    executed_by="Agent_System"
+                )
+
+                await storage.update_pipe_status(
+                    pipe_id=run.run_id,
+                    status="In-Progress"
+                )
+            except BaseException:
+                await self._stop_memory(run)
+                raise
 
         try:
+            # ==========================
+            # DEPENDENCY GRAPH EXECUTION
+            # ==========================
+            if self._is_dependency_graph():
+                trigger_break = await self._flow_graph(
+                    run=run,
+                    query_instruction=query_instruction,
+                    verify_goal=verify_goal,
+                    conversation_id=conversation_id,
+                    status_callback=status_callback
+                )
+                return run.results
+
             async for _agents in iter_to_aiter(self.agents):
 
-                pre_result = await self._pre_result(results=results)
+                if deadline_exceeded(run.deadline):
+                    logger.warning(f'Pipe deadline exceeded, remaining agents of pipe {run.run_id} are skipped')
+                    trigger_break = True
+                    break
 
-                if self.memory:
-                    old_memory = await self.retrieve_memory(
-                        query_instruction,
-                        conversation_id=conversation_id
-                    )
+                pre_result = await self._pre_result(run.results, run=run)
 
                 # ----------------------------
                 # EXECUTION BLOCK
@@ -292,28 +816,31 @@ class AgentXPipe:
                             f'{",".join([str(a) for a in agents_list])}'
                         )
 
-                        parallel_results = await asyncio.gather(
-                            *[
-                                agent.execute(
-                                    query_instruction=query_instruction,
-                                    pipe_id=self.pipe_id,
-                                    pre_result=pre_result,
-                                    previous_agent_result=previous_agent_result,
-                                    old_memory=old_memory,
-                                    verify_goal=verify_goal,
-                                    stop_if_goal_not_satisfied=self.stop_if_goal_not_satisfied,
-                                    conversation_id=conversation_id,
-                                    storage=self.storage,
-                                    status_callback=status_callback
-                                )
-                                for agent in agents_list
-                            ],
-                            return_exceptions=True  #prevents crash
+                        old_memory = await self._old_memory(run)
+                        parallel_results = await self._execute_group(
+                            agents_list,
+                            completion_policy=getattr(_agents, 'completion_policy', None) or self.completion_policy,
+                            run=run,
+                            query_instruction=query_instruction,
+                            pre_result=pre_result,
+                            previous_agent_result=previous_agent_result,
+                            old_memory=old_memory,
+                            verify_goal=verify_goal,
+                            conversation_id=conversation_id,
+                            status_callback=status_callback
                         )
                         # Normalize and handle failures individually
-                        for agent, res in zip(agents_list, parallel_results):
+                        for agent, res in parallel_results:
+
+                            if isinstance(res, StopSuperAgentX):
+                                # Stops the pipe like a sequential agent, the finished results of the group are kept
+                                trigger_break = True
+                                logger.warning(res)
+                                if res.goal_result:
+                                    run.results.append(res.goal_result)
+                                continue
 
-                            if isinstance(res, Exception):
+                            if isinstance(res, BaseException):
                                 logger.error(
                                     f"Agent {agent.name} failed: {res}",
                                     exc_info=True
@@ -323,25 +850,14 @@ class AgentXPipe:
                             if not res:
                                 continue
 
-                            results.append(res)
                             if getattr(res, "result", None):
                                 previous_agent_result += (res.result,)
 
-                            # Memory write
-                            if (
-                                    self.memory
-                                    and getattr(res, "result", None)
-                                    and getattr(res, "reason", None)
-                            ):
-                                assistant = {
-                                    "role": "assistant",
-                                    "content": f"{yaml.dump(res.result)}",
-                                    "reason": res.reason
-                                }
-                                await self.add_memory(
-                                    [assistant],
-                                    conversation_id=conversation_id
-                                )
+                            await self._record_result(
+                                res,
+                                run=run,
+                                conversation_id=conversation_id
+                            )
 
                     # ==========================
                     # SEQUENTIAL EXECUTION
@@ -352,45 +868,34 @@ class AgentXPipe:
 
                         logger.debug(f'Executing Agent: {agent}')
 
-                        res = await agent.execute(
+                        old_memory = await self._old_memory(run)
+                        res = await self._execute_agent(
+                            agent,
+                            run=run,
                             query_instruction=query_instruction,
-                            pipe_id=self.pipe_id,
                             pre_result=pre_result,
                             previous_agent_result=previous_agent_result,
                             old_memory=old_memory,
                             verify_goal=verify_goal,
-                            stop_if_goal_not_satisfied=self.stop_if_goal_not_satisfied,
                             conversation_id=conversation_id,
-                            storage=self.storage,
                             status_callback=status_callback
                         )
                         if res:
-                            results.append(res)
-
                             if getattr(res, "result", None):
                                 previous_agent_result = res.result
 
-                            if (
-                                    self.memory
-                                    and getattr(res, "result", None)
-                                    and getattr(res, "reason", None)
-                            ):
-                                assistant = {
-                                    "role": "assistant",
-                                    "content": f"{yaml.dump(res.result)}",
-                                    "reason": res.reason
-                                }
-                                await self.add_memory(
-                                    [assistant],
-                                    conversation_id=conversation_id
-                                )
+                            await self._record_result(
+                                res,
+                                run=run,
+                                conversation_id=conversation_id
+                            )
 
                 except StopSuperAgentX as ex:
                     trigger_break = True
                     logger.warning(ex)
 
                     if ex.goal_result:
-                        results.append(ex.goal_result)
+                        run.results.append(ex.goal_result)
 
                     break  # intentional stop
 
@@ -405,30 +910,72 @@ class AgentXPipe:
                 if trigger_break:
                     break
 
-            return results
+            return run.results
 
         finally:
-            # ----------------------------
-            # Close Storage Safely
-            # ----------------------------
-            if self.workflow_store and self.storage:
+            # The results of the run are in the memory before the flow returns
+            await self._stop_memory(run)
+            if self.workflow_store and storage:
                 try:
-                    await self.storage.update_pipe_status(
-                        self.pipe_id,
+                    await storage.update_pipe_status(
+                        run.run_id,
                         "Completed" if not trigger_break else "Failed"
                     )
-                    await self.storage.close()
+                except Exception as e:
+                    logger.warning(f"Failed to update pipe status: {e}")
+
+    @asynccontextmanager
+    async def _start_run(
+            self,
+            *,
+            run_id: str | None = None,
+            result_queue: asyncio.Queue | None = None,
+            timeout: float | None = None
+    ) -> AsyncIterator[PipeRun]:
+        """
+        Opens the execution context of a single flow.
+
+        The first run of the pipe is identified by the `pipe_id` of the pipe, every later or concurrent run gets a
+        generated run id, as the stored pipe, trace and spans are keyed by it. A run passes its own `run_id` when the
+        caller chose one, and a resumed run the `run_id` of the run it resumes.
+
+        Concurrent runs share the storage of the pipe, which is opened by the first active run and closed when the
+        last active run ends, so no run closes the storage while another one still uses it.
+        """
+        async with self._storage_lock:
+            if self.workflow_store and self._storage is None:
+                self._storage = await self._open_storage()
+            if not run_id:
+                run_id = uuid.uuid4().hex if self._runs_started else self.pipe_id
+            self._runs_started += 1
+            self._active_runs += 1
+        try:
+            yield PipeRun(
+                run_id=run_id,
+                storage=self._storage,
+                result_queue=result_queue,
+                deadline=deadline_after(timeout)
+            )
+        finally:
+            self._active_runs -= 1
+            if not self._active_runs and self._storage:
+                # Detached before closing, so a run starting meanwhile opens a fresh storage
+                storage, self._storage = self._storage, None
+                try:
+                    await storage.close()
                     logger.info(f"DB connection closed for pipe {self.pipe_id}")
                 except Exception as e:
                     logger.warning(f"Failed to close DB connection: {e}")
 
-    @pipe_trace
     async def flow(
             self,
             query_instruction: str | None = None,
             verify_goal: bool = True,
             conversation_id: str | None = None,
-            status_callback: StatusCallback | None = None
+            status_callback: StatusCallback | None = None,
+            resume_pipe_id: str | None = None,
+            timeout: float | None = None,
+            run_id: str | None = None
     ) -> list[GoalResult]:
         """
         Processes the specified query instruction and executes a flow of operations.
@@ -439,12 +986,23 @@ class AgentXPipe:
         The method returns a list of GoalResult instances that indicate the outcomes of
         the executed operations.
 
+        Every call runs in its own execution context, so one pipe instance can serve many simultaneous flows.
+
         query_instruction: A string representing the instruction or query that defines the goal to be achieved.
                 This should be a clear and actionable statement that the method can execute.
             verify_goal: Option to enable or disable goal verification after agent execution. Default `True`
             conversation_id: A string representing the unique identifier of the conversation. Default `None`
              status_callback: status call back method helps enhance user experience to get live updates of
                 agents executions. Default `None`
+            resume_pipe_id: Run id of an earlier run of this pipe to resume. The agents which completed in that run
+                are restored from the workflow store instead of being executed again, matched by agent name.
+                Requires `workflow_store`. Default `None`
+            timeout: Maximum wall time of the flow in seconds. The deadline is propagated to the agents, engines and
+                LLM calls. Once it passes, in-flight agents return partial results, the remaining agents are skipped
+                and the results gathered so far are returned. Default `None`
+            run_id: Run id of this run, which a later flow passes as `resume_pipe_id` to resume it. It has to be
+                unique among the runs of the pipe. Defaults to the `pipe_id` for the first run of the pipe and to a
+                generated id for every later run.
 
         Returns:
             list[GoalResult]
@@ -452,43 +1010,344 @@ class AgentXPipe:
                 the query instruction. Each GoalResult provides details about the success or failure of the
                 corresponding operation and may include additional context or data.
         """
+        if resume_pipe_id and not self.workflow_store:
+            raise ValueError('resume_pipe_id requires the pipe to be created with workflow_store=True')
+        if resume_pipe_id and run_id and resume_pipe_id != run_id:
+            raise ValueError('run_id and resume_pipe_id differ, a resumed run keeps the run id of the run it resumes')
+
+        key = None
+        if self.result_cache and not resume_pipe_id:
+            key = self._result_cache_key(
+                query_instruction=query_instruction,
+                verify_goal=verify_goal,
+                conversation_id=conversation_id
+            )
+            try:
+                cached = await self.result_cache.get(key)
+            except Exception as ex:
+                # A failing cache never fails the flow, the pipe runs as if it had no cache
+                logger.warning(f"Result cache lookup failed for pipe {self.name}: {ex}")
+                cached = None
+            if cached is not None:
+                logger.info(f"Pipe {self.name} returns cached results")
+                if status_callback:
+                    await self._publish_cached_flow(
+                        query_instruction=query_instruction,
+                        conversation_id=conversation_id,
+                        status_callback=status_callback,
+                        results=cached
+                    )
+                return cached
+
         logger.info(f"Pipe {self.name} starting...")
-        if status_callback:
-            await _maybe_await(status_callback(
+        async with self._start_run(run_id=resume_pipe_id or run_id, timeout=timeout) as run:
+            if resume_pipe_id:
+                run.checkpoints = await self._load_checkpoints(run)
+            results = await self._run_query(
+                run=run,
+                query_instruction=query_instruction,
+                verify_goal=verify_goal,
+                conversation_id=conversation_id,
+                status_callback=status_callback
+            )
+        if key and self._is_cacheable(results):
+            try:
+                await self.result_cache.set(key, results)
+            except Exception as ex:
+                logger.warning(f"Failed to cache the results of pipe {self.name}: {ex}")
+        return results
+
+    async def _publish_cached_flow(
+            self,
+            *,
+            query_instruction: str | None,
+            conversation_id: str | None,
+            status_callback: StatusCallback,
+            results: list[GoalResult]
+    ) -> None:
+        # A cached answer runs no agents, so only the flow events are sent, marked as cached
+        status_bus = EventBus()
+        status_bus.subscribe(status_callback, max_queue_size=self.status_queue_size, overflow=self.status_overflow)
+        try:
+            status_bus.publish(
                 event="pipe_flow_start",
                 pipe_id=self.pipe_id,
                 query=query_instruction,
-                conversation_id=conversation_id
-            ))
+                conversation_id=conversation_id,
+                cached=True
+            )
+            status_bus.publish(
+                event="pipe_flow_end",
+                pipe_id=self.pipe_id,
+                query=query_instruction,
+                conversation_id=conversation_id,
+                result=results,
+                cached=True
+            )
+        finally:
+            await status_bus.close()
 
-        goal_result: list[GoalResult] = await self._flow(
-            query_instruction=query_instruction,
+    def _result_cache_key(
+            self,
+            *,
+            query_instruction: str | None,
+            verify_goal: bool,
+            conversation_id: str | None
+    ) -> str:
+        # Agents can be added at any time, so the fingerprint is taken per query
+        pipe_fingerprint = fingerprint(
+            self.agents,
             verify_goal=verify_goal,
+            router=type(self.router).__name__ if self.router else None,
+            stop_if_goal_not_satisfied=self.stop_if_goal_not_satisfied,
+            completion_policy=repr(self.completion_policy),
+            group_policies=[repr(getattr(_agents, 'completion_policy', None)) for _agents in self.agents],
+            pre_result_token_budget=self.pre_result_token_budget
+        )
+        return cache_key(
+            query_instruction=query_instruction,
             conversation_id=conversation_id,
-            status_callback=status_callback
+            pipe_fingerprint=pipe_fingerprint
+        )
+
+    @staticmethod
+    def _is_cacheable(results: list[GoalResult]) -> bool:
+        return bool(results) and all(
+            not result.error and result.is_goal_satisfied is not False
+            for result in results
         )
 
-        if status_callback:
-            await _maybe_await(status_callback(
+    async def flow_stream(
+            self,
+            query_instruction: str | None = None,
+            verify_goal: bool = True,
+            conversation_id: str | None = None,
+            status_callback: StatusCallback | None = None,
+            timeout: float | None = None,
+            run_id: str | None = None
+    ) -> AsyncIterator[GoalResult]:
+        """
+        Processes the specified query instruction like `flow`, but yields every GoalResult as soon as its agent
+        completes instead of returning them all at the end.
+
+        Results of a parallel stage are yielded in completion order, so callers can show partial answers while
+        slower agents are still running. The yielded results are the same results `flow` would return.
+
+        Args:
+            query_instruction: A string representing the instruction or query that defines the goal to be achieved.
+            verify_goal: Option to enable or disable goal verification after agent execution. Default `True`
+            conversation_id: A string representing the unique identifier of the conversation. Default `None`
+            status_callback: status call back method helps enhance user experience to get live updates of
+                agents executions. Default `None`
+            timeout: Maximum wall time of the flow in seconds, see `flow`. Default `None`
+            run_id: Run id of this run, see `flow`. Default `None`
+
+        Yields:
+            GoalResult
+                The result of each agent, as soon as the agent completes.
+
+        Example:
+            async for goal_result in pipe.flow_stream(query_instruction=query):
+                ...
+        """
+        logger.info(f"Pipe {self.name} starting stream...")
+        result_queue: asyncio.Queue = asyncio.Queue()
+
+        async def _produce() -> list[GoalResult]:
+            try:
+                async with self._start_run(run_id=run_id, result_queue=result_queue, timeout=timeout) as run:
+                    return await self._run_query(
+                        run=run,
+                        query_instruction=query_instruction,
+                        verify_goal=verify_goal,
+                        conversation_id=conversation_id,
+                        status_callback=status_callback
+                    )
+            finally:
+                result_queue.put_nowait(_STREAM_END)
+
+        producer = asyncio.create_task(_produce())
+        try:
+            while True:
+                goal_result = await result_queue.get()
+                if goal_result is _STREAM_END:
+                    break
+                yield goal_result
+            # Surface failures of the flow itself
+            await producer
+        finally:
+            if not producer.done():
+                producer.cancel()
+                await asyncio.gather(producer, return_exceptions=True)
+
+    @pipe_trace
+    async def _run_query(
+            self,
+            *,
+            run: PipeRun,
+            query_instruction: str,
+            verify_goal: bool,
+            conversation_id: str | None,
+            status_callback: StatusCallback | None
+    ) -> list[GoalResult]:
+        if not status_callback:
+            return await self._flow(
+                run=run,
+                query_instruction=query_instruction,
+                verify_goal=verify_goal,
+                conversation_id=conversation_id,
+                status_callback=None
+            )
+
+        # Agents publish their status events to the bus without waiting for the callback
+        status_bus = EventBus()
+        status_bus.subscribe(
+            status_callback,
+            max_queue_size=self.status_queue_size,
+            overflow=self.status_overflow
+        )
+        try:
+            status_bus.publish(
+                event="pipe_flow_start",
+                pipe_id=run.run_id,
+                query=query_instruction,
+                conversation_id=conversation_id
+            )
+            goal_result: list[GoalResult] = await self._flow(
+                run=run,
+                query_instruction=query_instruction,
+                verify_goal=verify_goal,
+                conversation_id=conversation_id,
+                status_callback=status_bus.publish
+            )
+            status_bus.publish(
                 event="pipe_flow_end",
-                pipe_id=self.pipe_id,
+                pipe_id=run.run_id,
                 query=query_instruction,
                 conversation_id=conversation_id,
                 result=goal_result
-            ))
-
+            )
+        finally:
+            # Every queued event is delivered before the run returns
+            await status_bus.close()
         return goal_result
 
-    async def _load_storage_once(self):
+    async def _prepare_tools(self) -> None:
         """
-        Lazily initialize storage exactly once per pipe.
-        Used by observability decorators.
+        Builds the tool schemas of every tool engine upfront, so the queries of a batch reuse them.
         """
-        if self.storage:
-            return self.storage
+        engines: list[Engine] = []
+        for agent in self._iter_agents():
+            for _engines in agent.engines:
+                for engine in (_engines if isinstance(_engines, list) else [_engines]):
+                    if isinstance(engine, Engine):
+                        engines.append(engine)
+
+        results = await asyncio.gather(
+            *[engine._construct_tools() for engine in engines],
+            return_exceptions=True
+        )
+        for engine, res in zip(engines, results):
+            if isinstance(res, Exception):
+                logger.warning(f"Failed to prepare tools for {engine}: {res}")
 
-        from superagentx.db_store import ConfigLoader
+    async def flow_many(
+            self,
+            queries: Iterable[str] | AsyncIterable[str],
+            *,
+            max_in_flight: int = 8,
+            verify_goal: bool = True,
+            conversation_id: str | None = None,
+            status_callback: StatusCallback | None = None,
+            timeout: float | None = None
+    ) -> AsyncIterator[tuple[str, list[GoalResult]]]:
+        """
+        Runs a batch of queries through the pipe and yields the results as each query finishes.
 
-        self.storage = await ConfigLoader.load_db_config()
-        await self.storage.setup()
-        return self.storage
\ No newline at end of file
+        Storage and tool schemas are set up once for the whole batch. Queries are pulled lazily from `queries` and
+        at most `max_in_flight` of them run at the same time, so neither the pending queries nor the results of the
+        batch are held in memory. Every query is recorded as its own pipe run with a generated run id.
+
+        Args:
+            queries: An iterable or async iterable of query instructions.
+            max_in_flight: Maximum number of queries running at the same time. Default `8`
+            verify_goal: Option to enable or disable goal verification after agent execution. Default `True`
+            conversation_id: A string representing the unique identifier of the conversation. Default `None`
+            status_callback: status call back method helps enhance user experience to get live updates of
+                agents executions. Default `None`
+            timeout: Maximum wall time of each query in seconds, see `flow`. Default `None`
+
+        Yields:
+            tuple[str, list[GoalResult]]
+                The query and its results, in completion order. A query which failed unexpectedly yields an
+                empty result list.
+
+        Example:
+            async for query, results in pipe.flow_many(queries, max_in_flight=16):
+                ...
+        """
+        if max_in_flight < 1:
+            raise ValueError(f'max_in_flight must be greater than 0, got {max_in_flight}')
+
+        logger.info(f"Pipe {self.name} starting batch...")
+        storage = await self._open_storage() if self.workflow_store else None
+        await self._prepare_tools()
+
+        if isinstance(queries, AsyncIterable):
+            query_iter = aiter(queries)
+        else:
+            query_iter = iter_to_aiter(queries)
+
+        in_flight: dict[asyncio.Task, str] = {}
+        exhausted = False
+        try:
+            while True:
+                while not exhausted and len(in_flight) < max_in_flight:
+                    try:
+                        query = await anext(query_iter)
+                    except StopAsyncIteration:
+                        exhausted = True
+                        break
+                    task = asyncio.create_task(
+                        self._run_query(
+                            run=PipeRun(
+                                run_id=uuid.uuid4().hex,
+                                storage=storage,
+                                deadline=deadline_after(timeout)
+                            ),
+                            query_instruction=query,
+                            verify_goal=verify_goal,
+                            conversation_id=conversation_id,
+                            status_callback=status_callback
+                        )
+                    )
+                    in_flight[task] = query
+
+                if not in_flight:
+                    break
+
+                done, _ = await asyncio.wait(in_flight, return_when=asyncio.FIRST_COMPLETED)
+                for task in done:
+                    query = in_flight.pop(task)
+                    try:
+                        goal_result = task.result()
+                    except Exception as ex:
+                        logger.error(f"Batch query `{query}` failed: {ex}", exc_info=True)
+                        goal_result = []
+                    yield query, goal_result
+        finally:
+            for task in in_flight:
+                task.cancel()
+            if in_flight:
+                await asyncio.gather(*in_flight, return_exceptions=True)
+            if storage:
+                try:
+                    await storage.close()
+                except Exception as e:
+                    logger.warning(f"Failed to close DB connection: {e}")
+
+    @staticmethod
+    async def _open_storage() -> StorageAdapter:
+        storage = await ConfigLoader.load_db_config()
+        await storage.setup()
+        return storage
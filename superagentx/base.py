@@ -1,3 +1,4 @@
+import copy
 from abc import ABC, abstractmethod
 
 
@@ -8,6 +9,13 @@ class BaseEngine(ABC):
         """
         pass
 
+    def clone(self) -> 'BaseEngine':
+        """
+        Returns a copy of the engine for another concurrent run. The configuration, e.g. the LLM client, handler and
+        prompt template, is shared, while state assigned during a run stays on the copy which assigned it.
+        """
+        return copy.copy(self)
+
     @abstractmethod
     async def start(self, *args, **kwargs):
         """
@@ -29,6 +29,7 @@ from superagentx.prompt import PromptTemplate
 from superagentx.utils.helper import iter_to_aiter, rm_trailing_spaces, sync_to_async
 from superagentx.computer_use.browser.models import InputTextParams, GoToUrl, ToastConfig, MFAParams
 from superagentx.utils.observability.engine_telemetry_decorator import engine_telemetry
+from superagentx.utils.tool_schema import handler_tool_schemas
 
 logger = logging.getLogger(__name__)
 
@@ -86,7 +87,7 @@ class BrowserEngine(BaseEngine):
         )
 
         self.handler = BrowserHandler(self.llm, self.browser_context)
-        self.msgs: list = SYSTEM_MESSAGE
+        self.msgs: list = list(SYSTEM_MESSAGE)
         self.screenshot_path = screenshot_path
         if self.take_screenshot:
             if not self.screenshot_path:
@@ -99,19 +100,24 @@ class BrowserEngine(BaseEngine):
         self.previous_state = None
         self.extract_result = []
 
-    async def __funcs_props(
-            self,
-            funcs: list[str]
-    ) -> list[dict]:
-        _funcs_props: list[dict] = []
-        async for _func_name in iter_to_aiter(funcs):
-            _func_name = _func_name.split('.')[-1]
-            _func = getattr(self.handler, _func_name)
-            logger.debug(f"Func Name : {_func_name}, Func : {_func}")
-            if inspect.ismethod(_func) or inspect.isfunction(_func):
-                logger.debug(f"{_func_name} is function!")
-                _funcs_props.append(await self.llm.get_tool_json(func=_func))
-        return _funcs_props
+    def clone(self) -> 'BrowserEngine':
+        """
+        Returns a copy of the engine for another concurrent run. The browser and the LLM client are shared, while the
+        copy browses in its own browser context, i.e. its own pages and cookies.
+        """
+        from superagentx.computer_use.browser.browser import BrowserContext
+        from superagentx.handler.browser import BrowserHandler
+        engine = super().clone()
+        engine.browser_context = BrowserContext(
+            browser=self.browser,
+            config=self.browser.config.new_context_config
+        )
+        engine.handler = BrowserHandler(self.llm, engine.browser_context)
+        engine.msgs = list(SYSTEM_MESSAGE)
+        engine.n_steps = 1
+        engine.previous_state = None
+        engine.extract_result = []
+        return engine
 
     async def _construct_tools(self) -> list[dict]:
         funcs = self.handler.tools or dir(self.handler)
@@ -119,11 +125,12 @@ class BrowserEngine(BaseEngine):
         if not funcs:
             raise InvalidHandler(str(self.handler))
 
+        # Built once per handler class and tool set, shared by every browser engine
         _tools: list[dict] = []
         if self.tools:
-            _tools = await self.__funcs_props(funcs=self.tools)
+            _tools = await handler_tool_schemas(llm=self.llm, handler=self.handler, funcs=self.tools)
         if not _tools:
-            _tools = await self.__funcs_props(funcs=funcs)
+            _tools = await handler_tool_schemas(llm=self.llm, handler=self.handler, funcs=funcs)
         return _tools
 
     async def _remove_last_state_message(self, messages: list) -> None:
@@ -431,6 +438,7 @@ class BrowserEngine(BaseEngine):
             old_memory: list[dict] | None = None,
             storage: StorageAdapter | None = None,
             conversation_id: str | None = None,
+            deadline: float | None = None,
             **kwargs
     ) -> list:
 
@@ -464,12 +472,8 @@ class BrowserEngine(BaseEngine):
             input_prompt = f'{input_prompt}\n\n{pre_result}'
 
         input_prompt = f"{input_prompt}\nConversation Id: {conversation_id}"
-        funcs = self.handler.tools or dir(self.handler)
-        _tools = await self.__funcs_props(funcs=funcs)
-        logger.debug(f"Handler Funcs : {funcs}")
-        logger.debug(f"Handler Tools List : {_tools}")
-
         tools = await self._construct_tools()
+        logger.debug(f"Handler Tools List : {tools}")
         self.msgs.append({
             "role": "user",
             "content": f"Actions:\n\n{tools}\nSelect to correct action based on the inputs"
@@ -483,5 +487,7 @@ class BrowserEngine(BaseEngine):
         prompt_messages = await rm_trailing_spaces(prompt_messages)
         self.msgs = self.msgs + prompt_messages
         logger.debug(f"Prompt Message : {self.msgs}")
-        result = await self._execute(pipe_id=pipe_id, agent_id=agent_id, storage=storage)
+        # Bounds the whole browsing session, including every LLM call and browser action
+        async with asyncio.timeout_at(deadline):
+            result = await self._execute(pipe_id=pipe_id, agent_id=agent_id, storage=storage)
         return result
@@ -66,6 +66,119 @@ class StorageAdapter(ABC):
     ) -> None:
         pass
 
+    # -------------------------------------------------
+    # Pipe Queue Operations
+    # Queued pipes are claimed and executed by worker processes
+    # -------------------------------------------------
+
+    @abstractmethod
+    async def enqueue_pipe(
+        self,
+        pipe_id: str,
+        input_query: str,
+        conversation_id: str | None = None,
+    ) -> None:
+        """Queue a pipe run, to be claimed by a worker."""
+        pass
+
+    @abstractmethod
+    async def claim_pipe(
+        self,
+        worker_id: str,
+    ) -> dict | None:
+        """
+        Claim the oldest queued pipe run for the given worker.
+        Returns the `pipe_id`, `input_query` and `conversation_id` of the run, or None if no run is queued.
+        """
+        pass
+
+    @abstractmethod
+    async def release_pipes(
+        self,
+        worker_id: str,
+    ) -> list[str]:
+        """Queue the runs claimed by the given worker again, returns their pipe ids."""
+        pass
+
+    @abstractmethod
+    async def get_pipe_status(
+        self,
+        pipe_id: str,
+    ) -> str | None:
+        pass
+
+    # -------------------------------------------------
+    # Agent Job Queue Operations
+    # Jobs are leased by workers, a job whose lease expires is visible again
+    # -------------------------------------------------
+
+    @abstractmethod
+    async def enqueue_job(
+        self,
+        job_id: str,
+        agent_name: str,
+        payload: dict,
+        agent_id: str | None = None,
+        pipe_id: str | None = None,
+        max_attempts: int = 3,
+    ) -> None:
+        pass
+
+    @abstractmethod
+    async def lease_job(
+        self,
+        worker_id: str,
+        visibility_timeout: float,
+        agent_names: list[str] | None = None,
+    ) -> dict | None:
+        """
+        Lease the oldest available job for the given worker, optionally only jobs of the given agents.
+        Returns the `job_id`, `agent_name`, `pipe_id`, `payload` and `attempts` of the job, or None.
+        """
+        pass
+
+    @abstractmethod
+    async def renew_lease(
+        self,
+        job_id: str,
+        worker_id: str,
+        visibility_timeout: float,
+    ) -> bool:
+        """Extend the lease of a job, returns False if the worker lost the lease."""
+        pass
+
+    @abstractmethod
+    async def complete_job(
+        self,
+        job_id: str,
+        worker_id: str,
+        result_data: dict | None,
+    ) -> bool:
+        pass
+
+    @abstractmethod
+    async def fail_job(
+        self,
+        job_id: str,
+        worker_id: str,
+        error: str,
+        retry_delay: float = 0,
+        retry: bool = True,
+    ) -> bool:
+        """
+        Make the job available again after `retry_delay` seconds, or fail it once its attempts are used up. A job
+        failed with `retry=False` fails right away.
+        """
+        pass
+
+    @abstractmethod
+    async def get_job(
+        self,
+        job_id: str,
+    ) -> dict | None:
+        """Returns the `agent_id`, `agent_name`, `status`, `attempts`, `result_data` and `error` of a job."""
+        pass
+
     # -------------------------------------------------
     # Agent Operations
     # -------------------------------------------------
@@ -79,6 +192,16 @@ class StorageAdapter(ABC):
     ) -> bool:
         pass
 
+    @abstractmethod
+    async def get_completed_agents(
+        self,
+        pipe_id: str,
+    ) -> dict[str, dict]:
+        """
+        Returns the stored results of the agents which completed in the given pipe run, keyed by agent name.
+        """
+        pass
+
     @abstractmethod
     async def mark_agent_completed(
         self,
@@ -154,6 +277,17 @@ class StorageAdapter(ABC):
     ) -> None:
         pass
 
+    @abstractmethod
+    async def get_agent_stats(
+            self,
+            limit: int = 1000,
+    ) -> dict[str, dict]:
+        """
+        Aggregates the most recent `agent.duration_ms` metrics, keyed by agent name.
+        Every entry holds the `count`, `mean_ms` and `success_rate` of the agent.
+        """
+        pass
+
     @abstractmethod
     async def record_metric(
             self,
@@ -1,7 +1,8 @@
 import logging
+from datetime import timedelta
 from typing import Any
 
-from sqlalchemy import  select
+from sqlalchemy import and_, or_, select, update
 from sqlalchemy.exc import IntegrityError, SQLAlchemyError
 from sqlalchemy.ext.asyncio import (
     create_async_engine,
@@ -9,12 +10,12 @@ from sqlalchemy.ext.asyncio import (
 )
 
 from superagentx.db_store.schema.models import (
-    Base, DBPipe, DBAgent, DBTrace, DBSpan,
+    Base, DBPipe, DBAgent, DBJob, DBTrace, DBSpan,
     DBSpanAttribute, DBSpanEvent, DBMetric
 )
 
 from superagentx.db_store.db_interface import StorageAdapter
-from superagentx.db_store.sql_status_enum import PipeStatus
+from superagentx.db_store.sql_status_enum import JobStatus, PipeStatus
 from superagentx.utils.helper import utcnow, ensure_utc, duration_ms
 
 logger = logging.getLogger(__name__)
@@ -123,6 +124,286 @@ class SQLBaseStorage(StorageAdapter):
                         )
                         trace.error_message = error
 
+    # -------------------------------------------------------------------
+    # Pipe Queue Operations
+    # -------------------------------------------------------------------
+
+    async def enqueue_pipe(
+            self,
+            pipe_id: str,
+            input_query: str,
+            conversation_id: str | None = None,
+    ) -> None:
+        async with self.session_factory() as session:
+            async with session.begin():
+                session.add(
+                    DBPipe(
+                        pipe_id=pipe_id,
+                        executed_by=None,
+                        status=PipeStatus.PENDING,
+                    )
+                )
+                # The trace carries the input of the run until a worker claims it
+                session.add(
+                    DBTrace(
+                        trace_id=pipe_id,
+                        conversation_id=conversation_id,
+                        query_input=input_query,
+                        status="queued",
+                        start_time=utcnow(),
+                    )
+                )
+
+    async def claim_pipe(
+            self,
+            worker_id: str,
+    ) -> dict | None:
+        async with self.session_factory() as session:
+            while True:
+                async with session.begin():
+                    pipe_id = await session.scalar(
+                        select(DBPipe.pipe_id)
+                        .where(DBPipe.status == PipeStatus.PENDING)
+                        .order_by(DBPipe.id)
+                        .limit(1)
+                    )
+                    if not pipe_id:
+                        return None
+
+                    # Compare and set, so concurrent workers never claim the same run
+                    claimed = await session.execute(
+                        update(DBPipe)
+                        .where(
+                            DBPipe.pipe_id == pipe_id,
+                            DBPipe.status == PipeStatus.PENDING,
+                        )
+                        .values(status=PipeStatus.RUNNING, executed_by=worker_id)
+                    )
+                    if not claimed.rowcount:
+                        continue
+
+                    trace = await session.scalar(
+                        select(DBTrace).where(DBTrace.trace_id == pipe_id)
+                    )
+                    return {
+                        "pipe_id": pipe_id,
+                        "input_query": trace.query_input if trace else None,
+                        "conversation_id": trace.conversation_id if trace else None,
+                    }
+
+    async def release_pipes(
+            self,
+            worker_id: str,
+    ) -> list[str]:
+        async with self.session_factory() as session:
+            async with session.begin():
+                pipe_ids = list(
+                    await session.scalars(
+                        select(DBPipe.pipe_id).where(
+                            DBPipe.executed_by == worker_id,
+                            DBPipe.status.not_in((PipeStatus.PENDING, PipeStatus.COMPLETED, PipeStatus.FAILED)),
+                        )
+                    )
+                )
+                if pipe_ids:
+                    await session.execute(
+                        update(DBPipe)
+                        .where(DBPipe.pipe_id.in_(pipe_ids))
+                        .values(status=PipeStatus.PENDING, executed_by=None)
+                    )
+                return pipe_ids
+
+    async def get_pipe_status(
+            self,
+            pipe_id: str,
+    ) -> str | None:
+        async with self.session_factory() as session:
+            return await session.scalar(
+                select(DBPipe.status).where(DBPipe.pipe_id == pipe_id)
+            )
+
+    # -------------------------------------------------------------------
+    # Agent Job Queue Operations
+    # -------------------------------------------------------------------
+
+    async def enqueue_job(
+            self,
+            job_id: str,
+            agent_name: str,
+            payload: dict,
+            agent_id: str | None = None,
+            pipe_id: str | None = None,
+            max_attempts: int = 3,
+    ) -> None:
+        async with self.session_factory() as session:
+            async with session.begin():
+                session.add(
+                    DBJob(
+                        job_id=job_id,
+                        agent_id=agent_id,
+                        agent_name=agent_name,
+                        pipe_id=pipe_id,
+                        payload=payload,
+                        status=JobStatus.PENDING,
+                        max_attempts=max_attempts,
+                        available_at=utcnow(),
+                    )
+                )
+
+    async def lease_job(
+            self,
+            worker_id: str,
+            visibility_timeout: float,
+            agent_names: list[str] | None = None,
+    ) -> dict | None:
+        async with self.session_factory() as session:
+            while True:
+                async with session.begin():
+                    now = utcnow()
+                    stmt = select(DBJob).where(
+                        or_(
+                            and_(DBJob.status == JobStatus.PENDING, DBJob.available_at <= now),
+                            and_(DBJob.status == JobStatus.LEASED, DBJob.lease_until < now),
+                        )
+                    )
+                    if agent_names is not None:
+                        stmt = stmt.where(DBJob.agent_name.in_(agent_names))
+                    # Sessions keep their objects across retries, reload the row every time
+                    job = await session.scalar(
+                        stmt.order_by(DBJob.id).limit(1).execution_options(populate_existing=True)
+                    )
+                    if not job:
+                        return None
+                    attempts = job.attempts
+
+                    # Compare and set on the attempts, so concurrent workers never lease the same attempt
+                    guard = and_(
+                        DBJob.job_id == job.job_id,
+                        DBJob.status == job.status,
+                        DBJob.attempts == attempts,
+                    )
+                    if attempts >= job.max_attempts:
+                        # The lease of the last attempt expired, the worker died or hung
+                        await session.execute(
+                            update(DBJob).where(guard).values(
+                                status=JobStatus.FAILED,
+                                leased_by=None,
+                                lease_until=None,
+                                error_details=job.error_details or "Lease expired",
+                            )
+                        )
+                        continue
+
+                    leased = await session.execute(
+                        update(DBJob).where(guard).values(
+                            status=JobStatus.LEASED,
+                            leased_by=worker_id,
+                            lease_until=now + timedelta(seconds=visibility_timeout),
+                            attempts=attempts + 1,
+                        )
+                    )
+                    if not leased.rowcount:
+                        continue
+                    return {
+                        "job_id": job.job_id,
+                        "agent_name": job.agent_name,
+                        "pipe_id": job.pipe_id,
+                        "payload": job.payload,
+                        "attempts": attempts + 1,
+                    }
+
+    async def renew_lease(
+            self,
+            job_id: str,
+            worker_id: str,
+            visibility_timeout: float,
+    ) -> bool:
+        async with self.session_factory() as session:
+            async with session.begin():
+                renewed = await session.execute(
+                    update(DBJob)
+                    .where(
+                        DBJob.job_id == job_id,
+                        DBJob.leased_by == worker_id,
+                        DBJob.status == JobStatus.LEASED,
+                    )
+                    .values(lease_until=utcnow() + timedelta(seconds=visibility_timeout))
+                )
+                return bool(renewed.rowcount)
+
+    async def complete_job(
+            self,
+            job_id: str,
+            worker_id: str,
+            result_data: dict | None,
+    ) -> bool:
+        async with self.session_factory() as session:
+            async with session.begin():
+                completed = await session.execute(
+                    update(DBJob)
+                    .where(
+                        DBJob.job_id == job_id,
+                        DBJob.leased_by == worker_id,
+                        DBJob.status == JobStatus.LEASED,
+                    )
+                    .values(
+                        status=JobStatus.COMPLETED,
+                        result_data=result_data,
+                        lease_until=None,
+                        error_details=None,
+                    )
+                )
+                return bool(completed.rowcount)
+
+    async def fail_job(
+            self,
+            job_id: str,
+            worker_id: str,
+            error: str,
+            retry_delay: float = 0,
+            retry: bool = True,
+    ) -> bool:
+        async with self.session_factory() as session:
+            async with session.begin():
+                job = await session.scalar(
+                    select(DBJob).where(
+                        DBJob.job_id == job_id,
+                        DBJob.leased_by == worker_id,
+                        DBJob.status == JobStatus.LEASED,
+                    )
+                )
+                if not job:
+                    return False
+
+                job.error_details = error
+                job.leased_by = None
+                job.lease_until = None
+                if not retry or job.attempts >= job.max_attempts:
+                    job.status = JobStatus.FAILED
+                else:
+                    job.status = JobStatus.PENDING
+                    job.available_at = utcnow() + timedelta(seconds=retry_delay)
+                return True
+
+    async def get_job(
+            self,
+            job_id: str,
+    ) -> dict | None:
+        async with self.session_factory() as session:
+            job = await session.scalar(
+                select(DBJob).where(DBJob.job_id == job_id)
+            )
+            if not job:
+                return None
+            return {
+                "agent_id": job.agent_id,
+                "agent_name": job.agent_name,
+                "status": job.status,
+                "attempts": job.attempts,
+                "result_data": job.result_data,
+                "error": job.error_details,
+            }
+
     # -------------------------------------------------------------------
     # Agent Operations
     # -------------------------------------------------------------------
@@ -140,6 +421,23 @@ class SQLBaseStorage(StorageAdapter):
             )
             return (await session.execute(stmt)).scalar() is not None
 
+    async def get_completed_agents(
+            self,
+            pipe_id: str
+    ) -> dict[str, dict]:
+        async with self.session_factory() as session:
+            stmt = select(DBAgent.agent_name, DBAgent.result_data).where(
+                DBAgent.pipe_id == pipe_id,
+                DBAgent.status.in_(("COMPLETED", "APPROVED")),
+                DBAgent.result_data.is_not(None),
+            ).order_by(DBAgent.id)
+            rows = (await session.execute(stmt)).all()
+            return {
+                agent_name: result_data
+                for agent_name, result_data in rows
+                if result_data
+            }
+
     async def mark_agent_completed(
             self,
             pipe_id: str,
@@ -250,6 +548,17 @@ class SQLBaseStorage(StorageAdapter):
     ) -> None:
         async with self.session_factory() as session:
             async with session.begin():
+                trace = await session.scalar(
+                    select(DBTrace).where(DBTrace.trace_id == trace_id)
+                )
+                if trace:
+                    # Resumed pipe, reopen its trace
+                    trace.status = status
+                    trace.end_time = None
+                    trace.duration_ms = None
+                    trace.error_message = None
+                    return
+
                 session.add(
                     DBTrace(
                         trace_id=trace_id,
@@ -306,6 +615,18 @@ class SQLBaseStorage(StorageAdapter):
                     )
                     return
 
+                span = await session.scalar(
+                    select(DBSpan).where(DBSpan.span_id == span_id)
+                )
+                if span:
+                    # Agent re-executed by a resumed pipe, reopen its span
+                    span.status = status
+                    span.start_time = utcnow()
+                    span.end_time = None
+                    span.duration_ms = None
+                    span.error_message = None
+                    return
+
                 session.add(
                     DBSpan(
                         span_id=span_id,
@@ -411,6 +732,40 @@ class SQLBaseStorage(StorageAdapter):
                     )
                 )
 
+    async def get_agent_stats(
+            self,
+            limit: int = 1000,
+    ) -> dict[str, dict]:
+        async with self.session_factory() as session:
+            rows = (
+                await session.execute(
+                    select(DBMetric.labels, DBMetric.value)
+                    .where(DBMetric.name == "agent.duration_ms")
+                    .order_by(DBMetric.id.desc())
+                    .limit(limit)
+                )
+            ).all()
+
+        totals: dict[str, list[float]] = {}
+        for labels, value in rows:
+            agent = (labels or {}).get("agent")
+            if not agent:
+                continue
+            count, duration, successes = totals.setdefault(agent, [0, 0.0, 0])
+            totals[agent] = [
+                count + 1,
+                duration + value,
+                successes + bool(labels.get("success", True)),
+            ]
+        return {
+            agent: {
+                "count": count,
+                "mean_ms": duration / count,
+                "success_rate": successes / count,
+            }
+            for agent, (count, duration, successes) in totals.items()
+        }
+
     async def close(self) -> None:
         """
         Properly close async engine and release all resources.
@@ -1,10 +1,10 @@
 from datetime import datetime
 from sqlalchemy import (
-    DateTime, ForeignKey, JSON, String, Text, UniqueConstraint, BigInteger
+    DateTime, ForeignKey, JSON, String, Text, UniqueConstraint, BigInteger, Integer
 )
 from sqlalchemy.orm import DeclarativeBase, Mapped, mapped_column, relationship
 
-from superagentx.db_store.sql_status_enum import PipeStatus, AgentStatus
+from superagentx.db_store.sql_status_enum import PipeStatus, AgentStatus, JobStatus
 from superagentx.utils.helper import utcnow
 
 
@@ -75,6 +75,46 @@ class DBAgent(Base):
 
     pipe = relationship("DBPipe", back_populates="agents")
 
+class DBJob(Base):
+    __tablename__ = "agent_jobs"
+
+    id: Mapped[int] = mapped_column(primary_key=True)
+    job_id: Mapped[str] = mapped_column(String(50), unique=True, index=True)
+    agent_id: Mapped[str | None] = mapped_column(String(50))
+    agent_name: Mapped[str] = mapped_column(String(50), index=True)
+    pipe_id: Mapped[str | None] = mapped_column(String(50), index=True)
+    payload: Mapped[dict | None] = mapped_column(JSON)
+
+    status: Mapped[str] = mapped_column(
+        String(30),
+        default=JobStatus.PENDING,
+        index=True,
+    )
+    attempts: Mapped[int] = mapped_column(Integer, default=0)
+    max_attempts: Mapped[int] = mapped_column(Integer, default=3)
+
+    # A leased job becomes visible to other workers again once its lease expires
+    leased_by: Mapped[str | None] = mapped_column(String(100))
+    lease_until: Mapped[datetime | None] = mapped_column(DateTime(timezone=True), index=True)
+    available_at: Mapped[datetime] = mapped_column(
+        DateTime(timezone=True),
+        default=utcnow,
+        index=True,
+    )
+
+    result_data: Mapped[dict | None] = mapped_column(JSON)
+    error_details: Mapped[str | None] = mapped_column(Text)
+
+    created_at: Mapped[datetime] = mapped_column(
+        DateTime(timezone=True),
+        default=utcnow,
+    )
+    updated_date: Mapped[datetime] = mapped_column(
+        DateTime(timezone=True),
+        default=utcnow,
+        onupdate=utcnow,
+    )
+
 # --- Telemetry Schema (OpenTelemetry Style) ---
 
 class DBTrace(Base):
@@ -15,3 +15,12 @@ class AgentStatus:
     SKIPPED = "Skipped"
 
     ALL = {PENDING, RUNNING, COMPLETED, FAILED, SKIPPED}
+
+
+class JobStatus:
+    PENDING = "Pending"
+    LEASED = "Leased"
+    COMPLETED = "Completed"
+    FAILED = "Failed"
+
+    ALL = {PENDING, LEASED, COMPLETED, FAILED}
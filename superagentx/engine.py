@@ -1,6 +1,10 @@
+import asyncio
+import copy
 import inspect
+import json
 import logging
 import typing
+from contextlib import nullcontext
 
 from superagentx.db_store import StorageAdapter
 from superagentx.exceptions import ToolError
@@ -8,13 +12,28 @@ from superagentx.handler.base import BaseHandler
 from superagentx.handler.exceptions import InvalidHandler
 from superagentx.handler.mcp import MCPHandler
 from superagentx.llm import LLMClient, ChatCompletionParams
+from superagentx.llm.types.response import Message, Tool
 from superagentx.prompt import PromptTemplate
-from superagentx.utils.helper import iter_to_aiter, sync_to_async, rm_trailing_spaces, StatusCallback, _maybe_await
+from superagentx.utils.helper import (
+    iter_to_aiter,
+    sync_to_async,
+    rm_trailing_spaces,
+    StatusCallback,
+    _maybe_await,
+    bounded_gather
+)
+from superagentx.utils.llm_config import LLMType
 from superagentx.utils.observability.engine_telemetry_decorator import engine_telemetry
 from superagentx.utils.parsers.base import BaseParser
+from superagentx.utils.tool_schema import handler_tool_schemas
 
 logger = logging.getLogger(__name__)
 
+# Providers with their own chat format, which the tool results cannot be sent back to
+_NATIVE_FORMAT_LLMS = {LLMType.BEDROCK_CLIENT, LLMType.GEMINI_CLIENT, LLMType.OLLAMA}
+
+_NOT_CALLED = object()
+
 
 class Engine:
     """
@@ -29,7 +48,10 @@ class Engine:
             llm: LLMClient,
             prompt_template: PromptTemplate,
             tools: list[dict] | list[str] | None = None,
-            output_parser: BaseParser | None = None
+            output_parser: BaseParser | None = None,
+            max_iterations: int = 1,
+            max_tool_concurrency: int | None = None,
+            tool_concurrency: dict[str, int] | None = None
     ):
         """
         Initializes the Engine.
@@ -40,44 +62,135 @@ class Engine:
             prompt_template: Used to format the input prompt.
             tools: Optional explicit list of tool method names or tool metadata.
             output_parser: Optional parser to process and format tool outputs.
+            max_iterations: Maximum number of LLM calls of one run. After the first, the tool results are sent back to
+                the LLM, which calls further tools or answers, until it answers without tools. Default `1`
+            max_tool_concurrency: Maximum number of tool calls of one LLM message running at the same time. Defaults
+                to `None`, running every tool call of the message concurrently.
+            tool_concurrency: Optional maximum number of concurrent calls per tool name, shared by every run of the
+                engine, e.g. `{"search": 2}`.
         """
+        if max_iterations < 1:
+            raise ValueError(f'max_iterations must be greater than 0, got {max_iterations}')
         self.handler = handler
         self.llm = llm
         self.prompt_template = prompt_template
         self.tools = tools
         self.output_parser = output_parser
+        self.max_iterations = max_iterations
+        self.max_tool_concurrency = max_tool_concurrency
+        self.tool_concurrency = tool_concurrency or {}
+        self._tool_semaphores: dict[str, asyncio.Semaphore] = {}
 
     def __str__(self):
         return f'Engine {self.handler.__class__}'
 
-    async def __funcs_props(self, funcs: list[str]) -> list[dict]:
+    def clone(self) -> 'Engine':
         """
-        Convert tool names into LLM-compatible function schemas.
+        Returns a copy of the engine for another concurrent run, sharing its handler, LLM client and prompt template.
+        """
+        return copy.copy(self)
 
-        Args:
-            funcs: List of function names (str) or functions from MCP handler.
+    def _supports_tool_feedback(self) -> bool:
+        llm_type = getattr(getattr(self.llm, 'llm_config_model', None), 'llm_type', None)
+        return llm_type not in _NATIVE_FORMAT_LLMS
+
+    def _tool_limit(self, name: str) -> asyncio.Semaphore | nullcontext:
+        limit = self.tool_concurrency.get(name)
+        if not limit:
+            return nullcontext()
+        if name not in self._tool_semaphores:
+            self._tool_semaphores[name] = asyncio.Semaphore(limit)
+        return self._tool_semaphores[name]
+
+    async def _call_tool(
+            self,
+            *,
+            tool: Tool,
+            deadline: float | None
+    ) -> typing.Any:
+        args = tool.arguments or {}
+        if isinstance(self.handler, MCPHandler):
+            # MCP tools are called over the warm sessions of the handler, by SSE transport or Stdio transport
+            async with self._tool_limit(tool.name), asyncio.timeout_at(deadline):
+                res = await self.handler.call_tool(tool.name, arguments=args)
+        else:
+            # General handler function calls
+            func = getattr(self.handler, tool.name, None)
+            if not func or not (inspect.isfunction(func) or inspect.ismethod(func)):
+                logger.warning(f"Handler method not found: {tool.name}")
+                return _NOT_CALLED
+            logger.debug(f"Calling {tool.name} with args {args}")
+            async with self._tool_limit(tool.name), asyncio.timeout_at(deadline):
+                res = await func(**args) if inspect.iscoroutinefunction(func) else await sync_to_async(func, **args)
+        return await self.output_parser.parse(res) if self.output_parser else res
+
+    async def _call_tools(
+            self,
+            *,
+            tool_calls: list[Tool],
+            deadline: float | None
+    ) -> list[tuple[Tool, typing.Any]]:
+        """
+        Calls the tools of one assistant message concurrently, within the engine's concurrency limits.
+
+        Every tool call settles before a failure is raised, so no call keeps running in the background while the
+        agent retries the turn.
 
         Returns:
-            List of function schema dictionaries.
+            The called tools with their parsed results, in the order of the tool calls.
+        """
+        tool_calls = [tool for tool in tool_calls if tool.tool_type == 'function']
+        outcomes = await bounded_gather(
+            *[self._call_tool(tool=tool, deadline=deadline) for tool in tool_calls],
+            limit=self.max_tool_concurrency,
+            return_exceptions=True
+        )
+        for outcome in outcomes:
+            if isinstance(outcome, BaseException):
+                raise outcome
+        return [(tool, res) for tool, res in zip(tool_calls, outcomes) if res is not _NOT_CALLED]
+
+    @staticmethod
+    def _tool_feedback(
+            *,
+            message: Message,
+            called: list[tuple[Tool, typing.Any]]
+    ) -> list[dict]:
+        # The assistant turn and its tool results, in the chat format of OpenAI compatible providers
+        if not called or any(not tool.id for tool, _ in called):
+            return []
+        return [
+            {
+                "role": "assistant",
+                "content": message.content,
+                "tool_calls": [
+                    {
+                        "id": tool.id,
+                        "type": "function",
+                        "function": {"name": tool.name, "arguments": json.dumps(tool.arguments or {})}
+                    }
+                    for tool, _ in called
+                ]
+            },
+            *[
+                {
+                    "role": "tool",
+                    "tool_call_id": tool.id,
+                    "content": res if isinstance(res, str) else json.dumps(res, default=str)
+                }
+                for tool, res in called
+            ]
+        ]
+
+    async def __mcp_funcs_props(self) -> list[dict]:
         """
-        _funcs_props: list[dict] = []
+        Convert the tool functions listed by the MCP server into LLM-compatible function schemas. The handler caches
+        the tool catalog and its schemas until the server tools change.
 
-        if getattr(self.handler, "__type__", None) == "MCP":
-            # MCP handler: dynamically fetch tool functions
-            get_tools_func = getattr(self.handler, "get_mcp_tools", None)
-            if inspect.isfunction(get_tools_func) or inspect.ismethod(get_tools_func):
-                funcs = await get_tools_func()
-                async for func in iter_to_aiter(funcs):
-                    logger.debug(f"MCP Tool Function Name: {func}")
-                    _funcs_props.append(await self.llm.get_tool_json(func=func))
-        else:
-            # Regular handler: lookup functions by name
-            async for func_name in iter_to_aiter(funcs):
-                logger.debug(f"Looking up handler method: {func_name}")
-                func_attr = getattr(self.handler, func_name.split('.')[-1], None)
-                if inspect.isfunction(func_attr) or inspect.ismethod(func_attr):
-                    _funcs_props.append(await self.llm.get_tool_json(func=func_attr))
-        return _funcs_props
+        Returns:
+            List of function schema dictionaries.
+        """
+        return await self.handler.get_mcp_tool_schemas(llm=self.llm)
 
     async def _construct_tools(self) -> list[dict]:
         """
@@ -92,7 +205,13 @@ class Engine:
             raise InvalidHandler(f"No methods found in handler: {self.handler}")
 
         # Use explicitly provided tools if any, otherwise infer all from handler
-        return await self.__funcs_props(funcs=self.tools or funcs)
+        funcs = self.tools or funcs
+
+        # MCP tools are listed from the server, everything else is built once per handler class and tool set
+        if getattr(self.handler, "__type__", None) == "MCP":
+            return await self.__mcp_funcs_props()
+
+        return await handler_tool_schemas(llm=self.llm, handler=self.handler, funcs=funcs)
 
     @engine_telemetry(
         engine_type="tool",
@@ -110,6 +229,9 @@ class Engine:
             conversation_id: str | None = None,
             storage: StorageAdapter | None = None,
             status_callback: StatusCallback | None = None,
+            deadline: float | None = None,
+            verify_prompt: str | None = None,
+            verdicts: list[str] | None = None,
             **kwargs
     ) -> list[typing.Any]:
         """
@@ -127,6 +249,12 @@ class Engine:
             kwargs: Dynamic parameters for the prompt template.
             status_callback: This optional status call back method helps enhance user experience to get
             live updates of agents executions
+            deadline: Optional event loop deadline, the LLM call and every tool call are cancelled once it passes
+                and `TimeoutError` is raised.
+            verify_prompt: Optional goal review instructions, asking the LLM for a goal verdict as its final answer,
+                so the agent can verify its goal without a second LLM call.
+            verdicts: Optional caller's list collecting the final answer, the content of a reply without tool calls.
+                Tool calls after an answer drop it, so a verdict given before the tool results is never kept.
 
         Returns:
             A list of parsed or raw results depending on output parser.
@@ -134,6 +262,8 @@ class Engine:
         # Incorporate pre-result and conversation context into the prompt
         if pre_result:
             input_prompt += f'\n\n{pre_result} \n\n {previous_agent_result}'
+        if verify_prompt:
+            input_prompt += f'\n\n{verify_prompt}'
         input_prompt += f"\nConversation Id: {conversation_id}"
 
         kwargs = kwargs or {}
@@ -154,67 +284,62 @@ class Engine:
         chat_params = ChatCompletionParams(messages=messages, tools=tools)
         logger.debug(f"Chat Params: {chat_params.model_dump_json(exclude_none=True)}")
 
-        # Get tool call suggestions from the LLM
-        messages = await self.llm.afunc_chat_completion(chat_completion_params=chat_params)
+        max_iterations = self.max_iterations
+        if max_iterations > 1 and not self._supports_tool_feedback():
+            logger.warning(f"{self} cannot send tool results back to {self.llm}, running a single iteration")
+            max_iterations = 1
 
-        # Telemetry Data
-        if pipe_id and agent_id and storage:
-            span_id = f"{pipe_id}:{agent_id}"
+        results = []
+        for iteration in range(1, max_iterations + 1):
+            # Get tool call suggestions from the LLM
+            messages = await self.llm.afunc_chat_completion(chat_completion_params=chat_params, deadline=deadline)
 
-            from superagentx.utils.observability.telemetry_llm_usage import extract_llm_usage
+            # Telemetry Data
+            if pipe_id and agent_id and storage:
+                span_id = f"{pipe_id}:{agent_id}"
 
-            await extract_llm_usage(storage=storage, span_id=span_id, llm_response=messages)
+                from superagentx.utils.observability.telemetry_llm_usage import extract_llm_usage
 
-        if not messages:
-            raise ToolError("No tools matched or executed!")
+                await extract_llm_usage(storage=storage, span_id=span_id, llm_response=messages)
 
-        results = []
+            if not messages:
+                if iteration == 1:
+                    raise ToolError("No tools matched or executed!")
+                break
 
-        # Callback: agent execution started
-        if status_callback:
-            await _maybe_await(status_callback(
-                event="agent_llm_execute",
-                pipe_id=pipe_id,
-                agent_id=agent_id,
-                agent=agent_name,
-                conversation_id=conversation_id,
-                messages=messages
-            ))
-
-        # Process each message returned by the LLM
-        async for message in iter_to_aiter(messages):
-            if message.tool_calls:
-                if isinstance(self.handler, MCPHandler):
-                    # Special handling for MCP-based tools by SSE transport or Stdio transport
-                    _func = self.handler.connect_to_mcp_server
-                    if self.handler.sse_transport:
-                        _func = self.handler.connect_to_mcp_sse_server
-                        
-                    session = await _func()
-
-                    async for tool in iter_to_aiter(message.tool_calls):
-                        if tool.tool_type == 'function':
-                            res = await session.call_tool(tool.name, arguments=tool.arguments or {})
-                            parsed = await self.output_parser.parse(res) if self.output_parser else res
-                            results.append(parsed)
-                    await self.handler.cleanup()
+            # Callback: agent execution started
+            if status_callback:
+                await _maybe_await(status_callback(
+                    event="agent_llm_execute",
+                    pipe_id=pipe_id,
+                    agent_id=agent_id,
+                    agent=agent_name,
+                    conversation_id=conversation_id,
+                    messages=messages,
+                    iteration=iteration
+                ))
+
+            # Process each message returned by the LLM
+            feedback: list[dict] = []
+            async for message in iter_to_aiter(messages):
+                if message.tool_calls:
+                    # A verdict is only final once no tool runs after it
+                    if verdicts is not None:
+                        verdicts.clear()
+                    called = await self._call_tools(tool_calls=message.tool_calls, deadline=deadline)
+                    results.extend(parsed for _, parsed in called)
+                    if not feedback:
+                        feedback = self._tool_feedback(message=message, called=called)
                 else:
-                    # General handler function calls
-                    async for tool in iter_to_aiter(message.tool_calls):
-                        if tool.tool_type == 'function':
-                            func = getattr(self.handler, tool.name, None)
-                            if func and (inspect.isfunction(func) or inspect.ismethod(func)):
-                                args = tool.arguments or {}
-                                logger.debug(f"Calling {tool.name} with args {args}")
-                                result = await func(**args) if inspect.iscoroutinefunction(
-                                    func
-                                ) else await sync_to_async(func, **args)
-                                parsed = await self.output_parser.parse(result) if self.output_parser else result
-                                results.append(parsed)
-                            else:
-                                logger.warning(f"Handler method not found: {tool.name}")
-            else:
-                # If no tool call, treat as LLM-generated content
-                results.append(message.content)
+                    # If no tool call, treat as LLM-generated content
+                    results.append(message.content)
+                    if verdicts is not None and message.content:
+                        verdicts.append(message.content)
+
+            # The model answered without tools, or the tool results cannot be sent back
+            if not feedback or iteration == max_iterations:
+                break
+            logger.debug(f"Sending {len(feedback) - 1} tool result(s) back, iteration {iteration + 1}")
+            chat_params = ChatCompletionParams(messages=[*chat_params.messages, *feedback], tools=tools)
 
         return results
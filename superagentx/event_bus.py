@@ -0,0 +1,175 @@
+import asyncio
+import logging
+from collections import deque
+from collections.abc import Callable, Hashable
+
+from superagentx.utils.helper import StatusCallback, _maybe_await
+
+logger = logging.getLogger(__name__)
+
+
+class OverflowPolicy:
+    """
+    What a full subscriber queue does with a new event.
+
+    - `drop_oldest`: the oldest queued event is dropped.
+    - `drop_newest`: the new event is dropped.
+    - `coalesce`: the new event replaces a queued event with the same coalesce key, e.g. an older progress update
+      of the same agent, otherwise the oldest queued event is dropped.
+    """
+    DROP_OLDEST = 'drop_oldest'
+    DROP_NEWEST = 'drop_newest'
+    COALESCE = 'coalesce'
+
+    ALL = {DROP_OLDEST, DROP_NEWEST, COALESCE}
+
+
+def default_coalesce_key(event: dict) -> Hashable:
+    return event.get('event'), event.get('pipe_id'), event.get('agent_id')
+
+
+class Subscription:
+    """
+    A subscriber of an `EventBus`, with its own bounded queue and dispatch task.
+    """
+
+    def __init__(
+            self,
+            callback: StatusCallback,
+            *,
+            max_queue_size: int,
+            overflow: str,
+            coalesce_key: Callable[[dict], Hashable]
+    ):
+        if max_queue_size < 1:
+            raise ValueError(f'max_queue_size must be greater than 0, got {max_queue_size}')
+        if overflow not in OverflowPolicy.ALL:
+            raise ValueError(f'Unknown overflow policy `{overflow}`')
+        self.callback = callback
+        self.max_queue_size = max_queue_size
+        self.overflow = overflow
+        self.coalesce_key = coalesce_key
+        self.dropped = 0
+        self._events: deque[dict] = deque()
+        self._ready = asyncio.Event()
+        self._closed = False
+        self._task: asyncio.Task | None = None
+
+    def offer(self, event: dict) -> None:
+        if self._closed:
+            return
+        if len(self._events) >= self.max_queue_size:
+            self.dropped += 1
+            match self.overflow:
+                case OverflowPolicy.DROP_NEWEST:
+                    return
+                case OverflowPolicy.COALESCE:
+                    key = self.coalesce_key(event)
+                    for idx, queued in enumerate(self._events):
+                        if self.coalesce_key(queued) == key:
+                            self._events[idx] = event
+                            return
+                    self._events.popleft()
+                case _:
+                    self._events.popleft()
+        self._events.append(event)
+        self._ready.set()
+        if self._task is None:
+            self._task = asyncio.create_task(self._dispatch())
+
+    async def _dispatch(self) -> None:
+        while True:
+            await self._ready.wait()
+            while self._events:
+                event = self._events.popleft()
+                try:
+                    await _maybe_await(self.callback(**event))
+                except Exception as ex:
+                    # A failing subscriber must not stop the delivery of the next events
+                    logger.warning(f'Status callback failed for event {event.get("event")}: {ex}')
+            self._ready.clear()
+            if self._closed:
+                return
+
+    async def close(self, timeout: float | None = None) -> None:
+        """
+        Delivers the queued events and stops the dispatch task. Events still queued after `timeout` seconds are
+        dropped.
+        """
+        self._closed = True
+        self._ready.set()
+        if self._task is None:
+            return
+        task, self._task = self._task, None
+        try:
+            await asyncio.wait_for(task, timeout)
+        except TimeoutError:
+            self.dropped += len(self._events)
+            self._events.clear()
+            logger.warning(f'Status callback did not drain in {timeout}s, queued events are dropped')
+        if self.dropped:
+            logger.debug(f'Status callback dropped {self.dropped} event(s) on overflow')
+
+
+class EventBus:
+    """
+    Delivers status events to subscribers without blocking the publisher.
+
+    `publish` only queues the event for every subscriber, and a background task per subscriber awaits the
+    subscriber's callback. A slow consumer, e.g. a websocket push or a database write, therefore never slows down
+    the agents publishing the events. Each subscriber has a bounded queue with an overflow policy.
+
+    Example:
+        bus = EventBus()
+        bus.subscribe(websocket_status, max_queue_size=100, overflow=OverflowPolicy.COALESCE)
+        await agent.execute(query_instruction=query, status_callback=bus.publish)
+        await bus.close()
+    """
+
+    def __init__(self):
+        self._subscriptions: list[Subscription] = []
+
+    def subscribe(
+            self,
+            callback: StatusCallback,
+            *,
+            max_queue_size: int = 1000,
+            overflow: str = OverflowPolicy.COALESCE,
+            coalesce_key: Callable[[dict], Hashable] = default_coalesce_key
+    ) -> Subscription:
+        """
+        Args:
+            callback: The status callback, called with the keyword arguments of each event.
+            max_queue_size: Maximum number of events queued for the callback. Default `1000`
+            overflow: What a full queue does with a new event, see `OverflowPolicy`. Default `coalesce`
+            coalesce_key: The key of the events replacing each other with the `coalesce` policy. Defaults to the
+                event name, pipe id and agent id.
+        """
+        subscription = Subscription(
+            callback,
+            max_queue_size=max_queue_size,
+            overflow=overflow,
+            coalesce_key=coalesce_key
+        )
+        self._subscriptions.append(subscription)
+        return subscription
+
+    def publish(self, **event) -> None:
+        """
+        Queues the event for every subscriber and returns immediately. Matches the signature of a status callback,
+        so it can be passed as `status_callback`.
+        """
+        for subscription in self._subscriptions:
+            subscription.offer(event)
+
+    @property
+    def dropped(self) -> int:
+        return sum(subscription.dropped for subscription in self._subscriptions)
+
+    async def close(self, timeout: float | None = None) -> None:
+        """
+        Delivers the queued events of every subscriber and stops their dispatch tasks.
+        """
+        await asyncio.gather(
+            *[subscription.close(timeout) for subscription in self._subscriptions]
+        )
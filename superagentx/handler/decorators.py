@@ -1,9 +1,161 @@
+import asyncio
 import functools
+import inspect
+import json
+import logging
+import time
+import weakref
+from collections import OrderedDict
+from collections.abc import Callable, Hashable
+from typing import Any
 
+logger = logging.getLogger(__name__)
+
+
+class _ToolResultCache:
+    """
+    Results of a tool by its arguments, with a time to live and least recently used eviction. Concurrent calls with
+    the same arguments share a single execution.
+    """
+
+    def __init__(self, *, ttl: float, max_size: int):
+        self.ttl = ttl
+        self.max_size = max_size
+        self._entries: OrderedDict[Hashable, tuple[float, Any]] = OrderedDict()
+        self._in_flight: dict[Hashable, asyncio.Task] = {}
+
+    def _get(self, key: Hashable) -> tuple[bool, Any]:
+        entry = self._entries.get(key)
+        if entry is None:
+            return False, None
+        expires_at, result = entry
+        if expires_at <= time.monotonic():
+            del self._entries[key]
+            return False, None
+        self._entries.move_to_end(key)
+        return True, result
+
+    def _set(self, key: Hashable, result: Any) -> None:
+        self._entries[key] = (time.monotonic() + self.ttl, result)
+        self._entries.move_to_end(key)
+        while len(self._entries) > self.max_size:
+            self._entries.popitem(last=False)
+
+    async def _execute(self, key: Hashable, call: Callable) -> Any:
+        try:
+            result = await call()
+            self._set(key, result)
+            return result
+        finally:
+            self._in_flight.pop(key, None)
+
+    @staticmethod
+    def _retrieve_failure(task: asyncio.Task) -> None:
+        # Every caller may be cancelled before the execution fails, its failure is retrieved here so it is never
+        # reported as a task exception which was never retrieved
+        if not task.cancelled() and task.exception() is not None:
+            logger.debug(f'Shared tool execution failed: {task.exception()}')
+
+    async def call(self, key: Hashable, call: Callable) -> Any:
+        hit, result = self._get(key)
+        if hit:
+            return result
+        task = self._in_flight.get(key)
+        if task is None:
+            task = asyncio.create_task(self._execute(key, call))
+            task.add_done_callback(self._retrieve_failure)
+            self._in_flight[key] = task
+        # A cancelled caller leaves the execution running for the other callers of the same arguments
+        return await asyncio.shield(task)
+
+    def clear(self) -> None:
+        self._entries.clear()
+
+
+def _default_cache_key(**arguments) -> str:
+    return json.dumps(arguments, sort_keys=True, default=repr)
+
+
+def _cached(
+        func: Callable,
+        *,
+        cache_ttl: float,
+        cache_key: Callable[..., Hashable] | None,
+        cache_size: int
+) -> Callable:
+    signature = inspect.signature(func)
+    is_method = next(iter(signature.parameters), None) == 'self'
+    make_key = cache_key or _default_cache_key
+    # Handler methods cache per handler instance, as handlers differ in credentials and configuration
+    caches: weakref.WeakKeyDictionary[Any, _ToolResultCache] = weakref.WeakKeyDictionary()
+    shared_cache = _ToolResultCache(ttl=cache_ttl, max_size=cache_size)
 
-def tool(func):
     @functools.wraps(func)
     async def wrapper(*args, **kwargs):
-        return await func(*args, **kwargs)
-    wrapper._is_handler_tool = True
-    return wrapper
\ No newline at end of file
+        bound = signature.bind(*args, **kwargs)
+        bound.apply_defaults()
+        arguments = dict(bound.arguments)
+        cache = shared_cache
+        if is_method:
+            owner = arguments.pop('self')
+            cache = caches.get(owner)
+            if cache is None:
+                cache = caches[owner] = _ToolResultCache(ttl=cache_ttl, max_size=cache_size)
+        try:
+            key = make_key(**arguments)
+            hash(key)
+        except TypeError as ex:
+            logger.debug(f'Calling {func.__name__} uncached, its arguments have no cache key: {ex}')
+            return await func(*args, **kwargs)
+        return await cache.call(key, lambda: func(*args, **kwargs))
+
+    def cache_clear() -> None:
+        shared_cache.clear()
+        for cache in list(caches.values()):
+            cache.clear()
+
+    wrapper.cache_clear = cache_clear
+    return wrapper
+
+
+def tool(
+        func: Callable | None = None,
+        *,
+        cache_ttl: float | None = None,
+        cache_key: Callable[..., Hashable] | None = None,
+        cache_size: int = 256
+):
+    """
+    Marks a handler method as a tool of the handler, which engines expose to the LLM.
+
+    Idempotent tools, e.g. search, quotes or spec lookups, can declare `cache_ttl` to serve repeated calls with the
+    same arguments from a cache, whether the calls come from an `Engine`, a `TaskEngine` or any other caller. Concurrent
+    calls with the same arguments share a single execution, failures are not cached, and a cached result is returned
+    to every caller as is, so it should not be mutated.
+
+    Args:
+        func: The tool, when used as `@tool` without arguments.
+        cache_ttl: Seconds a result is served from the cache. Default `None`, which does not cache.
+        cache_key: Builds the cache key from the tool arguments, passed by keyword without `self`, e.g.
+            `lambda query, **_: query.casefold()`. Default, the JSON form of all the arguments.
+        cache_size: Maximum number of cached results per handler, the least recently used results are evicted first.
+            Default `256`
+    """
+    if cache_ttl is not None and cache_ttl <= 0:
+        raise ValueError(f'cache_ttl must be greater than 0, got {cache_ttl}')
+    if cache_size < 1:
+        raise ValueError(f'cache_size must be greater than 0, got {cache_size}')
+
+    def decorator(_func: Callable) -> Callable:
+        if cache_ttl is not None:
+            wrapper = _cached(_func, cache_ttl=cache_ttl, cache_key=cache_key, cache_size=cache_size)
+        else:
+            @functools.wraps(_func)
+            async def wrapper(*args, **kwargs):
+                return await _func(*args, **kwargs)
+        wrapper._is_handler_tool = True
+        return wrapper
+
+    if func is not None:
+        return decorator(func)
+    return decorator
@@ -1,18 +1,23 @@
+import asyncio
 import inspect
 import logging
 import re
 import tempfile
+import time
 from contextlib import AsyncExitStack
+from dataclasses import dataclass, field
 from typing import Any, List, Optional, Callable
 
 from mcp import StdioServerParameters, ClientSession
 from mcp.client.stdio import stdio_client
 from mcp.client.sse import sse_client
-from mcp.types import ListToolsResult, Tool
+from mcp.types import CallToolResult, ServerNotification, Tool, ToolListChangedNotification
 
 from superagentx.handler.base import BaseHandler
 from superagentx.handler.decorators import tool
+from superagentx.handler.mcp_pool import MCPSessionPool
 from superagentx.utils.helper import sync_to_async
+from superagentx.utils.tool_schema import provider_format
 
 logger = logging.getLogger(__name__)
 
@@ -82,6 +87,15 @@ async def create_function_from_tool(mcp_tool: Tool) -> Callable:
     return template_func
 
 
+@dataclass
+class _ToolCatalog:
+    """The tools listed by the MCP server, with their generated callables and the schemas per provider format."""
+    tools: list[Tool]
+    funcs: list[Callable]
+    listed_at: float = field(default_factory=time.monotonic)
+    schemas: dict[type, list[dict]] = field(default_factory=dict)
+
+
 # MCPHandler: Handles dynamic tool registration
 class MCPHandler(BaseHandler):
     __type__ = "MCP"
@@ -93,6 +107,9 @@ class MCPHandler(BaseHandler):
             sse_url: str | None = None,
             headers: dict[str, str] | None = None,
             env: dict[str, str] | None = None,
+            pool_size: int = 1,
+            health_check_interval: float = 30,
+            tools_cache_ttl: float | None = 300,
             **kwargs
     ):
         """
@@ -103,6 +120,11 @@ class MCPHandler(BaseHandler):
         :param sse_url: Optional Server-Sent Events (SSE) URL for streaming.
         :param headers: Optional HTTP headers to include in the request.
         :param env: Optional environment variables to set when running the server.
+        :param pool_size: Maximum number of sessions kept open to the server, shared by every engine run using this
+            handler. Concurrent runs call the server over separate sessions.
+        :param health_check_interval: Seconds an idle session is reused without pinging the server first.
+        :param tools_cache_ttl: Seconds the tool catalog of the server is reused before it is listed again. The catalog
+            is also listed again when the server notifies that its tools changed. `None` keeps it until then.
         """
         super().__init__(**kwargs)
 
@@ -130,6 +152,107 @@ class MCPHandler(BaseHandler):
         # Internal context for managing streams (used later for tracking I/O)
         self._streams_context = None
 
+        # Warm sessions shared across engine runs
+        self.pool = MCPSessionPool(
+            self._open_session,
+            size=pool_size,
+            health_check_interval=health_check_interval
+        )
+
+        # Tool catalog of the server, listed once and shared by every engine run
+        self.tools_cache_ttl: float | None = tools_cache_ttl
+        self._catalog: _ToolCatalog | None = None
+        self._catalog_lock = asyncio.Lock()
+        # Bumped on invalidation, so a listing which raced a change notification is not cached
+        self._catalog_version = 0
+
+    def _validate_transport(self) -> None:
+        if self.sse_url:
+            # Validate SSE URL using a simple HTTP/HTTPS regex
+            if not re.match(r"^https?://", self.sse_url):
+                raise ValueError(f"Invalid SSE URL: {self.sse_url}")
+            self.sse_transport = True  # Set True for SSE Transport, if valid SSE URL
+        elif not self.command:
+            raise ValueError(f"Invalid MCP Command or SSE URL. Either of one should be used!!!")
+
+    async def _open_session(self, stack: AsyncExitStack) -> ClientSession:
+        """
+        Opens a session of the pool, its transport and session are entered into the given exit stack.
+        """
+        self._validate_transport()
+        if self.sse_transport:
+            logger.debug(f"Connecting to SSE MCP server at {self.sse_url}")
+            streams = await stack.enter_async_context(sse_client(url=self.sse_url, headers=self.headers))
+        else:
+            logger.debug(f"Connecting to Stdio MCP server with command {self.command} args: {self.mcp_args}")
+            server_params = StdioServerParameters(command=self.command, args=self.mcp_args, env=self.env)
+            streams = await stack.enter_async_context(stdio_client(server_params))
+        session = await stack.enter_async_context(
+            ClientSession(*streams, message_handler=self._on_server_message)
+        )
+        await session.initialize()
+        return session
+
+    async def _on_server_message(self, message: Any) -> None:
+        if isinstance(message, ServerNotification) and isinstance(message.root, ToolListChangedNotification):
+            logger.debug('MCP server tools changed, dropping the tool catalog')
+            self.invalidate_tools()
+
+    def invalidate_tools(self) -> None:
+        """
+        Drops the cached tool catalog, the next engine run lists the tools of the server again.
+        """
+        self._catalog = None
+        self._catalog_version += 1
+
+    def _catalog_fresh(self) -> bool:
+        if self._catalog is None:
+            return False
+        return self.tools_cache_ttl is None or time.monotonic() - self._catalog.listed_at < self.tools_cache_ttl
+
+    async def _list_tools(self) -> list[Tool]:
+        tools: list[Tool] = []
+        cursor = None
+        while True:
+            result = await self.pool.run(lambda session: session.list_tools(cursor), idempotent=True)
+            tools.extend(result.tools)
+            cursor = result.nextCursor
+            if not cursor:
+                return tools
+
+    async def _tool_catalog(self) -> _ToolCatalog:
+        if self._catalog_fresh():
+            return self._catalog
+        async with self._catalog_lock:
+            # Concurrent runs wait for a single listing
+            if self._catalog_fresh():
+                return self._catalog
+            version = self._catalog_version
+            tools = await self._list_tools()
+            catalog = _ToolCatalog(
+                tools=tools,
+                funcs=[await create_function_from_tool(mcp_tool) for mcp_tool in tools]
+            )
+            if version == self._catalog_version:
+                self._catalog = catalog
+            logger.debug(f'Listed {len(tools)} MCP tool(s)')
+            return catalog
+
+    async def call_tool(
+            self,
+            name: str,
+            arguments: dict[str, Any] | None = None
+    ) -> CallToolResult:
+        """
+        Calls a tool of the MCP server over a pooled session. A tool call is never sent twice, as the server may have
+        run it before the session was lost, so a lost session raises and the next call uses a new session.
+
+        :param name: The tool name.
+        :param arguments: The tool arguments.
+        :return: The result of the tool call.
+        """
+        return await self.pool.run(lambda session: session.call_tool(name, arguments=arguments or {}))
+
     async def connect_to_mcp_server(self) -> ClientSession:
         """
         Establishes a connection to the MCP server using stdio transport.
@@ -185,29 +308,31 @@ class MCPHandler(BaseHandler):
 
         :return: A list of callable functions based on MCP tool definitions.
         """
-        logger.debug(f"SSE MCP server at {self.sse_url}")
-        if self.sse_url:
-            # Validate SSE URL using a simple HTTP/HTTPS regex
-            if not re.match(r"^https?://", self.sse_url):
-                raise ValueError(f"Invalid SSE URL: {self.sse_url}")
-            self.sse_transport = True  # Set True for SSE Transport, if valid SSE URL
-            await self.connect_to_mcp_sse_server()
-        elif self.command:
-            await self.connect_to_mcp_server()
-        else:
-            raise ValueError(f"Invalid MCP Command or SSE URL. Either of one should be used!!!")
+        self._validate_transport()
+        catalog = await self._tool_catalog()
+        return list(catalog.funcs)
 
-        tools_response: ListToolsResult = await self.session.list_tools()
-        generated_funcs = [
-            await create_function_from_tool(mcp_tool) for mcp_tool in tools_response.tools
-        ]
+    async def get_mcp_tool_schemas(self, llm: Any) -> list[dict]:
+        """
+        Tool schemas of the MCP server tools in the format of the LLM provider, built once per catalog and format.
 
-        await self.cleanup()
-        return generated_funcs
+        :param llm: The LLM client, its provider client decides the schema format.
+        :return: A list of tool schemas, in the order listed by the server.
+        """
+        self._validate_transport()
+        catalog = await self._tool_catalog()
+        key = provider_format(llm)
+        schemas = catalog.schemas.get(key)
+        if schemas is None:
+            schemas = [await llm.get_tool_json(func=func) for func in catalog.funcs]
+            catalog.schemas[key] = schemas
+        return list(schemas)
 
     async def cleanup(self):
         """
-        Clean up resources and close sessions.
+        Clean up resources and close sessions, including the pooled sessions.
         """
+        await self.pool.close()
+        self.invalidate_tools()
         await self.exit_stack.aclose()
         logger.debug(f"Session Cleanup Completed!!!")
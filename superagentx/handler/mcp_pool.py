@@ -0,0 +1,190 @@
+import asyncio
+import logging
+import time
+from collections.abc import AsyncIterator, Awaitable, Callable
+from contextlib import AsyncExitStack, asynccontextmanager
+
+import anyio
+from mcp import ClientSession
+from mcp.shared.exceptions import McpError
+from mcp.types import CONNECTION_CLOSED
+
+logger = logging.getLogger(__name__)
+
+# Opens the transport and the session within the given exit stack and returns the initialized session
+SessionFactory = Callable[[AsyncExitStack], Awaitable[ClientSession]]
+
+_CONNECTION_ERRORS = (
+    anyio.ClosedResourceError,
+    anyio.BrokenResourceError,
+    anyio.EndOfStream,
+    ConnectionError,
+    EOFError
+)
+
+
+def is_connection_error(exc: BaseException) -> bool:
+    """Whether the error means the session is lost, as opposed to an error returned by the MCP server."""
+    if isinstance(exc, McpError):
+        return exc.error.code == CONNECTION_CLOSED
+    return isinstance(exc, _CONNECTION_ERRORS)
+
+
+class _PooledSession:
+    """
+    A session owned by its own task. The transports of the MCP client are entered and exited in the same task, so a
+    session used by many engine runs is opened and closed by this task rather than by the runs.
+    """
+
+    def __init__(self, factory: SessionFactory, generation: int):
+        self._factory = factory
+        self.generation = generation
+        self._closing = asyncio.Event()
+        self._task: asyncio.Task | None = None
+        self.session: ClientSession | None = None
+        self.checked_at = 0.0
+        self.broken = False
+
+    async def open(self) -> None:
+        ready = asyncio.get_running_loop().create_future()
+        self._task = asyncio.create_task(self._run(ready))
+        await ready
+        self.checked_at = time.monotonic()
+
+    async def _run(self, ready: asyncio.Future) -> None:
+        try:
+            async with AsyncExitStack() as stack:
+                self.session = await self._factory(stack)
+                ready.set_result(None)
+                await self._closing.wait()
+        except BaseException as ex:
+            self.broken = True
+            if not ready.done():
+                ready.set_exception(ex)
+            elif not isinstance(ex, asyncio.CancelledError):
+                logger.warning(f'MCP session closed: {ex}')
+
+    @property
+    def alive(self) -> bool:
+        return not self.broken and self._task is not None and not self._task.done()
+
+    async def close(self) -> None:
+        self._closing.set()
+        if self._task is not None:
+            await asyncio.gather(self._task, return_exceptions=True)
+
+
+class MCPSessionPool:
+    """
+    Pool of warm MCP client sessions, shared by the engine runs using the same MCP server.
+
+    Up to `size` sessions are opened on demand and kept open between runs, so a stdio server is not spawned again for
+    every request, and concurrent runs call the server over separate sessions. A session idle for longer than
+    `health_check_interval` seconds is pinged before it is reused, and a lost session is replaced by a new one. Only
+    idempotent requests are sent again after a lost session, see `run`.
+    """
+
+    def __init__(
+            self,
+            factory: SessionFactory,
+            *,
+            size: int = 1,
+            health_check_interval: float = 30,
+            ping_timeout: float = 5
+    ):
+        """
+        Args:
+            factory: Opens a session within the given exit stack, see `MCPHandler`.
+            size: Maximum number of open sessions. Default `1`
+            health_check_interval: Seconds a session stays trusted without a ping. Default `30`
+            ping_timeout: Seconds a ping may take before the session is replaced. Default `5`
+        """
+        if size < 1:
+            raise ValueError(f'size must be greater than 0, got {size}')
+        self._factory = factory
+        self.size = size
+        self.health_check_interval = health_check_interval
+        self.ping_timeout = ping_timeout
+        self._idle: list[_PooledSession] = []
+        self._semaphore = asyncio.Semaphore(size)
+        # Sessions opened before the last close are closed when they are returned
+        self._generation = 0
+
+    async def _healthy(self, pooled: _PooledSession) -> bool:
+        if not pooled.alive:
+            return False
+        if time.monotonic() - pooled.checked_at < self.health_check_interval:
+            return True
+        try:
+            async with asyncio.timeout(self.ping_timeout):
+                await pooled.session.send_ping()
+        except Exception as ex:
+            logger.debug(f'MCP session failed its health check: {ex}')
+            return False
+        pooled.checked_at = time.monotonic()
+        return True
+
+    async def _checkout(self) -> _PooledSession:
+        while self._idle:
+            pooled = self._idle.pop()
+            if await self._healthy(pooled):
+                return pooled
+            await pooled.close()
+        pooled = _PooledSession(self._factory, self._generation)
+        await pooled.open()
+        logger.debug('MCP session opened')
+        return pooled
+
+    @asynccontextmanager
+    async def session(self) -> AsyncIterator[ClientSession]:
+        """
+        Borrows a session for the duration of the context. A session which lost its connection is not returned to the
+        pool, and a session whose use failed otherwise is checked before it is reused.
+        """
+        async with self._semaphore:
+            pooled = await self._checkout()
+            try:
+                yield pooled.session
+            except Exception as ex:
+                if is_connection_error(ex):
+                    pooled.broken = True
+                else:
+                    pooled.checked_at = 0.0
+                raise
+            finally:
+                if pooled.alive and pooled.generation == self._generation:
+                    self._idle.append(pooled)
+                else:
+                    await pooled.close()
+
+    async def run(
+            self,
+            func: Callable[[ClientSession], Awaitable],
+            *,
+            idempotent: bool = False
+    ):
+        """
+        Calls `func` with a borrowed session. A lost session, e.g. of a stdio server which exited, is replaced by the
+        next call either way.
+
+        Args:
+            func: Sends the request over the given session.
+            idempotent: Whether `func` may run twice, e.g. listing the tools. When the session turns out to be lost,
+                an idempotent `func` is called once more with a new session. Otherwise, the error is raised, as the
+                request may already have run on the server. Default `False`
+        """
+        try:
+            async with self.session() as session:
+                return await func(session)
+        except Exception as ex:
+            if not idempotent or not is_connection_error(ex):
+                raise
+            logger.warning(f'MCP session lost, reconnecting: {ex}')
+        async with self.session() as session:
+            return await func(session)
+
+    async def close(self) -> None:
+        """Closes the idle sessions. Sessions in use are closed when they are returned."""
+        self._generation += 1
+        idle, self._idle = self._idle, []
+        await asyncio.gather(*[pooled.close() for pooled in idle])
@@ -0,0 +1,345 @@
+import asyncio
+import logging
+import socket
+import uuid
+from typing import Any
+
+from superagentx.agent import Agent
+from superagentx.db_store import ConfigLoader, StorageAdapter
+from superagentx.db_store.sql_status_enum import JobStatus
+from superagentx.exceptions import StopSuperAgentX
+from superagentx.result import GoalResult
+
+logger = logging.getLogger(__name__)
+
+
+async def _open_storage(storage: StorageAdapter | None) -> tuple[StorageAdapter, bool]:
+    # Returns the storage and whether it is owned, so only a storage opened here is closed here
+    if storage:
+        return storage, False
+    storage = await ConfigLoader.load_db_config()
+    await storage.setup()
+    return storage, True
+
+
+def _goal_error(goal_result: GoalResult | None) -> str | None:
+    # `Agent.execute` reports most failures in its result instead of raising
+    if goal_result is None:
+        return 'Agent returned no result'
+    if goal_result.error:
+        return goal_result.error
+    if goal_result.is_goal_satisfied is False:
+        return f'Goal not satisfied: {goal_result.reason}' if goal_result.reason else 'Goal not satisfied'
+    return None
+
+
+class AgentJobQueue:
+    """
+    Admits agent executions as durable jobs of the workflow store, executed by any number of `AgentJobWorker`
+    processes.
+
+    Admission only writes a job row, so bursts of requests are queued instead of dropped, and queued jobs survive
+    restarts of the workers and of the process which submitted them.
+
+    Example:
+        async with AgentJobQueue() as queue:
+            job_id = await queue.submit(agent, query_instruction=query)
+            goal_result = await queue.result(job_id)
+    """
+
+    def __init__(
+            self,
+            *,
+            storage: StorageAdapter | None = None,
+            max_attempts: int = 3,
+            poll_interval: float = 0.5
+    ):
+        """
+        Args:
+            storage: The workflow store holding the jobs. Defaults to the store configured by `DB_PROVIDER`, a
+                local SQLite database unless configured otherwise.
+            max_attempts: Maximum number of times a job is executed before it fails. Default `3`
+            poll_interval: Seconds between polls of the store while waiting for a result. Default `0.5`
+        """
+        if max_attempts < 1:
+            raise ValueError(f'max_attempts must be greater than 0, got {max_attempts}')
+        self.storage = storage
+        self.max_attempts = max_attempts
+        self.poll_interval = poll_interval
+        self._owns_storage = False
+
+    async def __aenter__(self) -> 'AgentJobQueue':
+        await self.setup()
+        return self
+
+    async def __aexit__(self, exc_type, exc_val, exc_tb):
+        await self.close()
+
+    async def setup(self) -> None:
+        self.storage, self._owns_storage = await _open_storage(self.storage)
+
+    async def close(self) -> None:
+        if self._owns_storage:
+            storage, self.storage = self.storage, None
+            self._owns_storage = False
+            await storage.close()
+
+    async def submit(
+            self,
+            agent: Agent | str,
+            *,
+            query_instruction: str,
+            pipe_id: str | None = None,
+            pre_result: str | None = None,
+            previous_agent_result: Any = None,
+            old_memory: list[dict] | None = None,
+            verify_goal: bool = True,
+            conversation_id: str | None = None
+    ) -> str:
+        """
+        Queues an execution of the agent, with the arguments of `Agent.execute`, and returns the job id.
+
+        Args:
+            agent: The agent or its name. Workers resolve the agent by name.
+            query_instruction: A string representing the instruction or query that defines the goal to be achieved.
+            pipe_id: Pipe interface execution id. Default `None`
+            pre_result: An optional pre-computed result or state to be used during the execution. Default `None`
+            previous_agent_result: Previous Agent's result, has to be JSON serializable. Default `None`
+            old_memory: An optional previous context of the user's instruction. Default `None`
+            verify_goal: Option to enable or disable goal verification after agent execution. Default `True`
+            conversation_id: A string representing the unique identifier of the conversation. Default `None`
+
+        Returns:
+            str
+                The job id.
+        """
+        if self.storage is None:
+            raise RuntimeError('Job queue is not set up')
+        job_id = uuid.uuid4().hex
+        await self.storage.enqueue_job(
+            job_id=job_id,
+            agent_id=None if isinstance(agent, str) else agent.agent_id,
+            agent_name=agent if isinstance(agent, str) else agent.name,
+            pipe_id=pipe_id,
+            payload=dict(
+                query_instruction=query_instruction,
+                pre_result=pre_result,
+                previous_agent_result=previous_agent_result,
+                old_memory=old_memory,
+                verify_goal=verify_goal,
+                conversation_id=conversation_id
+            ),
+            max_attempts=self.max_attempts
+        )
+        return job_id
+
+    async def result(
+            self,
+            job_id: str,
+            timeout: float | None = None
+    ) -> GoalResult | None:
+        """
+        Waits for a job to finish and returns the result of the agent. A job which failed all its attempts returns
+        a GoalResult with the error of the last attempt.
+
+        Args:
+            job_id: The job id returned by `submit`.
+            timeout: Maximum seconds to wait. Default `None`
+        """
+        if self.storage is None:
+            raise RuntimeError('Job queue is not set up')
+        async with asyncio.timeout(timeout):
+            while True:
+                job = await self.storage.get_job(job_id)
+                if job is None:
+                    raise ValueError(f'Unknown job `{job_id}`')
+                if job["status"] in (JobStatus.COMPLETED, JobStatus.FAILED):
+                    break
+                await asyncio.sleep(self.poll_interval)
+
+        if job["status"] == JobStatus.FAILED:
+            return GoalResult(
+                name=job["agent_name"],
+                agent_id=job["agent_id"] or job["agent_name"],
+                error=job["error"],
+                is_goal_satisfied=False
+            )
+        if job["result_data"] is None:
+            return None
+        return GoalResult.model_validate(job["result_data"])
+
+    async def execute(
+            self,
+            agent: Agent | str,
+            *,
+            timeout: float | None = None,
+            **kwargs
+    ) -> GoalResult | None:
+        """
+        Queues an execution of the agent and waits for its result, see `submit` and `result`.
+        """
+        job_id = await self.submit(agent, **kwargs)
+        return await self.result(job_id, timeout=timeout)
+
+
+class AgentJobWorker:
+    """
+    Executes the jobs of an `AgentJobQueue` with the given agents.
+
+    A job is leased for `visibility_timeout` seconds, and the lease is renewed while the agent runs. A job whose
+    worker died becomes visible again once its lease expires, and a failed job is retried with an exponential
+    backoff until its attempts are used up.
+
+    Example:
+        worker = AgentJobWorker(agents=[search_agent, summary_agent])
+        await worker.run()
+    """
+
+    def __init__(
+            self,
+            agents: list[Agent],
+            *,
+            storage: StorageAdapter | None = None,
+            worker_id: str | None = None,
+            max_in_flight: int = 1,
+            visibility_timeout: float = 300,
+            retry_delay: float = 1,
+            poll_interval: float = 0.5
+    ):
+        """
+        Args:
+            agents: The agents this worker executes, jobs are matched by agent name. Each job runs on a copy of its
+                agent, see `Agent.clone`.
+            storage: The workflow store holding the jobs. Defaults to the store configured by `DB_PROVIDER`.
+            worker_id: Identifies the worker in the leases. Defaults to the host name and a random suffix.
+            max_in_flight: Maximum number of jobs executed at the same time. Default `1`
+            visibility_timeout: Seconds a leased job stays invisible to other workers without a lease renewal.
+                Default `300`
+            retry_delay: Seconds before the first retry of a failed job, doubled with every attempt. Default `1`
+            poll_interval: Seconds between polls of the store while no job is available. Default `0.5`
+        """
+        if max_in_flight < 1:
+            raise ValueError(f'max_in_flight must be greater than 0, got {max_in_flight}')
+        self.agents = {agent.name: agent for agent in agents}
+        self.storage = storage
+        self.worker_id = worker_id or f'{socket.gethostname()}-{uuid.uuid4().hex[:8]}'
+        self.max_in_flight = max_in_flight
+        self.visibility_timeout = visibility_timeout
+        self.retry_delay = retry_delay
+        self.poll_interval = poll_interval
+
+    async def run(
+            self,
+            stop_event: asyncio.Event | None = None
+    ) -> None:
+        """
+        Executes jobs until `stop_event` is set, then waits for the jobs in flight.
+        """
+        storage, owns_storage = await _open_storage(self.storage)
+        in_flight: set[asyncio.Task] = set()
+        try:
+            while not (stop_event and stop_event.is_set()):
+                job = None
+                if len(in_flight) < self.max_in_flight:
+                    job = await self._lease(storage)
+                if job:
+                    in_flight.add(asyncio.create_task(self._execute(storage, job)))
+                    continue
+                if in_flight:
+                    done, in_flight = await asyncio.wait(in_flight, timeout=self.poll_interval)
+                    self._log_failures(done)
+                else:
+                    await asyncio.sleep(self.poll_interval)
+            if in_flight:
+                done, _ = await asyncio.wait(in_flight)
+                self._log_failures(done)
+        finally:
+            if owns_storage:
+                await storage.close()
+
+    def _log_failures(self, tasks: set[asyncio.Task]) -> None:
+        # Jobs report their own failures, this only surfaces errors of the store itself
+        for task in tasks:
+            ex = None if task.cancelled() else task.exception()
+            if ex:
+                logger.error(f'Worker {self.worker_id} failed to record a job: {ex}', exc_info=ex)
+
+    async def run_once(self) -> bool:
+        """
+        Executes at most one job, returns whether a job was available.
+        """
+        storage, owns_storage = await _open_storage(self.storage)
+        try:
+            job = await self._lease(storage)
+            if job:
+                await self._execute(storage, job)
+            return job is not None
+        finally:
+            if owns_storage:
+                await storage.close()
+
+    async def _lease(self, storage: StorageAdapter) -> dict | None:
+        return await storage.lease_job(
+            worker_id=self.worker_id,
+            visibility_timeout=self.visibility_timeout,
+            agent_names=list(self.agents)
+        )
+
+    async def _renew(
+            self,
+            storage: StorageAdapter,
+            job_id: str
+    ) -> None:
+        while True:
+            await asyncio.sleep(self.visibility_timeout / 3)
+            if not await storage.renew_lease(job_id, self.worker_id, self.visibility_timeout):
+                logger.warning(f'Worker {self.worker_id} lost the lease of job {job_id}')
+                return
+
+    async def _execute(
+            self,
+            storage: StorageAdapter,
+            job: dict
+    ) -> None:
+        job_id = job["job_id"]
+        # Jobs in flight run on their own copies, so the run state kept on the engines is not shared
+        agent = self.agents[job["agent_name"]].clone()
+        logger.debug(f'Worker {self.worker_id} executing job {job_id}, attempt {job["attempts"]}')
+        renewer = asyncio.create_task(self._renew(storage, job_id))
+        try:
+            goal_result = await agent.execute(
+                pipe_id=job["pipe_id"],
+                **job["payload"]
+            )
+            error = _goal_error(goal_result)
+            if error is None:
+                result_data = goal_result.model_dump(mode="json", exclude_none=True, round_trip=True)
+        except StopSuperAgentX as ex:
+            # Stopped on purpose, e.g. rejected by a human, so another attempt would not change the outcome
+            logger.warning(f'Job {job_id} stopped: {ex}')
+            await storage.fail_job(job_id, self.worker_id, error=str(ex), retry=False)
+            return
+        except Exception as ex:
+            logger.error(f'Job {job_id} failed: {ex}', exc_info=True)
+            await storage.fail_job(
+                job_id,
+                self.worker_id,
+                error=str(ex),
+                retry_delay=self.retry_delay * 2 ** (job["attempts"] - 1)
+            )
+            return
+        finally:
+            renewer.cancel()
+            await asyncio.gather(renewer, return_exceptions=True)
+
+        if error:
+            logger.warning(f'Job {job_id} failed: {error}')
+            await storage.fail_job(
+                job_id,
+                self.worker_id,
+                error=error,
+                retry_delay=self.retry_delay * 2 ** (job["attempts"] - 1)
+            )
+            return
+        if not await storage.complete_job(job_id, self.worker_id, result_data):
+            logger.warning(f'Result of job {job_id} discarded, the lease expired before it completed')
@@ -1,3 +1,4 @@
+import asyncio
 import json
 import logging
 import os
@@ -11,6 +12,7 @@ from superagentx.exceptions import InvalidType
 from superagentx.llm.constants import (
     DEFAULT_OPENAI_EMBED, DEFAULT_BEDROCK_EMBED, DEFAULT_OLLAMA_EMBED, DEFAULT_EMBED, DEFAULT_GEMINI_EMBED
 )
+from superagentx.llm.limiter import llm_limiter
 from superagentx.llm.litellm import LiteLLMClient
 
 from superagentx.llm.models import ChatCompletionParams
@@ -56,6 +58,12 @@ class LLMClient:
         self.llm_config = llm_config
         self.llm_config_model = LLMModelConfig(**self.llm_config)
         self.async_mode = self.llm_config_model.async_mode
+        if self.llm_config_model.max_concurrency:
+            llm_limiter.set_limit(
+                llm_type=self.llm_config_model.llm_type,
+                model=self.llm_config_model.model,
+                max_concurrency=self.llm_config_model.max_concurrency
+            )
 
         match self.llm_config_model.llm_type:
             case LLMType.OPENAI_CLIENT | LLMType.ANTHROPIC_CLIENT | LLMType.DEEPSEEK | LLMType.ROUTEWAY:
@@ -220,20 +228,28 @@ class LLMClient:
             chat_completion_params=chat_completion_params
         )
 
+    def _limit(self):
+        return llm_limiter.acquire(
+            llm_type=self.llm_config_model.llm_type,
+            model=self.llm_config_model.model
+        )
+
     async def achat_completion(
             self,
             *,
-            chat_completion_params: ChatCompletionParams
+            chat_completion_params: ChatCompletionParams,
+            deadline: float | None = None
     ) -> ChatCompletion:
-        if self.async_mode:
-            return await self.client.achat_completion(
-                chat_completion_params=chat_completion_params
-            )
-        else:
-            return await sync_to_async(
-                self.client.chat_completion,
-                chat_completion_params=chat_completion_params
-            )
+        async with asyncio.timeout_at(deadline), self._limit():
+            if self.async_mode:
+                return await self.client.achat_completion(
+                    chat_completion_params=chat_completion_params
+                )
+            else:
+                return await sync_to_async(
+                    self.client.chat_completion,
+                    chat_completion_params=chat_completion_params
+                )
 
     async def get_tool_json(
             self,
@@ -257,24 +273,27 @@ class LLMClient:
             self,
             *,
             text: str,
+            deadline: float | None = None,
             **kwargs
     ):
-        if self.async_mode:
-            return await self.client.aembed(
-                text,
-                **kwargs
-            )
-        else:
-            return await sync_to_async(
-                self.client.embed,
-                text,
-                **kwargs
-            )
+        async with asyncio.timeout_at(deadline), self._limit():
+            if self.async_mode:
+                return await self.client.aembed(
+                    text,
+                    **kwargs
+                )
+            else:
+                return await sync_to_async(
+                    self.client.embed,
+                    text,
+                    **kwargs
+                )
 
     async def afunc_chat_completion(
             self,
             *,
-            chat_completion_params: ChatCompletionParams
+            chat_completion_params: ChatCompletionParams,
+            deadline: float | None = None
     ) -> List[Message]:
 
         stream = bool(chat_completion_params.stream)
@@ -286,15 +305,16 @@ class LLMClient:
             )
             chat_completion_params.stream = False
 
-        if self.async_mode:
-            response: ChatCompletion = await self.client.achat_completion(
-                chat_completion_params=chat_completion_params
-            )
-        else:
-            response: ChatCompletion = await sync_to_async(
-                self.client.chat_completion,
-                chat_completion_params=chat_completion_params
-            )
+        async with asyncio.timeout_at(deadline), self._limit():
+            if self.async_mode:
+                response: ChatCompletion = await self.client.achat_completion(
+                    chat_completion_params=chat_completion_params
+                )
+            else:
+                response: ChatCompletion = await sync_to_async(
+                    self.client.chat_completion,
+                    chat_completion_params=chat_completion_params
+                )
         # List to store multiple Message instances
         message_instances = []
 
@@ -305,6 +325,7 @@ class LLMClient:
                 if choice.message.tool_calls:
                     tool_calls_data = [
                         Tool(
+                            id=tool_call.id,
                             tool_type=tool_call.type,
                             name=tool_call.function.name,
                             arguments=json.loads(tool_call.function.arguments)  # Use json.loads for safer parsing
@@ -0,0 +1,107 @@
+import asyncio
+import logging
+import weakref
+from contextlib import AsyncExitStack, asynccontextmanager
+
+logger = logging.getLogger(__name__)
+
+
+class LLMConcurrencyLimiter:
+    """
+    Process-wide limiter which bounds the number of in-flight LLM requests per provider and per model.
+
+    Every `LLMClient` request goes through the shared `llm_limiter` instance, so parallel agents and engines using
+    the same provider are throttled together. A limit registered without a model applies to all models of the
+    provider, a limit registered with a model applies only to that model. When both are set, a request has to
+    acquire both.
+
+    Example:
+        llm_limiter.set_limit(llm_type='openai', max_concurrency=20)
+        llm_limiter.set_limit(llm_type='openai', model='gpt-4o', max_concurrency=8)
+    """
+
+    def __init__(self):
+        self._limits: dict[tuple[str | None, str | None], int] = {}
+        # Semaphores are bound to an event loop, keep one set per running loop
+        self._semaphores: weakref.WeakKeyDictionary[
+            asyncio.AbstractEventLoop, dict[tuple[str | None, str | None], asyncio.Semaphore]
+        ] = weakref.WeakKeyDictionary()
+
+    @staticmethod
+    def _key(
+            llm_type: str | None,
+            model: str | None
+    ) -> tuple[str | None, str | None]:
+        return str(llm_type.value if hasattr(llm_type, 'value') else llm_type) if llm_type else None, model
+
+    def set_limit(
+            self,
+            *,
+            llm_type: str | None,
+            model: str | None = None,
+            max_concurrency: int | None = None
+    ) -> None:
+        """
+        Registers the maximum number of concurrent requests for a provider or a provider model.
+
+        Args:
+            llm_type: LLM provider type, e.g. `openai`, `bedrock`.
+            model: Optional model name. If not provided, the limit applies to the whole provider.
+            max_concurrency: Maximum number of in-flight requests. `None` or `0` removes the limit.
+        """
+        key = self._key(llm_type, model)
+        if max_concurrency:
+            if max_concurrency < 1:
+                raise ValueError(f'max_concurrency must be greater than 0, got {max_concurrency}')
+            self._limits[key] = max_concurrency
+            logger.debug(f'LLM concurrency limit for {key} set to {max_concurrency}')
+        else:
+            self._limits.pop(key, None)
+        # Limit changed, the next acquire creates fresh semaphores
+        for semaphores in self._semaphores.values():
+            semaphores.pop(key, None)
+
+    def get_limit(
+            self,
+            *,
+            llm_type: str | None,
+            model: str | None = None
+    ) -> int | None:
+        return self._limits.get(self._key(llm_type, model))
+
+    def _semaphore(
+            self,
+            key: tuple[str | None, str | None]
+    ) -> asyncio.Semaphore | None:
+        limit = self._limits.get(key)
+        if not limit:
+            return None
+        semaphores = self._semaphores.setdefault(asyncio.get_running_loop(), {})
+        if key not in semaphores:
+            semaphores[key] = asyncio.Semaphore(limit)
+        return semaphores[key]
+
+    @asynccontextmanager
+    async def acquire(
+            self,
+            *,
+            llm_type: str | None,
+            model: str | None = None
+    ):
+        """
+        Waits until a request slot is available for the given provider and model.
+        """
+        provider_key = self._key(llm_type, None)
+        keys = [provider_key]
+        if model:
+            keys.append(self._key(llm_type, model))
+
+        async with AsyncExitStack() as stack:
+            for key in keys:
+                semaphore = self._semaphore(key)
+                if semaphore:
+                    await stack.enter_async_context(semaphore)
+            yield
+
+
+llm_limiter = LLMConcurrencyLimiter()
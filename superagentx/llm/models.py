@@ -16,6 +16,14 @@ class Message(BaseModel):
         description='Messages can also contain an optional name field, which give the messenger a name',
         default=None
     )
+    tool_calls: list[dict] | None = Field(
+        description='The tool calls of an assistant message, sent back along with their results',
+        default=None
+    )
+    tool_call_id: str | None = Field(
+        description='The id of the tool call a tool message answers',
+        default=None
+    )
 
 
 class ChatCompletionParams(BaseModel):
@@ -44,3 +44,8 @@ class LLMModelConfig(BaseModel):
         description='Embedding model name, supported models openai, azure-openai, mistral, llama 3.1',
         default=None
     )
+
+    max_concurrency: int | None = Field(
+        description='Maximum number of in-flight requests shared by all clients of this provider and model',
+        default=None
+    )
@@ -5,6 +5,11 @@ from pydantic import BaseModel, Field
 
 
 class Tool(BaseModel):
+    id: str | None = Field(
+        default=None,
+        description="The id of the tool call, referenced by the tool result sent back to the model."
+    )
+
     name: str = Field(
         ...,
         description="The name of the function to call."
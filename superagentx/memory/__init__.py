@@ -51,6 +51,21 @@ class Memory(MemoryBase):
             await db.add_history(*args, **kwargs)
         await self._add_to_vector_store(*args, **kwargs)
 
+    @final
+    async def add_many(self, items: list[dict]):
+        if not items:
+            return
+        # One database connection and one vector store insert for the whole batch
+        async with self.db as db:
+            async for item in iter_to_aiter(items):
+                await db.add_history(**item)
+        payloads = [await self._vector_payload(**item) async for item in iter_to_aiter(items)]
+        await self.vector_db.insert(
+            texts=[payload["data"] for payload in payloads],
+            payloads=payloads,
+            ids=[payload["message_id"] for payload in payloads]
+        )
+
     @final
     async def get(self, *args, **kwargs):
         async with self.db as db:
@@ -155,8 +170,16 @@ class Memory(MemoryBase):
         ]
         return original_memories
 
-    async def _add_to_vector_store(
-            self,
+    async def _add_to_vector_store(self, **kwargs):
+        metadata = await self._vector_payload(**kwargs)
+        await self.vector_db.insert(
+            texts=[metadata["data"]],
+            payloads=metadata,
+            ids=[metadata["message_id"]]
+        )
+
+    @staticmethod
+    async def _vector_payload(
             *,
             memory_id: str,
             conversation_id: str,
@@ -190,11 +213,7 @@ class Memory(MemoryBase):
         metadata["created_at"] = created_at
         metadata["updated_at"] = updated_at
         metadata["is_deleted"] = is_deleted
-        await self.vector_db.insert(
-            texts=[data],
-            payloads=metadata,
-            ids=[message_id]
-        )
+        return metadata
 
     async def delete_by_conversation_id(self, **kwargs):
         await self.vector_db.delete_by_conversation_id(**kwargs)
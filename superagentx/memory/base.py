@@ -31,6 +31,13 @@ class MemoryBase(ABC):
         """
         raise NotImplementedError
 
+    async def add_many(self, items: list[dict]):
+        """
+        Add several items at once. Each item holds the keyword arguments of `add`.
+        """
+        for item in items:
+            await self.add(**item)
+
     @abstractmethod
     async def get(self, memory_id):
         """
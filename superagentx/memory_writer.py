@@ -0,0 +1,86 @@
+import asyncio
+import logging
+from typing import Any
+
+logger = logging.getLogger(__name__)
+
+# Closes the writer once the items queued before it are written
+_CLOSE = object()
+
+
+class MemoryWriter:
+    """
+    Writes memory items in the background, so the caller never waits on the memory store.
+
+    Items queued while a batch is being written are written together as the next batch, with one `add_many` call
+    on memories which support it.
+
+    Example:
+        writer = MemoryWriter(memory)
+        writer.add(memory_id=memory_id, conversation_id=conversation_id, ...)
+        await writer.close()
+    """
+
+    def __init__(
+            self,
+            memory: Any,
+            *,
+            max_batch_size: int = 32
+    ):
+        """
+        Args:
+            memory: The memory the items are written to.
+            max_batch_size: Maximum number of items written in one batch. Default `32`
+        """
+        if max_batch_size < 1:
+            raise ValueError(f'max_batch_size must be greater than 0, got {max_batch_size}')
+        self.memory = memory
+        self.max_batch_size = max_batch_size
+        self._queue: asyncio.Queue = asyncio.Queue()
+        self._task: asyncio.Task | None = None
+
+    def add(self, **item) -> None:
+        """
+        Queues an item, holding the keyword arguments of the `add` method of the memory.
+        """
+        if self._task is None:
+            self._task = asyncio.create_task(self._run())
+        self._queue.put_nowait(item)
+
+    async def close(self) -> None:
+        """
+        Waits until every queued item is written and stops the writer.
+        """
+        if self._task is None:
+            return
+        self._queue.put_nowait(_CLOSE)
+        task, self._task = self._task, None
+        await task
+
+    async def _run(self) -> None:
+        closing = False
+        while not closing:
+            item = await self._queue.get()
+            if item is _CLOSE:
+                break
+            batch = [item]
+            while len(batch) < self.max_batch_size and not self._queue.empty():
+                item = self._queue.get_nowait()
+                if item is _CLOSE:
+                    closing = True
+                    break
+                batch.append(item)
+            try:
+                await self._write(batch)
+            except Exception as ex:
+                # A failed write must not stop the items queued after it
+                logger.warning(f'Failed to write {len(batch)} memory item(s): {ex}', exc_info=True)
+
+    async def _write(self, batch: list[dict]) -> None:
+        logger.debug(f'Writing {len(batch)} memory item(s)')
+        add_many = getattr(self.memory, 'add_many', None)
+        if add_many:
+            await add_many(batch)
+        else:
+            for item in batch:
+                await self.memory.add(**item)
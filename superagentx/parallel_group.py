@@ -0,0 +1,114 @@
+import logging
+import typing
+
+from superagentx.result import GoalResult
+
+if typing.TYPE_CHECKING:
+    from superagentx.agent import Agent
+
+logger = logging.getLogger(__name__)
+
+
+class CompletionPolicy:
+    """
+    Decides when a parallel group of agents is complete. Once the policy is met, the agents of the group which are
+    still running are cancelled.
+
+    Example:
+        CompletionPolicy.all()
+        CompletionPolicy.first_satisfied()
+        CompletionPolicy.quorum(2)
+        CompletionPolicy.fastest_k(3)
+    """
+    ALL = 'all'
+    FIRST_SATISFIED = 'first_satisfied'
+    QUORUM = 'quorum'
+    FASTEST_K = 'fastest_k'
+
+    def __init__(
+            self,
+            mode: str = ALL,
+            count: int | None = None
+    ):
+        """
+        Args:
+            mode: One of `all`, `first_satisfied`, `quorum` or `fastest_k`.
+            count: Number of results the `quorum` and `fastest_k` modes wait for.
+        """
+        if mode not in (self.ALL, self.FIRST_SATISFIED, self.QUORUM, self.FASTEST_K):
+            raise ValueError(f'Unknown completion policy `{mode}`')
+        if mode in (self.QUORUM, self.FASTEST_K) and (not count or count < 1):
+            raise ValueError(f'Completion policy `{mode}` requires a count greater than 0, got {count}')
+        self.mode = mode
+        self.count = count
+
+    def __repr__(self):
+        if self.count:
+            return f'<CompletionPolicy {self.mode}({self.count})>'
+        return f'<CompletionPolicy {self.mode}>'
+
+    @classmethod
+    def all(cls) -> 'CompletionPolicy':
+        """Waits for every agent of the group."""
+        return cls(cls.ALL)
+
+    @classmethod
+    def first_satisfied(cls) -> 'CompletionPolicy':
+        """Completes with the first agent whose goal is satisfied."""
+        return cls(cls.FIRST_SATISFIED)
+
+    @classmethod
+    def quorum(cls, n: int) -> 'CompletionPolicy':
+        """Completes as soon as `n` agents satisfied their goal."""
+        return cls(cls.QUORUM, n)
+
+    @classmethod
+    def fastest_k(cls, k: int) -> 'CompletionPolicy':
+        """Completes with the first `k` agents which return a result, satisfied or not."""
+        return cls(cls.FASTEST_K, k)
+
+    @staticmethod
+    def is_satisfied(result: GoalResult) -> bool:
+        # Results of agents without goal verification count as satisfied
+        return bool(result.is_goal_satisfied) or (not result.verify_goal and not result.error)
+
+    def is_met(
+            self,
+            results: list[GoalResult]
+    ) -> bool:
+        """
+        Whether the group is complete with the given results, in completion order.
+        """
+        match self.mode:
+            case self.FIRST_SATISFIED:
+                return any(self.is_satisfied(result) for result in results)
+            case self.QUORUM:
+                return sum(self.is_satisfied(result) for result in results) >= self.count
+            case self.FASTEST_K:
+                return len(results) >= self.count
+        return False
+
+
+class ParallelGroup(list):
+    """
+    A list of agents executed in parallel, with the completion policy of the group.
+
+    Plain lists of agents keep working as parallel groups and use the completion policy of the pipe.
+
+    Example:
+        pipe = AgentXPipe(
+            agents=[
+                ParallelGroup([search_1, search_2, search_3], completion_policy=CompletionPolicy.first_satisfied()),
+                summary_agent
+            ]
+        )
+    """
+
+    def __init__(
+            self,
+            agents: typing.Iterable['Agent'] = (),
+            *,
+            completion_policy: CompletionPolicy | None = None
+    ):
+        super().__init__(agents)
+        self.completion_policy = completion_policy
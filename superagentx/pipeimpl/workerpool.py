@@ -0,0 +1,316 @@
+import asyncio
+import inspect
+import logging
+import multiprocessing
+import os
+import uuid
+from collections.abc import Awaitable, Callable
+
+from superagentx.agentxpipe import AgentXPipe
+from superagentx.db_store import ConfigLoader, StorageAdapter
+from superagentx.db_store.sql_status_enum import PipeStatus
+from superagentx.result import GoalResult
+
+logger = logging.getLogger(__name__)
+
+PipeFactory = Callable[[], AgentXPipe | Awaitable[AgentXPipe]]
+
+
+class WorkerPoolPipe:
+
+    def __init__(
+            self,
+            *,
+            pipe_factory: PipeFactory,
+            workers: int | None = None,
+            max_in_flight: int = 1,
+            verify_goal: bool = True,
+            poll_interval: float = 0.5,
+            max_restarts: int = 3
+    ):
+        """
+        Distributes the flows of a pipe across worker processes, so CPU heavy work of concurrent flows runs on all
+        cores instead of one event loop.
+
+        The workers coordinate through the workflow store configured by `DB_PROVIDER`, which holds the queued runs
+        and their results. Every queued run is claimed by exactly one worker and executed as a resumable pipe run,
+        so a run of a worker process which died is queued again and resumes from its completed agents.
+
+        Args:
+            pipe_factory: A module level function which builds the `AgentXPipe` in each worker process. The pipe has
+                to be created with `workflow_store=True`. It is pickled to the workers, so closures and lambdas are
+                not supported.
+            workers: Number of worker processes. Defaults to the number of CPUs.
+            max_in_flight: Maximum number of flows running at the same time in each worker. Default `1`
+            verify_goal: Option to enable or disable goal verification after agent execution. Default `True`
+            poll_interval: Seconds between polls of the workflow store for queued runs and results. Default `0.5`
+            max_restarts: Maximum number of times a worker which died is restarted. Default `3`
+        """
+        workers = workers or os.cpu_count() or 1
+        if workers < 1:
+            raise ValueError(f'workers must be greater than 0, got {workers}')
+        if max_in_flight < 1:
+            raise ValueError(f'max_in_flight must be greater than 0, got {max_in_flight}')
+        self.pipe_factory = pipe_factory
+        self.workers = workers
+        self.max_in_flight = max_in_flight
+        self.verify_goal = verify_goal
+        self.poll_interval = poll_interval
+        self.max_restarts = max_restarts
+        self.pool_id = uuid.uuid4().hex
+        self._context = multiprocessing.get_context('spawn')
+        self._stop_event = self._context.Event()
+        self._processes: dict[str, multiprocessing.Process] = {}
+        self._restarts: dict[str, int] = {}
+        self._storage: StorageAdapter | None = None
+        self._supervisor: asyncio.Task | None = None
+
+    async def __aenter__(self) -> 'WorkerPoolPipe':
+        await self.start()
+        return self
+
+    async def __aexit__(self, exc_type, exc_val, exc_tb):
+        await self.close()
+
+    async def start(self) -> None:
+        """
+        Sets up the workflow store and starts the worker processes.
+        """
+        self._storage = await ConfigLoader.load_db_config()
+        await self._storage.setup()
+        self._stop_event.clear()
+        self._restarts.clear()
+        for index in range(self.workers):
+            self._spawn(f'{self.pool_id}-{index}')
+        self._supervisor = asyncio.create_task(self._supervise())
+        logger.info(f'Worker pool {self.pool_id} started with {self.workers} workers')
+
+    async def submit(
+            self,
+            query_instruction: str,
+            conversation_id: str | None = None
+    ) -> str:
+        """
+        Queues a flow and returns its run id without waiting for it.
+
+        Args:
+            query_instruction: A string representing the instruction or query that defines the goal to be achieved.
+            conversation_id: A string representing the unique identifier of the conversation. Default `None`
+
+        Returns:
+            str
+                The run id, which identifies the run in the workflow store and in `result`.
+        """
+        self._ensure_started()
+        pipe_id = uuid.uuid4().hex
+        await self._storage.enqueue_pipe(
+            pipe_id=pipe_id,
+            input_query=query_instruction,
+            conversation_id=conversation_id
+        )
+        return pipe_id
+
+    async def result(
+            self,
+            pipe_id: str,
+            timeout: float | None = None
+    ) -> list[GoalResult]:
+        """
+        Waits for a queued run to finish and returns its results.
+
+        Args:
+            pipe_id: The run id returned by `submit`.
+            timeout: Maximum seconds to wait. Default `None`
+
+        Returns:
+            list[GoalResult]
+                The results of the agents of the run, in completion order.
+        """
+        self._ensure_started()
+        async with asyncio.timeout(timeout):
+            while True:
+                status = await self._storage.get_pipe_status(pipe_id)
+                if status is None:
+                    raise ValueError(f'Unknown run `{pipe_id}`')
+                if status in (PipeStatus.COMPLETED, PipeStatus.FAILED):
+                    break
+                if not self._processes:
+                    raise RuntimeError(f'No worker of pool {self.pool_id} is running')
+                await asyncio.sleep(self.poll_interval)
+        results = await self._storage.get_completed_agents(pipe_id)
+        return [GoalResult.model_validate(result_data) for result_data in results.values()]
+
+    async def flow(
+            self,
+            query_instruction: str,
+            conversation_id: str | None = None,
+            timeout: float | None = None
+    ) -> list[GoalResult]:
+        """
+        Runs a flow on one of the workers and returns its results, like `AgentXPipe.flow`.
+
+        Args:
+            query_instruction: A string representing the instruction or query that defines the goal to be achieved.
+            conversation_id: A string representing the unique identifier of the conversation. Default `None`
+            timeout: Maximum seconds to wait for the result. Default `None`
+
+        Returns:
+            list[GoalResult]
+                The results of the agents of the run.
+        """
+        pipe_id = await self.submit(
+            query_instruction=query_instruction,
+            conversation_id=conversation_id
+        )
+        return await self.result(pipe_id, timeout=timeout)
+
+    async def close(
+            self,
+            timeout: float = 30
+    ) -> None:
+        """
+        Stops the workers once their in-flight flows are finished. Workers which do not stop within `timeout`
+        seconds are terminated, and their runs are queued again for the next pool.
+        """
+        if self._supervisor:
+            self._supervisor.cancel()
+            await asyncio.gather(self._supervisor, return_exceptions=True)
+            self._supervisor = None
+        self._stop_event.set()
+        for worker_id, process in self._processes.items():
+            await asyncio.to_thread(process.join, timeout)
+            if process.is_alive():
+                logger.warning(f'Worker {worker_id} did not stop in time, terminating it')
+                process.terminate()
+                await asyncio.to_thread(process.join)
+            await self._release(worker_id)
+        self._processes.clear()
+        if self._storage:
+            storage, self._storage = self._storage, None
+            try:
+                await storage.close()
+            except Exception as e:
+                logger.warning(f"Failed to close DB connection: {e}")
+
+    def _ensure_started(self) -> None:
+        if self._storage is None:
+            raise RuntimeError('Worker pool is not started')
+
+    def _spawn(self, worker_id: str) -> None:
+        process = self._context.Process(
+            target=_worker_main,
+            name=f'superagentx-worker-{worker_id}',
+            kwargs=dict(
+                pipe_factory=self.pipe_factory,
+                worker_id=worker_id,
+                stop_event=self._stop_event,
+                max_in_flight=self.max_in_flight,
+                verify_goal=self.verify_goal,
+                poll_interval=self.poll_interval
+            ),
+            daemon=True
+        )
+        process.start()
+        self._processes[worker_id] = process
+
+    async def _release(self, worker_id: str) -> None:
+        try:
+            pipe_ids = await self._storage.release_pipes(worker_id)
+        except Exception as ex:
+            logger.warning(f'Failed to release runs of worker {worker_id}: {ex}')
+            return
+        if pipe_ids:
+            logger.warning(f'Queued {len(pipe_ids)} run(s) of worker {worker_id} again')
+
+    async def _supervise(self) -> None:
+        # Replaces workers which died, their claimed runs are queued again and resume on another worker
+        while True:
+            await asyncio.sleep(self.poll_interval)
+            for worker_id, process in list(self._processes.items()):
+                if process.is_alive():
+                    continue
+                await self._release(worker_id)
+                restarts = self._restarts.get(worker_id, 0)
+                if restarts >= self.max_restarts:
+                    logger.error(f'Worker {worker_id} exited with code {process.exitcode}, giving up after '
+                                 f'{restarts} restart(s)')
+                    del self._processes[worker_id]
+                    continue
+                logger.warning(f'Worker {worker_id} exited with code {process.exitcode}, restarting it')
+                self._restarts[worker_id] = restarts + 1
+                self._spawn(worker_id)
+
+
+def _worker_main(**kwargs) -> None:
+    asyncio.run(_serve(**kwargs))
+
+
+async def _serve(
+        *,
+        pipe_factory: PipeFactory,
+        worker_id: str,
+        stop_event,
+        max_in_flight: int,
+        verify_goal: bool,
+        poll_interval: float
+) -> None:
+    pipe = pipe_factory()
+    if inspect.isawaitable(pipe):
+        pipe = await pipe
+    if not pipe.workflow_store:
+        raise ValueError('The pipe of a worker pool has to be created with workflow_store=True')
+
+    storage = await ConfigLoader.load_db_config()
+    await storage.setup()
+    in_flight: set[asyncio.Task] = set()
+    try:
+        while not stop_event.is_set():
+            claimed = None
+            if len(in_flight) < max_in_flight:
+                claimed = await storage.claim_pipe(worker_id)
+            if claimed:
+                logger.debug(f'Worker {worker_id} claimed run {claimed["pipe_id"]}')
+                in_flight.add(
+                    asyncio.create_task(
+                        _run_claimed(
+                            pipe,
+                            storage=storage,
+                            verify_goal=verify_goal,
+                            **claimed
+                        )
+                    )
+                )
+                continue
+            if in_flight:
+                _, in_flight = await asyncio.wait(in_flight, timeout=poll_interval)
+            else:
+                await asyncio.sleep(poll_interval)
+        if in_flight:
+            await asyncio.wait(in_flight)
+    finally:
+        await storage.close()
+
+
+async def _run_claimed(
+        pipe: AgentXPipe,
+        *,
+        storage: StorageAdapter,
+        pipe_id: str,
+        input_query: str | None,
+        conversation_id: str | None,
+        verify_goal: bool
+) -> None:
+    try:
+        # Runs as a resume, so a run released by a dead worker skips its completed agents
+        await pipe.flow(
+            query_instruction=input_query,
+            verify_goal=verify_goal,
+            conversation_id=conversation_id,
+            resume_pipe_id=pipe_id
+        )
+    except Exception as ex:
+        logger.error(f'Run {pipe_id} failed: {ex}', exc_info=True)
+        try:
+            await storage.update_pipe_status(pipe_id, PipeStatus.FAILED, error=str(ex))
+        except Exception as e:
+            logger.warning(f"Failed to update pipe status: {e}")
@@ -7,6 +7,7 @@ from websockets.asyncio.server import ServerConnection, serve
 from websockets.exceptions import ConnectionClosedOK
 
 from superagentx.agentxpipe import AgentXPipe
+from superagentx.result import GoalResult
 
 
 class WSPipe:
@@ -20,6 +21,7 @@ class WSPipe:
             auth_handler: Callable[[ServerConnection], Awaitable[None]] | None = None,
             host: str | None = None,
             port: int | None = None,
+            stream_results: bool = False,
             **kwargs
     ):
         """
@@ -44,6 +46,9 @@ class WSPipe:
             port: The port number on which the WSPipe will listen for incoming connections. This is crucial for network
                 communication. Defaults to None, indicating that the WSPipe may use a standard port or a configured
                 setting.
+            stream_results: If True, the default `ws_handler` sends every agent result as soon as the agent
+                completes, instead of sending only the final result once the whole pipe has finished.
+                Defaults to False.
             kwargs: Additional keyword arguments that may be required for further customization or to pass additional
                 configuration websocket server.
         """
@@ -53,6 +58,7 @@ class WSPipe:
         self._auth_handler = auth_handler
         self.host = host or 'localhost'
         self.port = port or 8765
+        self.stream_results = stream_results
         self.kwargs = kwargs
         self._console = Console()
         self._result_not_found = "No results found!"
@@ -73,24 +79,23 @@ class WSPipe:
                 except JSONDecodeError:
                     q = query
                 self._console.print(f"Pipe Query: {q}")
-                pipe_result = await self.agentx_pipe.flow(
-                    query_instruction=q
-                )
-                if pipe_result:
-                    goal_result = pipe_result[-1]
-                    if r_as_json:
-                        result = goal_result.model_dump_json(
-                            exclude={'name', 'agent_id'},
-                            exclude_none=True
-                        )
-                    else:
-                        result = (
-                            f'\nResult:\n{json.dumps(goal_result.result)}\n'
-                            f'\nReason: {goal_result.reason}\n'
-                            f'\nGoal Satisfied: {goal_result.is_goal_satisfied}\n'
-                        )
+                if self.stream_results:
+                    sent = False
+                    async for goal_result in self.agentx_pipe.flow_stream(
+                            query_instruction=q
+                    ):
+                        result = self._format_result(goal_result, r_as_json=r_as_json)
+                        self._console.print(f"Pipe Partial Result:\n{result}")
+                        await ws_conn.send(result)
+                        sent = True
+                    if sent:
+                        continue
+                    result = self._format_result(None, r_as_json=r_as_json)
                 else:
-                    result = json.dumps({'error': self._result_not_found}) if r_as_json else self._result_not_found
+                    pipe_result = await self.agentx_pipe.flow(
+                        query_instruction=q
+                    )
+                    result = self._format_result(pipe_result[-1] if pipe_result else None, r_as_json=r_as_json)
                 self._console.print(f"Pipe Result:\n{result}")
                 await ws_conn.send(result)
         except ConnectionClosedOK:
@@ -98,6 +103,25 @@ class WSPipe:
         except Exception as e:
             self._console.print(f"[bold red]Error in default_handler: {e}[/bold red]")
 
+    def _format_result(
+            self,
+            goal_result: GoalResult | None,
+            *,
+            r_as_json: bool
+    ) -> str:
+        if not goal_result:
+            return json.dumps({'error': self._result_not_found}) if r_as_json else self._result_not_found
+        if r_as_json:
+            return goal_result.model_dump_json(
+                exclude={'name', 'agent_id'},
+                exclude_none=True
+            )
+        return (
+            f'\nResult:\n{json.dumps(goal_result.result)}\n'
+            f'\nReason: {goal_result.reason}\n'
+            f'\nGoal Satisfied: {goal_result.is_goal_satisfied}\n'
+        )
+
     async def start(self) -> None:
         """
         Starts the WebSocket server. If valid API keys are provided, enables authentication.
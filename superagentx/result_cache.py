@@ -0,0 +1,274 @@
+import asyncio
+import hashlib
+import json
+import logging
+import time
+from abc import ABC, abstractmethod
+from collections import OrderedDict
+from pathlib import Path
+from typing import Any
+
+import aiosqlite
+
+from superagentx.result import GoalResult
+
+logger = logging.getLogger(__name__)
+
+
+def normalize_query(query: str | None) -> str:
+    """Case and whitespace insensitive form of a query, so trivially different repeats share a cache entry."""
+    return ' '.join((query or '').split()).casefold()
+
+
+def _describe_llm(llm: Any) -> str | None:
+    config = getattr(llm, 'llm_config_model', None)
+    if config is None:
+        return None
+    return f'{config.llm_type}:{config.model}'
+
+
+def _describe_prompt(prompt_template: Any) -> str | None:
+    if prompt_template is None:
+        return None
+    return f'{prompt_template.prompt_type}:{prompt_template.system_message}'
+
+
+def _describe_value(value: Any) -> Any:
+    # A form of the value which is the same in every process, unlike the default repr of objects and functions
+    if value is None or isinstance(value, (str, int, float, bool)):
+        return value
+    if isinstance(value, dict):
+        return {str(key): _describe_value(_value) for key, _value in value.items()}
+    if isinstance(value, (list, tuple)):
+        return [_describe_value(_value) for _value in value]
+    if isinstance(value, (set, frozenset)):
+        return sorted(map(str, map(_describe_value, value)))
+    if callable(value) and hasattr(value, '__qualname__'):
+        return f'{value.__module__}.{value.__qualname__}'
+    return type(value).__name__
+
+
+def _describe_handler(handler: Any) -> Any:
+    if handler is None:
+        return None
+    return {
+        "type": type(handler).__name__,
+        "config": {
+            key: _describe_value(value)
+            for key, value in vars(handler).items()
+            if not key.startswith('_') and key != 'tools'
+        }
+    }
+
+
+def _describe_engine(engine: Any) -> Any:
+    if isinstance(engine, list):
+        return [_describe_engine(_engine) for _engine in engine]
+    return {
+        "type": type(engine).__name__,
+        "handler": _describe_handler(getattr(engine, 'handler', None)),
+        "llm": _describe_llm(getattr(engine, 'llm', None)),
+        "prompt": _describe_prompt(getattr(engine, 'prompt_template', None)),
+        "tools": _describe_value(getattr(engine, 'tools', None)),
+        "instructions": _describe_value(getattr(engine, 'instructions', None))
+    }
+
+
+def _describe_agent(agent: Any) -> Any:
+    if isinstance(agent, list):
+        return [_describe_agent(_agent) for _agent in agent]
+    return {
+        # A generated name differs in every process, such an agent is known by its role and goal
+        "name": None if agent.name == f'{agent}-{agent.agent_id}' else agent.name,
+        "role": agent.role,
+        "goal": agent.goal,
+        "output_format": agent.output_format,
+        "return_engine_result": agent.return_engine_result,
+        "llm": _describe_llm(agent.llm),
+        "prompt": _describe_prompt(agent.prompt_template),
+        "engines": [_describe_engine(engine) for engine in agent.engines],
+        "tool_args": _describe_value(getattr(agent, 'tool_args', None)),
+        "verifiers": [verifier.name for verifier in getattr(agent, 'verifiers', [])],
+        "single_call_verify": getattr(agent, 'single_call_verify', False)
+    }
+
+
+def fingerprint(agents: list, **options) -> str:
+    """
+    Fingerprint of the configuration of a pipe: the structure of its agents, their goals, roles, prompts, models,
+    engines with their handler configurations, tools and instructions, and the given options. A changed configuration never reuses the results of the previous one.
+    """
+    description = {
+        "agents": [_describe_agent(agent) for agent in agents],
+        "options": options
+    }
+    return hashlib.sha256(json.dumps(description, sort_keys=True, default=str).encode()).hexdigest()
+
+
+def cache_key(
+        *,
+        query_instruction: str | None,
+        conversation_id: str | None,
+        pipe_fingerprint: str
+) -> str:
+    return hashlib.sha256(
+        json.dumps([normalize_query(query_instruction), conversation_id, pipe_fingerprint]).encode()
+    ).hexdigest()
+
+
+class ResultCache(ABC):
+    """
+    Cache of pipe results with a time to live and least recently used eviction.
+    """
+
+    def __init__(
+            self,
+            *,
+            ttl: float = 300,
+            max_size: int = 1024
+    ):
+        """
+        Args:
+            ttl: Seconds a cached result stays valid. Default `300`
+            max_size: Maximum number of cached results, the least recently used results are evicted first.
+                Default `1024`
+        """
+        if ttl <= 0:
+            raise ValueError(f'ttl must be greater than 0, got {ttl}')
+        if max_size < 1:
+            raise ValueError(f'max_size must be greater than 0, got {max_size}')
+        self.ttl = ttl
+        self.max_size = max_size
+
+    @abstractmethod
+    async def get(self, key: str) -> list[GoalResult] | None:
+        """Returns the cached results of the key, or None if they are missing or expired."""
+        raise NotImplementedError
+
+    @abstractmethod
+    async def set(self, key: str, results: list[GoalResult]) -> None:
+        raise NotImplementedError
+
+    @abstractmethod
+    async def clear(self) -> None:
+        raise NotImplementedError
+
+    async def close(self) -> None:
+        pass
+
+
+class InMemoryResultCache(ResultCache):
+    """
+    Result cache held in the memory of the process.
+    """
+
+    def __init__(self, **kwargs):
+        super().__init__(**kwargs)
+        self._entries: OrderedDict[str, tuple[float, list[GoalResult]]] = OrderedDict()
+
+    async def get(self, key: str) -> list[GoalResult] | None:
+        entry = self._entries.get(key)
+        if entry is None:
+            return None
+        expires_at, results = entry
+        if expires_at <= time.monotonic():
+            del self._entries[key]
+            return None
+        self._entries.move_to_end(key)
+        # Copies, so callers never change the cached results
+        return [result.model_copy(deep=True) for result in results]
+
+    async def set(self, key: str, results: list[GoalResult]) -> None:
+        self._entries[key] = (
+            time.monotonic() + self.ttl,
+            [result.model_copy(deep=True) for result in results]
+        )
+        self._entries.move_to_end(key)
+        while len(self._entries) > self.max_size:
+            self._entries.popitem(last=False)
+
+    async def clear(self) -> None:
+        self._entries.clear()
+
+
+class SQLiteResultCache(ResultCache):
+    """
+    Result cache stored in a SQLite database, shared by the processes using the same database file and kept across
+    restarts.
+    """
+
+    def __init__(
+            self,
+            db_path: str | Path = 'result_cache.db',
+            **kwargs
+    ):
+        """
+        Args:
+            db_path: The file path to the SQLite database. Default `result_cache.db`
+            **kwargs: `ttl` and `max_size`, see `ResultCache`.
+        """
+        super().__init__(**kwargs)
+        self.db_path = db_path
+        self._connection: aiosqlite.Connection | None = None
+        self._lock = asyncio.Lock()
+
+    async def _connect(self) -> aiosqlite.Connection:
+        if self._connection is None:
+            self._connection = await aiosqlite.connect(database=self.db_path)
+            await self._connection.execute(
+                """CREATE TABLE IF NOT EXISTS result_cache (
+                    key TEXT PRIMARY KEY,
+                    results TEXT NOT NULL,
+                    expires_at REAL NOT NULL,
+                    accessed_at REAL NOT NULL
+                )"""
+            )
+            await self._connection.commit()
+        return self._connection
+
+    async def get(self, key: str) -> list[GoalResult] | None:
+        async with self._lock:
+            connection = await self._connect()
+            now = time.time()
+            async with connection.execute(
+                    "SELECT results FROM result_cache WHERE key = ? AND expires_at > ?",
+                    (key, now)
+            ) as cursor:
+                row = await cursor.fetchone()
+            if row is None:
+                return None
+            await connection.execute(
+                "UPDATE result_cache SET accessed_at = ? WHERE key = ?",
+                (now, key)
+            )
+            await connection.commit()
+        return [GoalResult.model_validate(result) for result in json.loads(row[0])]
+
+    async def set(self, key: str, results: list[GoalResult]) -> None:
+        payload = json.dumps([result.model_dump(mode='json') for result in results])
+        async with self._lock:
+            connection = await self._connect()
+            now = time.time()
+            await connection.execute(
+                "INSERT OR REPLACE INTO result_cache (key, results, expires_at, accessed_at) VALUES (?, ?, ?, ?)",
+                (key, payload, now + self.ttl, now)
+            )
+            await connection.execute("DELETE FROM result_cache WHERE expires_at <= ?", (now,))
+            await connection.execute(
+                """DELETE FROM result_cache WHERE key IN (
+                    SELECT key FROM result_cache ORDER BY accessed_at DESC LIMIT -1 OFFSET ?
+                )""",
+                (self.max_size,)
+            )
+            await connection.commit()
+
+    async def clear(self) -> None:
+        async with self._lock:
+            connection = await self._connect()
+            await connection.execute("DELETE FROM result_cache")
+            await connection.commit()
+
+    async def close(self) -> None:
+        if self._connection is not None:
+            connection, self._connection = self._connection, None
+            await connection.close()
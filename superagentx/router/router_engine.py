@@ -1,12 +1,24 @@
+import asyncio
 import logging
 import json
 import re
+import time
+from collections import OrderedDict
 
 from superagentx.llm import LLMClient, ChatCompletionParams
 from superagentx.prompt import PromptTemplate
+from superagentx.result_cache import normalize_query
+
+try:
+    import numpy as np
+except ImportError:  # Only required by semantic routing
+    np = None
 
 logger = logging.getLogger(__name__)
 
+# Marks a routing decision missing from the cache, `None` is a valid cached decision
+_MISS = object()
+
 
 async def _parse_llm_response(response):
 
@@ -51,6 +63,17 @@ async def _parse_llm_response(response):
     return None
 
 
+def _agent_text(agent) -> str:
+    # What an agent is good at, embedded once per agent for semantic routing
+    parts = [
+        getattr(agent, "role", None),
+        getattr(agent, "goal", None),
+        getattr(agent, "description", None),
+        ", ".join(getattr(agent, "capabilities", None) or [])
+    ]
+    return "\n".join(part for part in parts if part)
+
+
 class RouterEngine:
     """
     Dynamic routing engine for SuperAgentX.
@@ -58,133 +81,286 @@ class RouterEngine:
     Routing priority:
         1. Condition routing
         2. Capability routing
-        3. LLM routing
-        4. Fallback
+        3. Semantic routing
+        4. LLM routing
+        5. Fallback
     """
 
     def __init__(
         self,
         condition_fn=None,
         llm: LLMClient = None,
-        mode="hybrid"
+        mode="hybrid",
+        embed_llm: LLMClient | None = None,
+        similarity_threshold: float = 0.3,
+        top_k: int | None = None,
+        cache_ttl: float | None = None,
+        cache_size: int = 1024,
+        selection_policy=None
     ):
+        """
+        Args:
+            condition_fn: A function returning the roles of the agents to execute for the routing context.
+            llm: The LLM client of the LLM routing mode.
+            mode: One of `condition`, `capability`, `semantic`, `llm` or `hybrid`. Default `hybrid`
+            embed_llm: The LLM client embedding the agents and queries in the `semantic` mode. Defaults to `llm`.
+            similarity_threshold: Minimum cosine similarity between the query and an agent for the agent to be
+                selected in the `semantic` mode. Default `0.3`
+            top_k: Maximum number of agents selected in the `semantic` mode, the most similar first. Defaults to
+                `None`, selecting every agent above the threshold.
+            cache_ttl: Seconds a routing decision is reused for the same normalized query and candidate agents.
+                Defaults to `None`, routing every time.
+            cache_size: Maximum number of cached routing decisions, the least recently used are evicted first.
+                Default `1024`
+            selection_policy: An optional policy choosing among several qualifying agents, e.g.
+                `LatencyAwareSelection()` preferring the fastest agents. Default `None`
+        """
         self.condition_fn = condition_fn
         self.llm = llm
         self.mode = mode
+        self.embed_llm = embed_llm or llm
+        self.similarity_threshold = similarity_threshold
+        self.top_k = top_k
+        # Normalized agent vectors keyed by agent id, with the text they were embedded from
+        self._agent_vectors: dict = {}
+        self.cache_ttl = cache_ttl
+        self.cache_size = cache_size
+        self.selection_policy = selection_policy
+        self._decisions: OrderedDict[tuple, tuple[float, tuple | None]] = OrderedDict()
+
+    async def prepare(self, agents) -> None:
+        """
+        Embeds the agents for semantic routing upfront, otherwise they are embedded on their first routing. An
+        agent is embedded again only if its role, goal, description or capabilities change.
+        """
+        await self._embed_agents(agents)
+
+    @staticmethod
+    def _normalize(vector):
+        vector = np.asarray(vector, dtype=np.float32)
+        norm = np.linalg.norm(vector)
+        return vector / norm if norm else vector
+
+    async def _embed_agents(self, agents) -> "np.ndarray":
+        if np is None:
+            raise ImportError("Semantic routing requires numpy, install it with `pip install numpy`")
+        texts = [_agent_text(agent) for agent in agents]
+        keys = [getattr(agent, "agent_id", id(agent)) for agent in agents]
+        missing = [
+            (key, text) for key, text in zip(keys, texts)
+            if self._agent_vectors.get(key, (None, None))[0] != text
+        ]
+        if missing:
+            vectors = await asyncio.gather(
+                *[self.embed_llm.aembed(text=text) for _, text in missing]
+            )
+            for (key, text), vector in zip(missing, vectors):
+                self._agent_vectors[key] = (text, self._normalize(vector))
+        return np.stack([self._agent_vectors[key][1] for key in keys])
+
+    async def _semantic_route(self, agents, query: str) -> list:
+        matrix = await self._embed_agents(agents)
+        query_vector = self._normalize(await self.embed_llm.aembed(text=query))
+        # Cosine similarity of every agent at once, the vectors are normalized
+        scores = matrix @ query_vector
+        order = np.argsort(-scores, kind="stable")
+        selected = [
+            agents[idx] for idx in order
+            if scores[idx] >= self.similarity_threshold
+        ]
+        logger.debug(
+            f"Router(semantic) scores: "
+            f"{ {getattr(a, 'role', idx): round(float(scores[idx]), 3) for idx, a in enumerate(agents)} }"
+        )
+        if self.top_k:
+            selected = selected[:self.top_k]
+        return selected
 
     async def route(self, agents, context):
+        """
+        Selects the agents which execute the routing context.
+
+        With `cache_ttl`, decisions are cached by the normalized query and the candidate agents, so repeated queries
+        are routed without embedding or LLM calls. With a `selection_policy`, the policy picks among several
+        qualifying agents, e.g. the fastest ones.
+        """
+        key = None
+        if self.cache_ttl:
+            key = self._cache_key(agents, context)
+            selected = self._cache_get(key, agents)
+            if selected is not _MISS:
+                logger.debug("Router(cache): decision reused")
+                return await self._select(selected)
 
         try:
+            selected = await self._route(agents, context)
+        except Exception as e:
+            # Failed decisions are not cached
+            logger.warning(f"RouterEngine error: {e}")
+            return agents
 
-            query = str(context.get("query", "")).lower()
+        if key:
+            self._cache_set(key, selected)
+        return await self._select(selected)
+
+    async def _select(self, selected):
+        if self.selection_policy and selected and len(selected) > 1:
+            try:
+                return await self.selection_policy.select(selected)
+            except Exception as e:
+                logger.warning(f"Router selection policy failed: {e}")
+        return selected
+
+    def _cache_key(self, agents, context) -> tuple:
+        return (
+            normalize_query(str(context.get("query", ""))),
+            tuple(getattr(a, "agent_id", id(a)) for a in agents)
+        )
+
+    def _cache_get(self, key: tuple, agents):
+        entry = self._decisions.get(key)
+        if entry is None:
+            return _MISS
+        expires_at, selected_ids = entry
+        if expires_at <= time.monotonic():
+            del self._decisions[key]
+            return _MISS
+        self._decisions.move_to_end(key)
+        if selected_ids is None:
+            return None
+        by_id = {getattr(a, "agent_id", id(a)): a for a in agents}
+        return [by_id[agent_id] for agent_id in selected_ids]
+
+    def _cache_set(self, key: tuple, selected) -> None:
+        # Agent ids are cached, the agents are resolved from the candidates of the hit
+        selected_ids = None if selected is None else tuple(getattr(a, "agent_id", id(a)) for a in selected)
+        self._decisions[key] = (time.monotonic() + self.cache_ttl, selected_ids)
+        self._decisions.move_to_end(key)
+        while len(self._decisions) > self.cache_size:
+            self._decisions.popitem(last=False)
+
+    async def _route(self, agents, context):
+
+        query = str(context.get("query", "")).lower()
+
+        # ------------------------------------------------
+        # CONDITION ROUTING
+        # ------------------------------------------------
+        if self.mode in ("condition", "hybrid") and self.condition_fn:
+
+            roles = self.condition_fn(context)
+
+            if roles:
+
+                filtered = [
+                    a for a in agents
+                    if getattr(a, "role", None) in roles
+                ]
+
+                if filtered:
+                    logger.debug(
+                        f"Router(condition): {[a.role for a in filtered]}"
+                    )
+                    return filtered
 
-            # ------------------------------------------------
-            # CONDITION ROUTING
-            # ------------------------------------------------
-            if self.mode in ("condition", "hybrid") and self.condition_fn:
+        # ------------------------------------------------
+        # CAPABILITY ROUTING
+        # ------------------------------------------------
+        elif self.mode in ("capability", "hybrid"):
 
-                roles = self.condition_fn(context)
+            capable_agents = []
 
-                if roles:
+            for agent in agents:
 
-                    filtered = [
-                        a for a in agents
-                        if getattr(a, "role", None) in roles
-                    ]
+                caps = getattr(agent, "capabilities", [])
 
-                    if filtered:
-                        logger.debug(
-                            f"Router(condition): {[a.role for a in filtered]}"
-                        )
-                        return filtered
+                for cap in caps:
+                    if cap.lower() in query:
+                        capable_agents.append(agent)
+                        break
 
-            # ------------------------------------------------
-            # CAPABILITY ROUTING
-            # ------------------------------------------------
-            elif self.mode in ("capability", "hybrid"):
+            if capable_agents:
 
-                capable_agents = []
+                logger.debug(
+                    f"Router(capability): {[a.role for a in capable_agents]}"
+                )
 
-                for agent in agents:
+                return capable_agents
 
-                    caps = getattr(agent, "capabilities", [])
+        # ------------------------------------------------
+        # SEMANTIC ROUTING
+        # ------------------------------------------------
+        elif self.mode == "semantic" and self.embed_llm:
 
-                    for cap in caps:
-                        if cap.lower() in query:
-                            capable_agents.append(agent)
-                            break
+            selected = await self._semantic_route(
+                agents,
+                str(context.get("query", ""))
+            )
 
-                if capable_agents:
+            if selected:
 
-                    logger.debug(
-                        f"Router(capability): {[a.role for a in capable_agents]}"
-                    )
+                logger.debug(
+                    f"Router(semantic): {[a.role for a in selected]}"
+                )
 
-                    return capable_agents
+                return selected
 
-            # ------------------------------------------------
-            # LLM ROUTING
-            # ------------------------------------------------
-            elif self.mode in ("llm", "hybrid") and self.llm:
+        # ------------------------------------------------
+        # LLM ROUTING
+        # ------------------------------------------------
+        elif self.mode in ("llm", "hybrid") and self.llm:
 
-                agent_map = {
-                    str(getattr(a, "id", idx)): {
-                        "role": getattr(a, "role", ""),
-                        "goal": getattr(a, "goal", "")
-                    }
-                    for idx, a in enumerate(agents)
+            agent_map = {
+                str(getattr(a, "id", idx)): {
+                    "role": getattr(a, "role", ""),
+                    "goal": getattr(a, "goal", "")
                 }
+                for idx, a in enumerate(agents)
+            }
 
-                prompt = f"""
-                        You are an AI routing system.
-
-                        Task:
-                          {context}
+            prompt = f"""
+                    You are an AI routing system.
 
-                        Available agents:
-                          {agent_map}
+                    Task:
+                      {context}
 
-                        Select which agents should execute this task.
-
-                        Return ONLY JSON list of agent names.
-
-                         Example:
-                         ["0","2"]
-                        """
-                prompt_template = PromptTemplate()
-                messages = await prompt_template.get_messages(
-                    input_prompt=prompt
-                )
-                chat_params = ChatCompletionParams(messages=messages)
-                response = await self.llm.afunc_chat_completion(chat_completion_params=chat_params)
+                    Available agents:
+                      {agent_map}
 
-                selected = await _parse_llm_response(response)
+                    Select which agents should execute this task.
 
-                if selected:
-                    selected_set = set(str(s).strip() for s in selected)
+                    Return ONLY JSON list of agent names.
 
-                    filtered = [
-                        a for idx, a in enumerate(agents)
-                        if str(getattr(a, "id", idx)) in selected_set
-                    ]
+                     Example:
+                     ["0","2"]
+                    """
+            prompt_template = PromptTemplate()
+            messages = await prompt_template.get_messages(
+                input_prompt=prompt
+            )
+            chat_params = ChatCompletionParams(messages=messages)
+            response = await self.llm.afunc_chat_completion(chat_completion_params=chat_params)
 
-                    if filtered:
-                        logger.debug(
-                            f"Router(llm): {[a.role for a in filtered]}"
-                        )
+            selected = await _parse_llm_response(response)
 
-                        return filtered
+            if selected:
+                selected_set = set(str(s).strip() for s in selected)
 
-            # ------------------------------------------------
-            # FallBack
-            # ------------------------------------------------
-            else:
-                logger.debug("Router(fallback): returning all agents")
-                return agents
+                filtered = [
+                    a for idx, a in enumerate(agents)
+                    if str(getattr(a, "id", idx)) in selected_set
+                ]
 
-        except Exception as e:
+                if filtered:
+                    logger.debug(
+                        f"Router(llm): {[a.role for a in filtered]}"
+                    )
 
-            logger.warning(f"RouterEngine error: {e}")
+                    return filtered
 
+        # ------------------------------------------------
+        # FallBack
+        # ------------------------------------------------
+        else:
+            logger.debug("Router(fallback): returning all agents")
             return agents
-
@@ -0,0 +1,95 @@
+import asyncio
+import logging
+import time
+
+from superagentx.db_store import ConfigLoader, StorageAdapter
+
+logger = logging.getLogger(__name__)
+
+# Keeps agents which always failed rankable, instead of dividing by zero
+_MIN_SUCCESS_RATE = 0.05
+
+
+class LatencyAwareSelection:
+    """
+    Selection policy of the `RouterEngine` preferring the fastest and most reliable agents when several agents
+    qualify for a query.
+
+    Agents are ranked by their mean `agent.duration_ms` divided by their success rate, both taken from the metrics
+    recorded in the workflow store. The statistics are loaded at most every `refresh_interval` seconds, so a
+    selection costs no database round trip. Agents with fewer than `min_samples` recorded executions are ranked as
+    an average agent.
+
+    Example:
+        router = RouterEngine(mode='semantic', embed_llm=llm, selection_policy=LatencyAwareSelection(max_agents=1))
+    """
+
+    def __init__(
+            self,
+            *,
+            storage: StorageAdapter | None = None,
+            max_agents: int = 1,
+            min_samples: int = 3,
+            refresh_interval: float = 60,
+            window: int = 1000
+    ):
+        """
+        Args:
+            storage: The workflow store holding the metrics. Defaults to the store configured by `DB_PROVIDER`.
+            max_agents: Number of agents selected among the qualifying agents. Default `1`
+            min_samples: Minimum number of recorded executions before the statistics of an agent are used.
+                Default `3`
+            refresh_interval: Seconds between reloads of the statistics. Default `60`
+            window: Number of most recent agent executions the statistics are computed from. Default `1000`
+        """
+        if max_agents < 1:
+            raise ValueError(f'max_agents must be greater than 0, got {max_agents}')
+        self.storage = storage
+        self.max_agents = max_agents
+        self.min_samples = min_samples
+        self.refresh_interval = refresh_interval
+        self.window = window
+        self._stats: dict[str, dict] = {}
+        self._loaded_at: float | None = None
+        self._lock = asyncio.Lock()
+
+    async def _refresh(self) -> None:
+        if self._loaded_at is not None and time.monotonic() - self._loaded_at < self.refresh_interval:
+            return
+        async with self._lock:
+            if self._loaded_at is not None and time.monotonic() - self._loaded_at < self.refresh_interval:
+                return
+            try:
+                if self.storage is None:
+                    self.storage = await ConfigLoader.load_db_config()
+                    await self.storage.setup()
+                self._stats = await self.storage.get_agent_stats(limit=self.window)
+            except Exception as ex:
+                # Keeps the previous statistics, routing must not fail on metrics
+                logger.warning(f'Failed to load agent statistics: {ex}')
+            self._loaded_at = time.monotonic()
+
+    def cost(self, agent) -> float | None:
+        """
+        Expected cost of the agent in milliseconds, or None without enough recorded executions.
+        """
+        stats = self._stats.get(agent.name)
+        if not stats or stats["count"] < self.min_samples:
+            return None
+        return stats["mean_ms"] / max(stats["success_rate"], _MIN_SUCCESS_RATE)
+
+    async def select(self, agents: list) -> list:
+        """
+        Returns the `max_agents` agents with the lowest expected cost, in the order of the given agents on ties.
+        """
+        await self._refresh()
+        costs = [self.cost(agent) for agent in agents]
+        known = [cost for cost in costs if cost is not None]
+        if not known:
+            return agents[:self.max_agents]
+        average = sum(known) / len(known)
+        ranked = sorted(
+            range(len(agents)),
+            key=lambda idx: average if costs[idx] is None else costs[idx]
+        )
+        return [agents[idx] for idx in ranked[:self.max_agents]]
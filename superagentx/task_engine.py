@@ -117,6 +117,18 @@ class TaskEngine(BaseEngine):
 
         self._validate_instructions_type()
 
+    def clone(self) -> 'TaskEngine':
+        """
+        Returns a copy of the engine for another concurrent run, sharing its handler, tools and instructions with its
+        own run state.
+        """
+        engine = super().clone()
+        engine.context = None
+        engine.results = []
+        engine.n_steps = 0
+        engine.last_result = None
+        return engine
+
     def __str__(self) -> str:
         return f"TaskEngine({self.handler.__class__.__name__})"
 
@@ -445,9 +457,10 @@ class TaskEngine(BaseEngine):
             storage: StorageAdapter | None = None,
             old_memory: List[dict] | None = None,
             conversation_id: str | None = None,
+            deadline: float | None = None,
             **kwargs,
     ) -> List[Any]:
-        """Main entry point for execution."""
+        """Main entry point for execution. Raises `TimeoutError` if the optional event loop `deadline` passes."""
         logger.debug("[TaskEngine] Starting execution for: %s", input_prompt)
 
         self.context = {
@@ -463,4 +476,5 @@ class TaskEngine(BaseEngine):
 
         self._validate_instructions_type()
 
-        return await self._execute(task_agent_input=previous_agent_result, pre_result=pre_result)
\ No newline at end of file
+        async with asyncio.timeout_at(deadline):
+            return await self._execute(task_agent_input=previous_agent_result, pre_result=pre_result)
\ No newline at end of file
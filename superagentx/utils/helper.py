@@ -22,6 +22,32 @@ async def iter_to_aiter(iterable):
         yield item
 
 
+async def bounded_gather(*aws, limit: int | None = None, return_exceptions: bool = False) -> list[Any]:
+    """Same as `asyncio.gather`, but runs at most `limit` awaitables at the same time."""
+    if not limit:
+        return await asyncio.gather(*aws, return_exceptions=return_exceptions)
+
+    semaphore = asyncio.Semaphore(limit)
+
+    async def _bounded(aw):
+        async with semaphore:
+            return await aw
+
+    return await asyncio.gather(*[_bounded(aw) for aw in aws], return_exceptions=return_exceptions)
+
+
+def deadline_after(timeout: float | None) -> float | None:
+    """Converts a timeout in seconds into an event loop deadline, as used by `asyncio.timeout_at`."""
+    if timeout is None:
+        return None
+    return asyncio.get_running_loop().time() + timeout
+
+
+def deadline_exceeded(deadline: float | None) -> bool:
+    """Whether the given event loop deadline has passed. A `None` deadline never passes."""
+    return deadline is not None and asyncio.get_running_loop().time() >= deadline
+
+
 async def get_fstring_variables(s: str):
     # This regular expression looks for variables in curly braces
     return re.findall(r'\{(.*?)}', s)
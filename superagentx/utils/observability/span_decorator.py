@@ -233,12 +233,27 @@ def agent_span(func):
                     value=duration_ms,
                     trace_id=pipe_id,
                     span_id=span_id,
-                    labels={"agent": self.name},
+                    labels={
+                        "agent": self.name,
+                        "success": (
+                            not getattr(result, "error", None)
+                            and getattr(result, "is_goal_satisfied", None) is not False
+                        ),
+                    },
                 )
 
                 return result
 
             except Exception as e:
+                await record_metric_safe(
+                    storage=storage,
+                    name="agent.duration_ms",
+                    value=int((time.perf_counter() - start_time) * 1000),
+                    trace_id=pipe_id,
+                    span_id=span_id,
+                    labels={"agent": self.name, "success": False},
+                )
+
                 await storage.add_span_event(
                     span_id=span_id,
                     event_name="agent.error",
@@ -16,7 +16,10 @@ otel_tracer = trace.get_tracer("superagentx.pipe")
 
 def pipe_trace(func):
     """
-    Trace decorator for AgentXPipe.flow
+    Trace decorator for AgentXPipe runs
+
+    The trace is keyed by the id of the run passed as `run`, and recorded in the storage session of that run. The
+    storage session is owned and closed by the run, not by the trace.
 
     Priority:
     1. OTEL exporter (if endpoint configured)
@@ -27,9 +30,11 @@ def pipe_trace(func):
 
     @functools.wraps(func)
     async def wrapper(self, *args, **kwargs):
-        # query_instruction = args[0] if args else None
         query_instruction = kwargs.get("query_instruction")
         conversation_id = kwargs.get("conversation_id")
+        run = kwargs.get("run")
+        trace_id = run.run_id if run else self.pipe_id
+        storage = run.storage if run else None
 
         # -------------------------------------------------
         # CASE 1: OpenTelemetry
@@ -38,7 +43,7 @@ def pipe_trace(func):
             with otel_tracer.start_as_current_span(
                 name="AgentXPipe.flow",
                 attributes={
-                    "pipe.id": self.pipe_id,
+                    "pipe.id": trace_id,
                     "pipe.name": self.name,
                     "conversation.id": conversation_id or None,
                     "query": query_instruction,
@@ -58,12 +63,10 @@ def pipe_trace(func):
         # -------------------------------------------------
         # CASE 2: SQL Storage (workflow_store)
         # -------------------------------------------------
-        if self.workflow_store:
+        if self.workflow_store and storage:
             try:
-                self.storage = await self._load_storage_once()
-
-                await self.storage.start_trace(
-                    trace_id=self.pipe_id,
+                await storage.start_trace(
+                    trace_id=trace_id,
                     conversation_id=conversation_id or None,
                     query_input=query_instruction,
                     status="started",
@@ -73,44 +76,37 @@ def pipe_trace(func):
                 try:
                     result = await func(self, *args, **kwargs)
                     await record_metric_safe(
-                        storage=self.storage,
+                        storage=storage,
                         name="pipe.success_total",
                         value=1,
-                        trace_id=self.pipe_id,
+                        trace_id=trace_id,
                     )
                     return result
                 finally:
                     duration = (time.perf_counter() - start) * 1000
                     await record_metric_safe(
-                        storage=self.storage,
+                        storage=storage,
                         name="pipe.duration_ms",
                         value=duration,
-                        trace_id=self.pipe_id,
+                        trace_id=trace_id,
                     )
             except Exception as e:
                 try:
-                    await self.storage.end_trace(
-                        trace_id=self.pipe_id,
+                    await storage.end_trace(
+                        trace_id=trace_id,
                         status="error",
                         error_message=str(e),
                     )
                 except Exception as trace_err:
                     logger.debug(
                         f"Trace end failed (non-blocking): {trace_err}",
-                        extra={"pipe_id": self.pipe_id},
+                        extra={"pipe_id": trace_id},
                     )
                 raise
 
-            finally:
-                try:
-                    await self.storage.close()
-                except Exception:
-                    pass
-
         # -------------------------------------------------
         # CASE 3: No observability
         # -------------------------------------------------
         return await func(self, *args, **kwargs)
 
     return wrapper
-
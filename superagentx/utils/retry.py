@@ -0,0 +1,81 @@
+import asyncio
+import random
+
+import httpx
+import openai
+
+from superagentx.exceptions import InvalidType
+from superagentx.handler.exceptions import InvalidHandler, InvalidAction
+
+# Throttling, conflicts and server side failures, which usually pass
+_RETRYABLE_STATUS_CODES = {408, 409, 425, 429, 500, 502, 503, 504}
+
+_RETRYABLE_ERRORS = (
+    TimeoutError,
+    ConnectionError,
+    openai.APIConnectionError,  # Includes openai.APITimeoutError
+    httpx.TransportError  # Includes httpx.TimeoutException
+)
+
+# Errors of the configuration, which fail the same way on every attempt. Errors of the input, e.g. a `TypeError` of
+# tool arguments the LLM made up, are retried, as the next attempt asks the LLM again.
+_FATAL_ERRORS = (
+    InvalidType,
+    InvalidHandler,
+    InvalidAction,
+    NotImplementedError,
+    PermissionError
+)
+
+
+def _status_code(exc: BaseException) -> int | None:
+    status_code = getattr(exc, 'status_code', None)
+    if status_code is None:
+        status_code = getattr(getattr(exc, 'response', None), 'status_code', None)
+    return status_code if isinstance(status_code, int) else None
+
+
+def is_retryable(exc: BaseException) -> bool:
+    """
+    Whether a failed attempt is worth retrying.
+
+    Rate limits, timeouts, connection failures and server errors are retryable. Invalid configurations and client
+    errors, e.g. a rejected API key or a malformed request, are fatal. Unknown errors, including invalid tool arguments
+    made up by the LLM, are retryable.
+    """
+    if isinstance(exc, _RETRYABLE_ERRORS):
+        return True
+    if isinstance(exc, _FATAL_ERRORS):
+        return False
+    status_code = _status_code(exc)
+    if status_code is not None and 400 <= status_code < 600:
+        return status_code in _RETRYABLE_STATUS_CODES
+    return True
+
+
+def backoff_delay(
+        attempt: int,
+        *,
+        base_delay: float,
+        max_delay: float
+) -> float:
+    """
+    Exponential backoff with full jitter: a random delay up to `base_delay * 2 ** (attempt - 1)`, capped at
+    `max_delay`. The jitter keeps concurrent retries of a throttled provider from arriving at the same time.
+    """
+    return random.uniform(0, min(max_delay, base_delay * 2 ** (attempt - 1)))
+
+
+async def sleep_before_retry(
+        attempt: int,
+        *,
+        base_delay: float,
+        max_delay: float,
+        deadline: float | None = None
+) -> None:
+    """Sleeps the backoff delay of the attempt, never past the given event loop deadline."""
+    delay = backoff_delay(attempt, base_delay=base_delay, max_delay=max_delay)
+    if deadline is not None:
+        delay = min(delay, max(0.0, deadline - asyncio.get_running_loop().time()))
+    if delay > 0:
+        await asyncio.sleep(delay)
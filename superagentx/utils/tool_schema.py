@@ -0,0 +1,54 @@
+import inspect
+import logging
+from collections.abc import Iterable
+from typing import Any
+
+logger = logging.getLogger(__name__)
+
+# Tool schemas by handler class, provider format and tool set
+_tool_schemas: dict[tuple, list[dict]] = {}
+
+
+def provider_format(llm: Any) -> type:
+    # The provider client builds the schema, e.g. OpenAI function JSON or a Bedrock tool spec
+    return type(getattr(llm, 'client', llm))
+
+
+async def handler_tool_schemas(
+        *,
+        llm: Any,
+        handler: Any,
+        funcs: Iterable[str]
+) -> list[dict]:
+    """
+    Tool schemas of the given handler methods, in the format of the LLM provider.
+
+    Building a schema introspects the type hints and the docstring of the method, so the schemas are built once per
+    handler class, provider format and tool set, and shared by every engine using them. A different tool set builds
+    its own schemas.
+
+    Args:
+        llm: The LLM client, its provider client decides the schema format.
+        handler: The handler owning the methods.
+        funcs: The method names, optionally qualified, e.g. `WeatherHandler.forecast`.
+
+    Returns:
+        The schemas of the methods found on the handler, in the given order.
+    """
+    funcs = tuple(str(func) for func in funcs)
+    key = (type(handler), provider_format(llm), funcs)
+    schemas = _tool_schemas.get(key)
+    if schemas is None:
+        schemas = []
+        for func_name in funcs:
+            func = getattr(handler, func_name.split('.')[-1], None)
+            if inspect.isfunction(func) or inspect.ismethod(func):
+                schemas.append(await llm.get_tool_json(func=func))
+        _tool_schemas[key] = schemas
+        logger.debug(f'Built {len(schemas)} tool schema(s) of {type(handler).__name__}')
+    return list(schemas)
+
+
+def clear_tool_schemas() -> None:
+    """Drops the cached tool schemas, e.g. after the methods of a handler class were redefined at runtime."""
+    _tool_schemas.clear()
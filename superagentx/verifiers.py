@@ -0,0 +1,214 @@
+import inspect
+import json
+import logging
+import re
+from abc import ABC, abstractmethod
+from collections.abc import Callable
+from dataclasses import dataclass
+from json import JSONDecodeError
+from typing import Any, Literal
+
+from pydantic import BaseModel, ValidationError
+
+logger = logging.getLogger(__name__)
+
+
+@dataclass
+class Verification:
+    """
+    Decision of a goal verifier.
+
+    Attributes:
+        is_goal_satisfied: Whether the output satisfies the goal of the agent.
+        reason: Why the verifier decided so, returned as the reason of the goal result.
+        result: The verified output, e.g. the parsed JSON or the validated model, returned as the result of the goal
+            result.
+    """
+    is_goal_satisfied: bool
+    reason: str
+    result: Any = None
+
+
+def _output(results: list[Any], *, decode: bool = True) -> Any:
+    # The output of an agent is the result of its last engine stage, a single tool call unwrapped
+    output = results[-1] if results else None
+    while isinstance(output, list) and len(output) == 1:
+        output = output[0]
+    if decode and isinstance(output, str):
+        text = output.strip().removeprefix('```json').removesuffix('```').strip()
+        try:
+            return json.loads(text)
+        except JSONDecodeError:
+            return output
+    return output
+
+
+class GoalVerifier(ABC):
+    """
+    Deterministic check of the output of an agent, run before the LLM goal verification.
+
+    A verifier accepts or rejects the output, or returns `None` when it cannot decide, in which case the next verifier
+    or the LLM verification decides. A rejected output is retried like a goal the LLM found not satisfied.
+    """
+
+    def __init__(
+            self,
+            *,
+            on_failure: Literal['reject', 'fallback'] = 'reject',
+            name: str | None = None
+    ):
+        """
+        Args:
+            on_failure: What a failed check does: `reject` the output, or `fallback` to the next verifier and the
+                LLM verification. Default `reject`
+            name: Name of the verifier in logs and status events. Defaults to the class name.
+        """
+        if on_failure not in ('reject', 'fallback'):
+            raise ValueError(f'Unknown on_failure `{on_failure}`')
+        self.on_failure = on_failure
+        self.name = name or type(self).__name__
+
+    def __str__(self):
+        return self.name
+
+    @abstractmethod
+    async def verify(self, results: list[Any]) -> Verification | None:
+        """
+        Args:
+            results: The results of the engine stages of the agent.
+
+        Returns:
+            The decision, or `None` when the verifier cannot decide.
+        """
+        raise NotImplementedError
+
+    def _failed(self, reason: str, result: Any) -> Verification | None:
+        if self.on_failure == 'fallback':
+            logger.debug(f'{self.name} falls back to the next verifier: {reason}')
+            return None
+        return Verification(is_goal_satisfied=False, reason=reason, result=result)
+
+
+class JSONSchemaVerifier(GoalVerifier):
+    """
+    Accepts the output when it is JSON matching the given JSON schema. Requires the `jsonschema` package.
+    """
+
+    def __init__(
+            self,
+            schema: dict,
+            **kwargs
+    ):
+        super().__init__(**kwargs)
+        try:
+            import jsonschema
+        except ImportError:
+            raise ImportError('JSONSchemaVerifier requires jsonschema, install it with `pip install jsonschema`')
+        validator_cls = jsonschema.validators.validator_for(schema)
+        validator_cls.check_schema(schema)
+        self.schema = schema
+        self._validator = validator_cls(schema)
+
+    async def verify(self, results: list[Any]) -> Verification | None:
+        output = _output(results)
+        error = next(iter(self._validator.iter_errors(output)), None)
+        if error is not None:
+            return self._failed(f'Output does not match the JSON schema: {error.message}', output)
+        return Verification(is_goal_satisfied=True, reason='Output matches the JSON schema', result=output)
+
+
+class PydanticVerifier(GoalVerifier):
+    """
+    Accepts the output when it validates as the given Pydantic model. The result is the validated model dumped to a
+    dict.
+    """
+
+    def __init__(
+            self,
+            model: type[BaseModel],
+            **kwargs
+    ):
+        super().__init__(**kwargs)
+        self.model = model
+
+    async def verify(self, results: list[Any]) -> Verification | None:
+        output = _output(results)
+        try:
+            if isinstance(output, str):
+                validated = self.model.model_validate_json(output)
+            else:
+                validated = self.model.model_validate(output)
+        except ValidationError as ex:
+            return self._failed(f'Output is not a valid {self.model.__name__}: {ex}', output)
+        return Verification(
+            is_goal_satisfied=True,
+            reason=f'Output is a valid {self.model.__name__}',
+            result=validated.model_dump(mode='json')
+        )
+
+
+class RegexVerifier(GoalVerifier):
+    """
+    Accepts the output when the regular expression matches its text. Outputs which are not text are matched as JSON.
+    """
+
+    def __init__(
+            self,
+            pattern: str | re.Pattern,
+            *,
+            flags: int = 0,
+            full_match: bool = False,
+            **kwargs
+    ):
+        """
+        Args:
+            pattern: The regular expression.
+            flags: Flags of the regular expression, e.g. `re.IGNORECASE`. Default `0`
+            full_match: Whether the whole text has to match instead of any part of it. Default `False`
+        """
+        super().__init__(**kwargs)
+        self.pattern = re.compile(pattern, flags)
+        self.full_match = full_match
+
+    async def verify(self, results: list[Any]) -> Verification | None:
+        output = _output(results, decode=False)
+        text = output if isinstance(output, str) else json.dumps(output, default=str)
+        match = self.pattern.fullmatch(text) if self.full_match else self.pattern.search(text)
+        if match is None:
+            return self._failed(f'Output does not match `{self.pattern.pattern}`', output)
+        return Verification(is_goal_satisfied=True, reason=f'Output matches `{self.pattern.pattern}`', result=output)
+
+
+class CallableVerifier(GoalVerifier):
+    """
+    Decides with a custom function, sync or async, called with the results of the engine stages. The function returns
+    `True` or `False`, a `Verification`, or `None` when it cannot decide.
+    """
+
+    def __init__(
+            self,
+            func: Callable[[list[Any]], Any],
+            **kwargs
+    ):
+        kwargs.setdefault('name', getattr(func, '__name__', None))
+        super().__init__(**kwargs)
+        self.func = func
+
+    async def verify(self, results: list[Any]) -> Verification | None:
+        decision = self.func(results)
+        if inspect.isawaitable(decision):
+            decision = await decision
+        if decision is None or isinstance(decision, Verification):
+            return decision
+        output = _output(results)
+        if decision:
+            return Verification(is_goal_satisfied=True, reason=f'Accepted by {self.name}', result=output)
+        return self._failed(f'Rejected by {self.name}', output)
+
+
+def as_verifier(verifier: GoalVerifier | Callable) -> GoalVerifier:
+    if isinstance(verifier, GoalVerifier):
+        return verifier
+    if callable(verifier):
+        return CallableVerifier(verifier)
+    raise TypeError(f'Invalid goal verifier `{verifier}`')
@@ -0,0 +1,214 @@
+import asyncio
+
+import pytest
+
+from superagentx.agent import Agent
+from superagentx.base import BaseEngine
+from superagentx.db_store.db_storage import SQLiteStorage
+from superagentx.db_store.sql_status_enum import JobStatus
+from superagentx.exceptions import StopSuperAgentX
+from superagentx.job_queue import AgentJobQueue, AgentJobWorker
+from superagentx.result import GoalResult
+
+'''
+ Run Pytest:
+
+   1. pytest --log-cli-level=INFO tests/agent/test_agent_job_queue.py
+'''
+
+
+class EchoEngine(BaseEngine):
+
+    async def start(self, input_prompt: str, **kwargs):
+        return {"query": input_prompt}
+
+
+class FlakyAgent(Agent):
+
+    def __init__(self, failures: int, **kwargs):
+        super().__init__(**kwargs)
+        self.failures = failures
+        # Shared with the copies the workers execute
+        self.executions: list[Agent] = []
+
+    @property
+    def calls(self) -> int:
+        return len(self.executions)
+
+    async def execute(self, **kwargs) -> GoalResult:
+        self.executions.append(self)
+        if self.calls <= self.failures:
+            raise RuntimeError('agent unavailable')
+        return GoalResult(name=self.name, agent_id=self.agent_id, result={"calls": self.calls})
+
+
+class ScriptedAgent(Agent):
+
+    def __init__(self, outcome, **kwargs):
+        super().__init__(**kwargs)
+        self.outcome = outcome
+        self.executions: list[Agent] = []
+
+    @property
+    def calls(self) -> int:
+        return len(self.executions)
+
+    async def execute(self, **kwargs) -> GoalResult:
+        self.executions.append(self)
+        return await self.outcome(self)
+
+
+async def _rejected(agent: Agent) -> GoalResult:
+    raise StopSuperAgentX(
+        message='Execution rejected by human approval.',
+        goal_result=GoalResult(name=agent.name, agent_id=agent.agent_id, is_goal_satisfied=False)
+    )
+
+
+async def _unserializable(agent: Agent) -> GoalResult:
+    return GoalResult(name=agent.name, agent_id=agent.agent_id, result={"lock": asyncio.Lock()})
+
+
+async def _unsatisfied(agent: Agent) -> GoalResult:
+    if agent.calls == 1:
+        return GoalResult(name=agent.name, agent_id=agent.agent_id, reason='No sources', is_goal_satisfied=False)
+    return GoalResult(name=agent.name, agent_id=agent.agent_id, result='answer', is_goal_satisfied=True)
+
+
+async def _no_result(agent: Agent) -> None:
+    return None
+
+
+async def _slow(agent: Agent) -> GoalResult:
+    await asyncio.sleep(0.05)
+    return GoalResult(name=agent.name, agent_id=agent.agent_id, result=id(agent))
+
+
+@pytest.fixture
+async def storage(tmp_path):
+    _storage = SQLiteStorage(str(tmp_path / 'jobs.db'))
+    await _storage.setup()
+    yield _storage
+    await _storage.close()
+
+
+class TestAgentJobQueue:
+
+    async def test_worker_executes_queued_job(self, storage):
+        agent = Agent(name='echo', engines=[EchoEngine()])
+        queue = AgentJobQueue(storage=storage, poll_interval=0.01)
+        worker = AgentJobWorker(agents=[agent], storage=storage)
+
+        job_id = await queue.submit(agent, query_instruction='hello', verify_goal=False)
+        assert await worker.run_once()
+        assert not await worker.run_once()
+
+        goal_result = await queue.result(job_id, timeout=5)
+        assert goal_result.name == 'echo'
+        assert goal_result.result == [{"query": 'hello'}]
+
+    async def test_failed_job_is_retried_until_attempts_are_used_up(self, storage):
+        flaky = FlakyAgent(failures=1, name='flaky')
+        broken = FlakyAgent(failures=5, name='broken')
+        queue = AgentJobQueue(storage=storage, max_attempts=2, poll_interval=0.01)
+        worker = AgentJobWorker(agents=[flaky, broken], storage=storage, retry_delay=0, poll_interval=0.01)
+
+        flaky_job = await queue.submit(flaky, query_instruction='retry')
+        broken_job = await queue.submit(broken, query_instruction='retry')
+        stop_event = asyncio.Event()
+        run = asyncio.create_task(worker.run(stop_event))
+        try:
+            flaky_result = await queue.result(flaky_job, timeout=5)
+            broken_result = await queue.result(broken_job, timeout=5)
+        finally:
+            stop_event.set()
+            await run
+
+        assert flaky_result.result == {"calls": 2}
+        assert broken_result.error == 'agent unavailable'
+        assert broken.calls == 2
+
+    async def test_expired_lease_makes_job_visible_again(self, storage):
+        await storage.enqueue_job(job_id='job-1', agent_name='echo', payload={}, max_attempts=2)
+
+        leased = await storage.lease_job('worker-1', visibility_timeout=0)
+        assert leased["attempts"] == 1
+        await asyncio.sleep(0.01)
+
+        # worker-1 died, its lease expired
+        leased = await storage.lease_job('worker-2', visibility_timeout=60)
+        assert leased["job_id"] == 'job-1'
+        assert leased["attempts"] == 2
+        assert not await storage.complete_job('job-1', 'worker-1', result_data=None)
+        assert await storage.lease_job('worker-3', visibility_timeout=60) is None
+
+        assert await storage.complete_job('job-1', 'worker-2', result_data={"done": True})
+        job = await storage.get_job('job-1')
+        assert job["status"] == JobStatus.COMPLETED
+        assert job["result_data"] == {"done": True}
+
+    async def test_stopped_job_is_not_retried(self, storage):
+        agent = ScriptedAgent(_rejected, name='approval')
+        queue = AgentJobQueue(storage=storage, max_attempts=3, poll_interval=0.01)
+        worker = AgentJobWorker(agents=[agent], storage=storage, retry_delay=0)
+
+        job_id = await queue.submit(agent, query_instruction='publish')
+        assert await worker.run_once()
+        assert not await worker.run_once()
+
+        goal_result = await queue.result(job_id, timeout=5)
+        assert 'rejected by human approval' in goal_result.error
+        assert agent.calls == 1
+
+    async def test_unserializable_result_fails_the_attempt(self, storage):
+        agent = ScriptedAgent(_unserializable, name='locker')
+        queue = AgentJobQueue(storage=storage, max_attempts=1, poll_interval=0.01)
+        worker = AgentJobWorker(agents=[agent], storage=storage, retry_delay=0)
+
+        job_id = await queue.submit(agent, query_instruction='lock')
+        assert await worker.run_once()
+
+        # The lease is released right away instead of expiring
+        job = await storage.get_job(job_id)
+        assert job["status"] == JobStatus.FAILED
+        assert job["error"]
+
+    async def test_failed_goal_result_fails_the_attempt(self, storage):
+        unsatisfied = ScriptedAgent(_unsatisfied, name='unsatisfied')
+        empty = ScriptedAgent(_no_result, name='empty')
+        queue = AgentJobQueue(storage=storage, max_attempts=2, poll_interval=0.01)
+        worker = AgentJobWorker(agents=[unsatisfied, empty], storage=storage, retry_delay=0)
+
+        unsatisfied_job = await queue.submit(unsatisfied, query_instruction='answer')
+        empty_job = await queue.submit(empty, query_instruction='answer')
+        while await worker.run_once():
+            pass
+
+        # The unsatisfied goal is retried, the result of the retry completes the job
+        goal_result = await queue.result(unsatisfied_job, timeout=5)
+        assert goal_result.result == 'answer'
+        assert unsatisfied.calls == 2
+
+        goal_result = await queue.result(empty_job, timeout=5)
+        assert goal_result.error == 'Agent returned no result'
+        assert goal_result.is_goal_satisfied is False
+        assert empty.calls == 2
+
+    async def test_concurrent_jobs_run_on_separate_agents(self, storage):
+        agent = ScriptedAgent(_slow, name='slow')
+        queue = AgentJobQueue(storage=storage, poll_interval=0.01)
+        worker = AgentJobWorker(agents=[agent], storage=storage, max_in_flight=2, poll_interval=0.01)
+
+        job_ids = [await queue.submit(agent, query_instruction='slow') for _ in range(2)]
+        stop_event = asyncio.Event()
+        run = asyncio.create_task(worker.run(stop_event))
+        try:
+            results = [await queue.result(job_id, timeout=5) for job_id in job_ids]
+        finally:
+            stop_event.set()
+            await run
+
+        # Each job runs on its own copy, so the run state of the engines is never shared
+        assert len({goal_result.result for goal_result in results}) == 2
+        assert agent not in agent.executions
+        assert {executed.agent_id for executed in agent.executions} == {agent.agent_id}
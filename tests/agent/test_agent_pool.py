@@ -0,0 +1,68 @@
+import asyncio
+
+from superagentx.agent import Agent
+from superagentx.agent_pool import AgentPool
+from superagentx.base import BaseEngine
+from superagentx.engine import Engine
+from superagentx.handler.base import BaseHandler
+from superagentx.prompt import PromptTemplate
+from superagentx.task_engine import TaskEngine
+
+'''
+ Run Pytest:
+
+   1. pytest --log-cli-level=INFO tests/agent/test_agent_pool.py
+'''
+
+
+class StatefulEngine(BaseEngine):
+    """Keeps its run state on the instance, like `TaskEngine` and `BrowserEngine`."""
+
+    def __init__(self, **kwargs):
+        super().__init__(**kwargs)
+        self.query = None
+
+    async def start(self, input_prompt: str, **kwargs):
+        self.query = input_prompt
+        await asyncio.sleep(0.02)
+        return {"query": self.query}
+
+
+class EchoHandler(BaseHandler):
+
+    async def echo(self, text: str):
+        return text
+
+
+class TestAgentPool:
+
+    async def test_clone_shares_configuration_not_engines(self):
+        prompt_template = PromptTemplate()
+        handler = EchoHandler()
+        tool_engine = Engine(handler=handler, llm=None, prompt_template=prompt_template)
+        task_engine = TaskEngine(handler=handler, instructions=[{"echo": {"text": 'hi'}}])
+        agent = Agent(name='echo', prompt_template=prompt_template, engines=[tool_engine, [task_engine]])
+        await task_engine.start(input_prompt='warm up')
+
+        clone = agent.clone()
+
+        assert (clone.name, clone.agent_id) == (agent.name, agent.agent_id)
+        assert clone.engines[0] is not tool_engine
+        assert clone.engines[0].handler is handler
+        assert clone.engines[0].prompt_template is prompt_template
+        assert clone.engines[1][0] is not task_engine
+        assert clone.engines[1][0].results == [] and task_engine.results
+
+    async def test_concurrent_executions_are_isolated(self):
+        pool = AgentPool(Agent(name='stateful', engines=[StatefulEngine()]), max_size=3, min_size=1)
+
+        results = await asyncio.gather(*[
+            pool.execute(query_instruction=f'query-{idx}', verify_goal=False)
+            for idx in range(6)
+        ])
+
+        assert [result.result for result in results] == [
+            [{"query": f'query-{idx}'}] for idx in range(6)
+        ]
+        assert pool.size == 3
+        assert pool.idle == 3
@@ -0,0 +1,133 @@
+from datetime import datetime, timezone
+
+import httpx
+import openai
+
+from superagentx.agent import Agent
+from superagentx.base import BaseEngine
+from superagentx.engine import Engine
+from superagentx.exceptions import InvalidType
+from superagentx.handler.base import BaseHandler
+from superagentx.handler.decorators import tool
+from superagentx.handler.exceptions import InvalidHandler
+from superagentx.llm.types.response import Message, Tool
+from superagentx.prompt import PromptTemplate
+from superagentx.utils.retry import backoff_delay, is_retryable
+
+'''
+ Run Pytest:
+
+   1. pytest --log-cli-level=INFO tests/agent/test_agent_retry.py
+'''
+
+
+class RateLimited(Exception):
+    status_code = 429
+
+
+class CountingEngine(BaseEngine):
+
+    def __init__(self, name: str, failures: int = 0, error: type[Exception] = RateLimited, **kwargs):
+        super().__init__(**kwargs)
+        self.name = name
+        self.failures = failures
+        self.error = error
+        self.calls = 0
+
+    async def start(self, input_prompt: str, **kwargs):
+        self.calls += 1
+        if self.calls <= self.failures:
+            raise self.error(f'{self.name} failed')
+        return {"engine": self.name}
+
+
+class StockHandler(BaseHandler):
+
+    @tool
+    async def stock(self, item: str):
+        return {"item": item, "stock": len(item)}
+
+
+class GuessingLLM:
+    """Makes up the argument name of the tool on its first call."""
+
+    def __init__(self):
+        self.calls = 0
+
+    async def get_tool_json(self, func):
+        return {"type": 'function', "function": {"name": func.__name__}}
+
+    async def afunc_chat_completion(self, **kwargs):
+        self.calls += 1
+        arguments = {"fruit": 'apple'} if self.calls == 1 else {"item": 'apple'}
+        return [Message(
+            role='assistant',
+            model='fake',
+            tool_calls=[Tool(id=f'call-{self.calls}', tool_type='function', name='stock', arguments=arguments)],
+            created=datetime.now(tz=timezone.utc)
+        )]
+
+
+class TestAgentRetry:
+
+    async def test_retries_only_failed_engines(self):
+        search = CountingEngine('search')
+        fetch = CountingEngine('fetch')
+        flaky = CountingEngine('flaky', failures=2)
+        summary = CountingEngine('summary')
+        agent = Agent(name='retrying', engines=[search, [fetch, flaky], summary], retry_delay=0)
+
+        result = await agent.execute(query_instruction='retry', verify_goal=False)
+
+        assert result.result == [
+            {"engine": 'search'},
+            [{"engine": 'fetch'}, {"engine": 'flaky'}],
+            {"engine": 'summary'}
+        ]
+        assert (search.calls, fetch.calls, flaky.calls, summary.calls) == (1, 1, 3, 1)
+
+    async def test_fatal_error_is_not_retried(self):
+        events = []
+
+        def status(**kwargs):
+            events.append(kwargs)
+
+        invalid = CountingEngine('invalid', failures=1, error=InvalidType)
+        agent = Agent(name='fatal', engines=[invalid], retry_delay=0)
+
+        result = await agent.execute(query_instruction='fail', verify_goal=False, status_callback=status)
+
+        assert result is None
+        assert invalid.calls == 1
+        errors = [event for event in events if event["event"] == 'agent_execute_error']
+        assert [error["retryable"] for error in errors] == [False]
+
+    async def test_invalid_tool_arguments_are_retried(self):
+        llm = GuessingLLM()
+        engine = Engine(handler=StockHandler(), llm=llm, prompt_template=PromptTemplate())
+        agent = Agent(name='stock', engines=[engine], retry_delay=0)
+
+        result = await agent.execute(query_instruction='Stock of apples?', verify_goal=False)
+
+        assert llm.calls == 2
+        assert result.result == [[{"item": 'apple', "stock": 5}]]
+
+    def test_error_classification(self):
+        request = httpx.Request('POST', 'https://api.example.com')
+        assert is_retryable(RateLimited())
+        assert is_retryable(TimeoutError())
+        assert is_retryable(openai.APITimeoutError(request=request))
+        assert is_retryable(httpx.ConnectTimeout('timeout', request=request))
+        assert is_retryable(RuntimeError('unknown'))
+        assert is_retryable(TypeError("stock() got an unexpected keyword argument 'fruit'"))
+        assert not is_retryable(InvalidType('invalid'))
+        assert not is_retryable(InvalidHandler('invalid'))
+        assert not is_retryable(
+            openai.AuthenticationError('invalid key', response=httpx.Response(401, request=request), body=None)
+        )
+
+    def test_backoff_is_jittered_and_capped(self):
+        delays = [backoff_delay(attempt, base_delay=1, max_delay=5) for attempt in range(1, 10) for _ in range(20)]
+        assert all(0 <= delay <= 5 for delay in delays)
+        assert len(set(delays)) > 1
+        assert max(backoff_delay(1, base_delay=1, max_delay=5) for _ in range(50)) <= 1
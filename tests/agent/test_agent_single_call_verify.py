@@ -0,0 +1,101 @@
+import json
+from datetime import datetime, timezone
+from types import SimpleNamespace
+
+from superagentx.agent import Agent
+from superagentx.engine import Engine
+from superagentx.handler.base import BaseHandler
+from superagentx.handler.decorators import tool
+from superagentx.llm.types.response import Message, Tool
+from superagentx.prompt import PromptTemplate
+
+'''
+ Run Pytest:
+
+   1. pytest --log-cli-level=INFO tests/agent/test_agent_single_call_verify.py
+'''
+
+
+class WeatherHandler(BaseHandler):
+
+    @tool
+    async def weather(self, city: str):
+        return {"city": city, "celsius": 31.5}
+
+
+class ToolCallingLLM:
+
+    def __init__(self, tool_content: str | None, answer: str | None = None):
+        self.tool_content = tool_content
+        self.answer = answer
+        self.tool_calls = 0
+        self.verify_calls = 0
+
+    async def get_tool_json(self, func):
+        return {"type": 'function', "function": {"name": func.__name__}}
+
+    async def afunc_chat_completion(self, **kwargs):
+        self.tool_calls += 1
+        if self.tool_calls > 1:
+            # The final answer, once the tool results were sent back
+            return [Message(role='assistant', model='fake', content=self.answer, created=datetime.now(tz=timezone.utc))]
+        return [
+            Message(
+                role='assistant',
+                model='fake',
+                content=self.tool_content,
+                tool_calls=[Tool(id='call-0', tool_type='function', name='weather', arguments={"city": 'Chennai'})],
+                created=datetime.now(tz=timezone.utc)
+            )
+        ]
+
+    async def achat_completion(self, **kwargs):
+        self.verify_calls += 1
+        content = json.dumps({"reason": 'verified separately', "result": 'llm', "is_goal_satisfied": True})
+        return SimpleNamespace(choices=[SimpleNamespace(message=SimpleNamespace(content=content))])
+
+
+def _agent(llm: ToolCallingLLM, max_iterations: int = 1) -> Agent:
+    prompt_template = PromptTemplate()
+    engine = Engine(handler=WeatherHandler(), llm=llm, prompt_template=prompt_template, max_iterations=max_iterations)
+    return Agent(
+        name='weather',
+        goal='Get the weather of the city',
+        llm=llm,
+        prompt_template=prompt_template,
+        engines=[engine],
+        single_call_verify=True
+    )
+
+
+_VERDICT = '```json\n{"reason": "Weather tool answers it", "result": "31.5 C", "is_goal_satisfied": true}\n```'
+
+
+class TestAgentSingleCallVerify:
+
+    async def test_final_answer_verdict_skips_verification_call(self):
+        llm = ToolCallingLLM(None, answer=_VERDICT)
+
+        result = await _agent(llm, max_iterations=2).execute(query_instruction='Weather in Chennai?')
+
+        assert result.is_goal_satisfied
+        assert result.reason == 'Weather tool answers it'
+        assert result.result == [[{"city": 'Chennai', "celsius": 31.5}, '31.5 C']]
+        assert (llm.tool_calls, llm.verify_calls) == (2, 0)
+
+    async def test_verdict_along_with_tool_calls_is_not_used(self):
+        # Given before the tool ran, the verdict only predicts the outcome
+        llm = ToolCallingLLM(_VERDICT)
+
+        result = await _agent(llm).execute(query_instruction='Weather in Chennai?')
+
+        assert result.reason == 'verified separately'
+        assert (llm.tool_calls, llm.verify_calls) == (1, 1)
+
+    async def test_unparsable_verdict_falls_back_to_separate_verification(self):
+        llm = ToolCallingLLM(None, answer='It is sunny in Chennai')
+
+        result = await _agent(llm, max_iterations=2).execute(query_instruction='Weather in Chennai?')
+
+        assert result.reason == 'verified separately'
+        assert (llm.tool_calls, llm.verify_calls) == (2, 1)
@@ -0,0 +1,133 @@
+import json
+import re
+from types import SimpleNamespace
+
+from pydantic import BaseModel
+
+from superagentx.agent import Agent
+from superagentx.base import BaseEngine
+from superagentx.prompt import PromptTemplate
+from superagentx.verifiers import JSONSchemaVerifier, PydanticVerifier, RegexVerifier
+
+'''
+ Run Pytest:
+
+   1. pytest --log-cli-level=INFO tests/agent/test_agent_verifiers.py
+'''
+
+
+class Forecast(BaseModel):
+    city: str
+    celsius: float
+
+
+class OutputEngine(BaseEngine):
+
+    def __init__(self, outputs: list, **kwargs):
+        super().__init__(**kwargs)
+        self.outputs = outputs
+        self.calls = 0
+
+    async def start(self, input_prompt: str, **kwargs):
+        output = self.outputs[min(self.calls, len(self.outputs) - 1)]
+        self.calls += 1
+        return output
+
+
+class VerifyingLLM:
+
+    def __init__(self):
+        self.calls = 0
+
+    async def achat_completion(self, **kwargs):
+        self.calls += 1
+        content = json.dumps({"reason": 'checked by llm', "result": 'llm', "is_goal_satisfied": True})
+        return SimpleNamespace(choices=[SimpleNamespace(message=SimpleNamespace(content=content))])
+
+
+def _agent(engine: OutputEngine, llm: VerifyingLLM | None, verifiers: list) -> Agent:
+    return Agent(
+        name='forecaster',
+        goal='Forecast the weather',
+        llm=llm,
+        prompt_template=PromptTemplate(),
+        engines=[engine],
+        verifiers=verifiers,
+        retry_delay=0
+    )
+
+
+class TestAgentVerifiers:
+
+    async def test_structured_output_skips_llm_verification(self):
+        llm = VerifyingLLM()
+        engine = OutputEngine(['```json\n{"city": "Chennai", "celsius": "31.5"}\n```'])
+        agent = _agent(engine, llm, [PydanticVerifier(Forecast)])
+
+        result = await agent.execute(query_instruction='Weather in Chennai?')
+
+        assert result.is_goal_satisfied
+        assert result.result == {"city": 'Chennai', "celsius": 31.5}
+        assert llm.calls == 0
+
+    async def test_rejected_output_is_retried(self):
+        llm = VerifyingLLM()
+        schema = {
+            "type": 'object',
+            "properties": {"city": {"type": 'string'}, "celsius": {"type": 'number'}},
+            "required": ['city', 'celsius']
+        }
+        engine = OutputEngine([{"city": 'Chennai'}, {"city": 'Chennai', "celsius": 31.5}])
+        agent = _agent(engine, llm, [JSONSchemaVerifier(schema)])
+
+        result = await agent.execute(query_instruction='Weather in Chennai?')
+
+        assert result.is_goal_satisfied
+        assert engine.calls == 2
+        assert llm.calls == 0
+
+    async def test_undecided_verifiers_fall_back_to_llm(self):
+        llm = VerifyingLLM()
+        engine = OutputEngine(['It is sunny'])
+        agent = _agent(engine, llm, [
+            RegexVerifier(r'\d+(\.\d+)?\s*°C', on_failure='fallback'),
+            lambda results: None
+        ])
+
+        result = await agent.execute(query_instruction='Weather in Chennai?')
+
+        assert result.reason == 'checked by llm'
+        assert llm.calls == 1
+
+    async def test_callable_verifier(self):
+        llm = VerifyingLLM()
+        engine = OutputEngine(['31.5 °C in Chennai'])
+        agent = _agent(engine, llm, [
+            lambda results: bool(re.search('Chennai', results[-1]))
+        ])
+
+        result = await agent.execute(query_instruction='Weather in Chennai?')
+
+        assert result.is_goal_satisfied
+        assert result.result == '31.5 °C in Chennai'
+        assert llm.calls == 0
+
+    async def test_verifiers_run_without_llm(self):
+        engine = OutputEngine(['It is sunny', '31.5 °C in Chennai'])
+        agent = _agent(engine, None, [RegexVerifier(r'\d+(\.\d+)?\s*°C')])
+
+        result = await agent.execute(query_instruction='Weather in Chennai?')
+
+        assert result.is_goal_satisfied
+        assert result.result == '31.5 °C in Chennai'
+        assert engine.calls == 2
+
+    async def test_undecided_verifiers_without_llm_accept_the_output(self):
+        engine = OutputEngine(['It is sunny'])
+        agent = _agent(engine, None, [lambda results: None])
+
+        result = await agent.execute(query_instruction='Weather in Chennai?')
+
+        assert result.verify_goal is False
+        assert result.result == ['It is sunny']
+        assert engine.calls == 1
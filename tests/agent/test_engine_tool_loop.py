@@ -0,0 +1,126 @@
+import asyncio
+import json
+from datetime import datetime, timezone
+
+import pytest
+
+from superagentx.engine import Engine
+from superagentx.handler.base import BaseHandler
+from superagentx.handler.decorators import tool
+from superagentx.llm.types.response import Message, Tool
+from superagentx.prompt import PromptTemplate
+
+'''
+ Run Pytest:
+
+   1. pytest --log-cli-level=INFO tests/agent/test_engine_tool_loop.py
+'''
+
+
+class InventoryHandler(BaseHandler):
+
+    def __init__(self, **kwargs):
+        super().__init__(**kwargs)
+        self.running = 0
+        self.peak = 0
+        self.restocked = None
+
+    @tool
+    async def stock(self, item: str):
+        self.running += 1
+        self.peak = max(self.peak, self.running)
+        await asyncio.sleep(0.05)
+        self.running -= 1
+        return {"item": item, "stock": len(item)}
+
+    @tool
+    async def restock(self, item: str):
+        if item == 'kiwi':
+            raise ConnectionError('Warehouse unavailable')
+        await asyncio.sleep(0.05)
+        self.restocked = item
+        return {"item": item, "restocked": True}
+
+
+def _message(content: str | None = None, tool_calls: list[Tool] | None = None) -> Message:
+    return Message(
+        role='assistant',
+        model='fake',
+        content=content,
+        tool_calls=tool_calls,
+        created=datetime.now(tz=timezone.utc)
+    )
+
+
+class ScriptedLLM:
+
+    def __init__(self, items: list[str]):
+        self.items = items
+        self.requests = []
+
+    async def get_tool_json(self, func):
+        return {"type": 'function', "function": {"name": func.__name__}}
+
+    async def afunc_chat_completion(self, *, chat_completion_params, **kwargs):
+        self.requests.append(chat_completion_params.model_dump(exclude_none=True)["messages"])
+        if len(self.requests) == 1:
+            return [_message(tool_calls=[
+                Tool(id=f'call-{idx}', tool_type='function', name='stock', arguments={"item": item})
+                for idx, item in enumerate(self.items)
+            ])]
+        results = [json.loads(message["content"]) for message in self.requests[-1] if message["role"] == 'tool']
+        return [_message(content=f'Total stock {sum(result["stock"] for result in results)}')]
+
+
+def _engine(llm: ScriptedLLM, handler: InventoryHandler, **kwargs) -> Engine:
+    return Engine(handler=handler, llm=llm, prompt_template=PromptTemplate(), **kwargs)
+
+
+class TestEngineToolLoop:
+
+    async def test_tool_results_are_sent_back(self):
+        handler = InventoryHandler()
+        llm = ScriptedLLM(['apple', 'kiwi', 'banana'])
+        engine = _engine(llm, handler, max_iterations=3)
+
+        loop = asyncio.get_running_loop()
+        started = loop.time()
+        results = await engine.start(input_prompt='How many fruits are in stock?')
+
+        # The tool calls of one message run concurrently
+        assert loop.time() - started < 0.12
+        assert handler.peak == 3
+        assert results[-1] == 'Total stock 15'
+        assert len(llm.requests) == 2
+        feedback = llm.requests[1][-4:]
+        assert [message["role"] for message in feedback] == ['assistant', 'tool', 'tool', 'tool']
+        assert [call["id"] for call in feedback[0]["tool_calls"]] == ['call-0', 'call-1', 'call-2']
+
+    async def test_single_iteration_by_default(self):
+        llm = ScriptedLLM(['apple'])
+        results = await _engine(llm, InventoryHandler()).start(input_prompt='Stock of apples?')
+
+        assert results == [{"item": 'apple', "stock": 5}]
+        assert len(llm.requests) == 1
+
+    async def test_per_tool_concurrency_limit(self):
+        handler = InventoryHandler()
+        engine = _engine(ScriptedLLM(['apple', 'kiwi', 'banana']), handler, tool_concurrency={"stock": 2})
+
+        await engine.start(input_prompt='How many fruits are in stock?')
+
+        assert handler.peak == 2
+
+    async def test_failed_tool_call_waits_for_the_other_calls(self):
+        handler = InventoryHandler()
+        engine = _engine(ScriptedLLM([]), handler)
+        tool_calls = [
+            Tool(id='call-0', tool_type='function', name='restock', arguments={"item": 'apple'}),
+            Tool(id='call-1', tool_type='function', name='restock', arguments={"item": 'kiwi'})
+        ]
+
+        with pytest.raises(ConnectionError):
+            await engine._call_tools(tool_calls=tool_calls, deadline=None)
+
+        # The failure is raised once the other call finished, nothing keeps running behind the retry
+        assert handler.restocked == 'apple'
@@ -0,0 +1,91 @@
+import asyncio
+import os
+import signal
+import sys
+import textwrap
+
+import pytest
+
+from superagentx.handler.mcp import MCPHandler
+
+'''
+ Run Pytest:
+
+   1. pytest --log-cli-level=INFO tests/handlers/test_mcp_session_pool.py
+'''
+
+_SERVER = textwrap.dedent('''
+    import asyncio
+    import os
+
+    from mcp.server.fastmcp import FastMCP
+
+    mcp = FastMCP("pid")
+
+
+    @mcp.tool()
+    async def pid(seconds: float = 0) -> int:
+        """Process id of the server."""
+        await asyncio.sleep(seconds)
+        return os.getpid()
+
+
+    @mcp.tool()
+    def crash(marker: str) -> int:
+        """Records the call in the marker file and exits the server."""
+        with open(marker, "a") as f:
+            f.write("crash\\n")
+        os._exit(1)
+
+
+    mcp.run()
+''')
+
+
+def _pid(result) -> int:
+    return int(result.content[0].text)
+
+
+@pytest.fixture
+async def mcp_handler(tmp_path):
+    server = tmp_path / 'pid_server.py'
+    server.write_text(_SERVER)
+    handler = MCPHandler(command=sys.executable, mcp_args=[str(server)], pool_size=2)
+    yield handler
+    await handler.cleanup()
+
+
+class TestMCPSessionPool:
+
+    async def test_session_is_reused_across_calls(self, mcp_handler: MCPHandler):
+        tools = await mcp_handler.get_mcp_tools()
+        assert sorted(tool.__name__ for tool in tools) == ['crash', 'pid']
+
+        first = _pid(await mcp_handler.call_tool('pid'))
+        second = _pid(await mcp_handler.call_tool('pid'))
+        assert first == second
+
+    async def test_concurrent_calls_use_separate_sessions(self, mcp_handler: MCPHandler):
+        results = await asyncio.gather(*[
+            mcp_handler.call_tool('pid', arguments={"seconds": 0.3}) for _ in range(2)
+        ])
+        assert len({_pid(result) for result in results}) == 2
+
+    async def test_lost_session_reconnects(self, mcp_handler: MCPHandler, tmp_path):
+        marker = tmp_path / 'crash.log'
+        first = _pid(await mcp_handler.call_tool('pid'))
+        with pytest.raises(Exception):
+            await mcp_handler.call_tool('crash', arguments={"marker": str(marker)})
+
+        # The tool call is not sent again, the exited server is replaced by the next call
+        assert marker.read_text().splitlines() == ['crash']
+        assert _pid(await mcp_handler.call_tool('pid')) != first
+
+    async def test_listing_tools_is_retried_over_a_new_session(self, mcp_handler: MCPHandler):
+        first = _pid(await mcp_handler.call_tool('pid'))
+        # The server of the idle session exits without the pool noticing
+        os.kill(first, signal.SIGKILL)
+        await asyncio.sleep(0.2)
+
+        tools = await mcp_handler.get_mcp_tools()
+        assert sorted(tool.__name__ for tool in tools) == ['crash', 'pid']
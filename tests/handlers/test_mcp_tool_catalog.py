@@ -0,0 +1,112 @@
+import asyncio
+import sys
+import textwrap
+
+import pytest
+
+from superagentx.handler.mcp import MCPHandler
+
+'''
+ Run Pytest:
+
+   1. pytest --log-cli-level=INFO tests/handlers/test_mcp_tool_catalog.py
+'''
+
+_SERVER = textwrap.dedent('''
+    from mcp.server.fastmcp import Context, FastMCP
+
+    mcp = FastMCP("catalog")
+
+
+    def echo(text: str) -> str:
+        """Echoes the text."""
+        return text
+
+
+    @mcp.tool()
+    def add(a: int, b: int) -> int:
+        """Adds two numbers."""
+        return a + b
+
+
+    @mcp.tool()
+    async def register_echo(ctx: Context) -> str:
+        """Registers the echo tool."""
+        mcp.add_tool(echo)
+        await ctx.session.send_tool_list_changed()
+        return "registered"
+
+
+    mcp.run()
+''')
+
+
+class CountingMCPHandler(MCPHandler):
+
+    def __init__(self, **kwargs):
+        super().__init__(**kwargs)
+        self.listings = 0
+
+    async def _list_tools(self):
+        self.listings += 1
+        return await super()._list_tools()
+
+
+class SchemaLLM:
+
+    def __init__(self):
+        self.built = 0
+
+    async def get_tool_json(self, func):
+        self.built += 1
+        return {"type": 'function', "function": {"name": func.__name__}}
+
+
+@pytest.fixture
+def server(tmp_path):
+    path = tmp_path / 'catalog_server.py'
+    path.write_text(_SERVER)
+    return str(path)
+
+
+class TestMCPToolCatalog:
+
+    async def test_catalog_is_listed_once(self, server):
+        handler = CountingMCPHandler(command=sys.executable, mcp_args=[server])
+        llm = SchemaLLM()
+        try:
+            results = await asyncio.gather(*[handler.get_mcp_tool_schemas(llm=llm) for _ in range(3)])
+            await handler.get_mcp_tools()
+
+            assert handler.listings == 1
+            assert llm.built == 2
+            assert all(
+                sorted(schema["function"]["name"] for schema in schemas) == ['add', 'register_echo']
+                for schemas in results
+            )
+        finally:
+            await handler.cleanup()
+
+    async def test_list_changed_notification_refreshes_catalog(self, server):
+        handler = CountingMCPHandler(command=sys.executable, mcp_args=[server])
+        try:
+            tools = await handler.get_mcp_tools()
+            assert 'echo' not in [tool.__name__ for tool in tools]
+
+            await handler.call_tool('register_echo')
+            tools = await handler.get_mcp_tools()
+
+            assert handler.listings == 2
+            assert 'echo' in [tool.__name__ for tool in tools]
+        finally:
+            await handler.cleanup()
+
+    async def test_catalog_expires_after_ttl(self, server):
+        handler = CountingMCPHandler(command=sys.executable, mcp_args=[server], tools_cache_ttl=0)
+        try:
+            await handler.get_mcp_tools()
+            await handler.get_mcp_tools()
+
+            assert handler.listings == 2
+        finally:
+            await handler.cleanup()
@@ -0,0 +1,132 @@
+import asyncio
+import gc
+
+import pytest
+
+from superagentx.handler.base import BaseHandler
+from superagentx.handler.decorators import tool
+from superagentx.task_engine import TaskEngine
+
+'''
+ Run Pytest:
+
+   1. pytest --log-cli-level=INFO tests/handlers/test_tool_result_cache.py
+'''
+
+
+class SearchHandler(BaseHandler):
+
+    def __init__(self, **kwargs):
+        super().__init__(**kwargs)
+        self.calls = 0
+
+    @tool(cache_ttl=60)
+    async def search(self, query: str, limit: int = 5):
+        self.calls += 1
+        await asyncio.sleep(0.05)
+        return {"query": query, "limit": limit, "call": self.calls}
+
+    @tool(cache_ttl=0.05, cache_key=lambda query, **_: query.casefold())
+    async def quote(self, query: str):
+        self.calls += 1
+        if query == 'fail':
+            raise ConnectionError('Quote service unavailable')
+        if query == 'slow failure':
+            await asyncio.sleep(0.05)
+            raise ConnectionError('Quote service unavailable')
+        return {"query": query, "call": self.calls}
+
+    @tool
+    async def lookup(self, query: str):
+        self.calls += 1
+        return query
+
+
+class TestToolResultCache:
+
+    async def test_repeated_calls_are_served_from_cache(self):
+        handler = SearchHandler()
+
+        first = await handler.search(query='agents')
+        # Defaults are part of the key, so an explicit default is the same call
+        second = await handler.search('agents', limit=5)
+        other = await handler.search(query='agents', limit=10)
+
+        assert first is second
+        assert other["call"] == 2
+        assert handler.calls == 2
+        assert 'search' in handler.tools
+
+    async def test_concurrent_calls_are_coalesced(self):
+        handler = SearchHandler()
+
+        results = await asyncio.gather(*[handler.search(query='agents') for _ in range(5)])
+
+        assert handler.calls == 1
+        assert all(result is results[0] for result in results)
+
+    async def test_cache_key_and_ttl(self):
+        handler = SearchHandler()
+
+        await handler.quote(query='ACME')
+        await handler.quote(query='acme')
+        assert handler.calls == 1
+
+        await asyncio.sleep(0.06)
+        await handler.quote(query='acme')
+        assert handler.calls == 2
+
+    async def test_failures_are_not_cached(self):
+        handler = SearchHandler()
+
+        for _ in range(2):
+            with pytest.raises(ConnectionError):
+                await handler.quote(query='fail')
+        assert handler.calls == 2
+
+    async def test_failure_without_callers_is_retrieved(self):
+        loop = asyncio.get_running_loop()
+        errors = []
+        loop.set_exception_handler(lambda _loop, context: errors.append(context))
+        handler = SearchHandler()
+
+        # The only caller gives up, the shared execution fails afterwards
+        with pytest.raises(TimeoutError):
+            await asyncio.wait_for(handler.quote(query='slow failure'), timeout=0.01)
+        await asyncio.sleep(0.1)
+        gc.collect()
+
+        assert handler.calls == 1
+        assert errors == []
+
+    async def test_cache_per_handler_and_clear(self):
+        first, second = SearchHandler(), SearchHandler()
+
+        await first.search(query='agents')
+        await second.search(query='agents')
+        assert (first.calls, second.calls) == (1, 1)
+
+        first.search.cache_clear()
+        await first.search(query='agents')
+        assert first.calls == 2
+
+    async def test_uncached_tool(self):
+        handler = SearchHandler()
+
+        await handler.lookup(query='agents')
+        await handler.lookup(query='agents')
+        assert handler.calls == 2
+
+    async def test_task_engine_parallel_steps_share_execution(self):
+        handler = SearchHandler()
+        engine = TaskEngine(
+            handler=handler,
+            instructions=[
+                [{"search": {"query": 'agents'}}, {"search": {"query": 'agents'}}],
+                {"search": {"query": 'agents'}}
+            ]
+        )
+
+        await engine.start(input_prompt='search agents')
+
+        assert handler.calls == 1
@@ -0,0 +1,71 @@
+from superagentx.engine import Engine
+from superagentx.handler.base import BaseHandler
+from superagentx.handler.decorators import tool
+from superagentx.prompt import PromptTemplate
+from superagentx.utils.tool_schema import clear_tool_schemas, handler_tool_schemas
+
+'''
+ Run Pytest:
+
+   1. pytest --log-cli-level=INFO tests/llm/test_tool_schema_cache.py
+'''
+
+
+class WeatherHandler(BaseHandler):
+
+    @tool
+    async def forecast(self, city: str):
+        """Forecast of the city."""
+        return city
+
+    @tool
+    async def history(self, city: str, days: int):
+        """Weather history of the city."""
+        return city
+
+
+class SchemaLLM:
+
+    def __init__(self, provider: str = 'openai'):
+        self.provider = provider
+        self.calls = 0
+
+    async def get_tool_json(self, func):
+        self.calls += 1
+        return {"provider": self.provider, "name": func.__name__}
+
+
+class BedrockSchemaLLM(SchemaLLM):
+    pass
+
+
+class TestToolSchemaCache:
+
+    def setup_method(self):
+        clear_tool_schemas()
+
+    async def test_schemas_are_built_once_per_handler_class(self):
+        llm = SchemaLLM()
+        engines = [
+            Engine(handler=WeatherHandler(), llm=llm, prompt_template=PromptTemplate())
+            for _ in range(3)
+        ]
+
+        for engine in engines:
+            tools = await engine._construct_tools()
+            assert [schema["name"] for schema in tools] == ['forecast', 'history']
+
+        assert llm.calls == 2
+
+    async def test_tool_set_and_provider_format_have_own_schemas(self):
+        handler = WeatherHandler()
+        llm = SchemaLLM()
+
+        assert len(await handler_tool_schemas(llm=llm, handler=handler, funcs=['forecast'])) == 1
+        assert len(await handler_tool_schemas(llm=llm, handler=handler, funcs=['forecast', 'history'])) == 2
+        assert llm.calls == 3
+
+        bedrock = BedrockSchemaLLM('bedrock')
+        tools = await handler_tool_schemas(llm=bedrock, handler=handler, funcs=['forecast'])
+        assert tools == [{"provider": 'bedrock', "name": 'forecast'}]
+        assert bedrock.calls == 1
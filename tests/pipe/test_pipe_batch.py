@@ -0,0 +1,53 @@
+import asyncio
+
+from superagentx.agent import Agent
+from superagentx.agentxpipe import AgentXPipe
+from superagentx.base import BaseEngine
+
+'''
+ Run Pytest:
+
+   1. pytest --log-cli-level=INFO tests/pipe/test_pipe_batch.py
+'''
+
+
+class EchoEngine(BaseEngine):
+
+    def __init__(self, **kwargs):
+        super().__init__(**kwargs)
+        self.running = 0
+        self.peak = 0
+
+    async def start(self, input_prompt: str, **kwargs):
+        self.running += 1
+        self.peak = max(self.peak, self.running)
+        await asyncio.sleep(0.01)
+        self.running -= 1
+        return {"echo": input_prompt}
+
+
+class TestPipeBatch:
+
+    async def test_flow_many_bounded_window(self):
+        engine = EchoEngine()
+        pipe = AgentXPipe(agents=[Agent(name='echo', engines=[engine])])
+        queries = (f'query-{idx}' for idx in range(50))
+
+        seen = {}
+        async for query, results in pipe.flow_many(queries, max_in_flight=5):
+            seen[query] = results
+
+        assert len(seen) == 50
+        assert engine.peak == 5
+        for query, results in seen.items():
+            assert results[0].result == [{"echo": query}]
+
+    async def test_flow_many_async_iterable(self):
+        pipe = AgentXPipe(agents=[Agent(name='echo', engines=[EchoEngine()])])
+
+        async def _queries():
+            for idx in range(3):
+                yield f'query-{idx}'
+
+        seen = [query async for query, _ in pipe.flow_many(_queries(), max_in_flight=2)]
+        assert sorted(seen) == ['query-0', 'query-1', 'query-2']
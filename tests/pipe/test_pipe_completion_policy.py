@@ -0,0 +1,96 @@
+import asyncio
+
+import pytest
+
+from superagentx.agent import Agent
+from superagentx.agentxpipe import AgentXPipe
+from superagentx.base import BaseEngine
+from superagentx.parallel_group import CompletionPolicy, ParallelGroup
+from superagentx.result import GoalResult
+
+'''
+ Run Pytest:
+
+   1. pytest --log-cli-level=INFO tests/pipe/test_pipe_completion_policy.py
+'''
+
+
+class SleepEngine(BaseEngine):
+
+    def __init__(self, seconds: float, **kwargs):
+        super().__init__(**kwargs)
+        self.seconds = seconds
+        self.cancelled = False
+
+    async def start(self, input_prompt: str, **kwargs):
+        try:
+            await asyncio.sleep(self.seconds)
+        except asyncio.CancelledError:
+            self.cancelled = True
+            raise
+        return {"slept": self.seconds}
+
+
+class CancelledAgent(Agent):
+
+    async def execute(self, **kwargs) -> GoalResult:
+        await asyncio.sleep(0.01)
+        raise asyncio.CancelledError()
+
+
+def _agents(*seconds: float) -> list[Agent]:
+    return [
+        Agent(name=f'agent-{idx}', engines=[SleepEngine(_seconds)])
+        for idx, _seconds in enumerate(seconds)
+    ]
+
+
+class TestPipeCompletionPolicy:
+
+    async def test_first_satisfied_cancels_the_rest(self):
+        agents = _agents(5, 0.01, 5)
+        pipe = AgentXPipe(
+            agents=[ParallelGroup(agents, completion_policy=CompletionPolicy.first_satisfied())]
+        )
+
+        results = await pipe.flow(query_instruction='policy')
+
+        assert [goal_result.name for goal_result in results] == ['agent-1']
+        assert agents[0].engines[0].cancelled
+        assert agents[2].engines[0].cancelled
+
+    async def test_fastest_k(self):
+        pipe = AgentXPipe(completion_policy=CompletionPolicy.fastest_k(2))
+        await pipe.add(*_agents(0.01, 5, 0.02), execute_type='PARALLEL')
+
+        results = await pipe.flow(query_instruction='policy')
+
+        assert [goal_result.name for goal_result in results] == ['agent-0', 'agent-2']
+
+    async def test_quorum_and_all(self):
+        pipe = AgentXPipe(agents=[_agents(0.03, 0.01, 0.02)])
+        await pipe.add(
+            *_agents(0.01, 5, 0.02),
+            execute_type='PARALLEL',
+            completion_policy=CompletionPolicy.quorum(2)
+        )
+
+        results = await pipe.flow(query_instruction='policy')
+
+        # The first group waits for every agent and keeps the agent order
+        assert [goal_result.name for goal_result in results] == [
+            'agent-0', 'agent-1', 'agent-2', 'agent-0', 'agent-2'
+        ]
+
+    def test_invalid_policy(self):
+        with pytest.raises(ValueError):
+            CompletionPolicy.quorum(0)
+
+    @pytest.mark.parametrize('completion_policy', [CompletionPolicy.all(), CompletionPolicy.fastest_k(2)])
+    async def test_cancelled_agent_is_a_failure(self, completion_policy: CompletionPolicy):
+        agents = [CancelledAgent(name='cancelled'), *_agents(0.02, 0.03)]
+        pipe = AgentXPipe(agents=[ParallelGroup(agents, completion_policy=completion_policy)])
+
+        results = await pipe.flow(query_instruction='policy')
+
+        assert [goal_result.name for goal_result in results] == ['agent-0', 'agent-1']
@@ -0,0 +1,83 @@
+import asyncio
+import time
+
+from superagentx.agent import Agent
+from superagentx.agentxpipe import AgentXPipe
+from superagentx.handler.base import BaseHandler
+from superagentx.llm.limiter import LLMConcurrencyLimiter
+from superagentx.task_engine import TaskEngine
+
+'''
+ Run Pytest:
+
+   1. pytest --log-cli-level=INFO tests/pipe/test_pipe_concurrency.py
+'''
+
+
+class CountingHandler(BaseHandler):
+
+    def __init__(self, **kwargs):
+        super().__init__(**kwargs)
+        self.running = 0
+        self.peak = 0
+
+    async def work(self, seconds: float):
+        self.running += 1
+        self.peak = max(self.peak, self.running)
+        await asyncio.sleep(seconds)
+        self.running -= 1
+        return {"done": True}
+
+
+class TestPipeConcurrency:
+
+    async def test_pipe_max_concurrency(self):
+        handler = CountingHandler()
+        agents = [
+            Agent(
+                name=f'agent-{idx}',
+                engines=[TaskEngine(handler=handler, instructions=[{"work": {"seconds": 0.05}}])]
+            )
+            for idx in range(4)
+        ]
+        pipe = AgentXPipe(agents=[agents], max_concurrency=2)
+
+        results = await pipe.flow(query_instruction='bounded')
+
+        assert len(results) == 4
+        assert handler.peak == 2
+
+    async def test_agent_max_concurrency(self):
+        handler = CountingHandler()
+        engines = [
+            TaskEngine(handler=handler, instructions=[{"work": {"seconds": 0.05}}])
+            for _ in range(3)
+        ]
+        agent = Agent(name='engines', engines=[engines], max_concurrency=1)
+
+        started = time.perf_counter()
+        result = await agent.execute(query_instruction='bounded')
+
+        assert result.result
+        assert handler.peak == 1
+        assert time.perf_counter() - started >= 0.15
+
+    async def test_llm_limiter_provider_and_model(self):
+        limiter = LLMConcurrencyLimiter()
+        limiter.set_limit(llm_type='openai', max_concurrency=3)
+        limiter.set_limit(llm_type='openai', model='gpt-4o', max_concurrency=1)
+        running = {'gpt-4o': 0, 'gpt-4o-mini': 0}
+        peak = {'gpt-4o': 0, 'gpt-4o-mini': 0, 'total': 0}
+
+        async def _call(model: str):
+            async with limiter.acquire(llm_type='openai', model=model):
+                running[model] += 1
+                peak[model] = max(peak[model], running[model])
+                peak['total'] = max(peak['total'], sum(running.values()))
+                await asyncio.sleep(0.02)
+                running[model] -= 1
+
+        await asyncio.gather(*[_call('gpt-4o') for _ in range(3)], *[_call('gpt-4o-mini') for _ in range(5)])
+
+        assert peak['gpt-4o'] == 1
+        assert peak['total'] == 3
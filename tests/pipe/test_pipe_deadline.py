@@ -0,0 +1,62 @@
+import asyncio
+
+from superagentx.agent import Agent
+from superagentx.agentxpipe import AgentXPipe
+from superagentx.base import BaseEngine
+
+'''
+ Run Pytest:
+
+   1. pytest --log-cli-level=INFO tests/pipe/test_pipe_deadline.py
+'''
+
+
+class SleepEngine(BaseEngine):
+
+    def __init__(self, seconds: float, **kwargs):
+        super().__init__(**kwargs)
+        self.seconds = seconds
+        self.cancelled = False
+
+    async def start(self, input_prompt: str, **kwargs):
+        try:
+            await asyncio.sleep(self.seconds)
+        except asyncio.CancelledError:
+            self.cancelled = True
+            raise
+        return {"slept": self.seconds}
+
+
+class TestPipeDeadline:
+
+    async def test_flow_timeout_returns_partial_results(self):
+        slow = SleepEngine(5)
+        never = SleepEngine(0)
+        pipe = AgentXPipe(
+            agents=[
+                Agent(name='partial', engines=[SleepEngine(0), slow]),
+                Agent(name='skipped', engines=[never])
+            ]
+        )
+
+        loop = asyncio.get_running_loop()
+        started = loop.time()
+        results = await pipe.flow(query_instruction='deadline', timeout=0.2)
+
+        assert loop.time() - started < 1
+        assert slow.cancelled
+        assert [goal_result.name for goal_result in results] == ['partial']
+        assert results[0].error == 'Deadline exceeded'
+        assert results[0].is_goal_satisfied is False
+        # The engine which finished before the deadline is kept
+        assert results[0].result == [{"slept": 0}]
+
+    async def test_agent_deadline_stops_retries(self):
+        engine = SleepEngine(5)
+        agent = Agent(name='retry', engines=[engine], max_retry=3)
+
+        deadline = asyncio.get_running_loop().time() + 0.1
+        goal_result = await agent.execute(query_instruction='deadline', deadline=deadline)
+
+        assert goal_result.error == 'Deadline exceeded'
+        assert goal_result.result is None
@@ -0,0 +1,83 @@
+import asyncio
+import time
+
+from superagentx.agent import Agent
+from superagentx.agentxpipe import AgentXPipe
+from superagentx.base import BaseEngine
+from superagentx.event_bus import EventBus, OverflowPolicy
+
+'''
+ Run Pytest:
+
+   1. pytest --log-cli-level=INFO tests/pipe/test_pipe_event_bus.py
+'''
+
+
+class TimedEngine(BaseEngine):
+
+    def __init__(self, **kwargs):
+        super().__init__(**kwargs)
+        self.started_at = None
+
+    async def start(self, input_prompt: str, **kwargs):
+        self.started_at = time.perf_counter()
+        return {"done": True}
+
+
+class TestPipeEventBus:
+
+    async def test_slow_callback_does_not_delay_agents(self):
+        events = []
+
+        async def slow_status(**kwargs):
+            await asyncio.sleep(0.05)
+            events.append(kwargs["event"])
+
+        engine = TimedEngine()
+        pipe = AgentXPipe(agents=[Agent(name='fast', engines=[engine])])
+
+        started = time.perf_counter()
+        results = await pipe.flow(query_instruction='status', status_callback=slow_status)
+
+        assert results[0].result == [{"done": True}]
+        # pipe_flow_start and agent_execute_start were published before the engine ran
+        assert engine.started_at - started < 0.05
+        # Every event was delivered, in order, before the flow returned
+        assert events[0] == 'pipe_flow_start'
+        assert events[-1] == 'pipe_flow_end'
+
+    async def test_failing_callback_does_not_fail_flow(self):
+        def broken_status(**kwargs):
+            raise RuntimeError('broken consumer')
+
+        pipe = AgentXPipe(agents=[Agent(name='fast', engines=[TimedEngine()])])
+        results = await pipe.flow(query_instruction='status', status_callback=broken_status)
+        assert results[0].result == [{"done": True}]
+
+    async def test_overflow_policies(self):
+        received = {}
+        release = asyncio.Event()
+
+        def consumer(name):
+            async def _consume(**kwargs):
+                await release.wait()
+                received.setdefault(name, []).append((kwargs["event"], kwargs["step"]))
+            return _consume
+
+        bus = EventBus()
+        for policy in OverflowPolicy.ALL:
+            bus.subscribe(consumer(policy), max_queue_size=2, overflow=policy)
+
+        # The first event is taken by each dispatch task, the next ones are queued
+        bus.publish(event='start', agent_id='a', step=0)
+        await asyncio.sleep(0)
+        bus.publish(event='progress', agent_id='a', step=1)
+        bus.publish(event='done', agent_id='b', step=2)
+        bus.publish(event='progress', agent_id='a', step=3)
+        release.set()
+        await bus.close()
+
+        assert received[OverflowPolicy.DROP_OLDEST] == [('start', 0), ('done', 2), ('progress', 3)]
+        assert received[OverflowPolicy.DROP_NEWEST] == [('start', 0), ('progress', 1), ('done', 2)]
+        assert received[OverflowPolicy.COALESCE] == [('start', 0), ('progress', 3), ('done', 2)]
+        assert bus.dropped == 3
@@ -0,0 +1,101 @@
+import asyncio
+import time
+
+import pytest
+
+from superagentx.agent import Agent
+from superagentx.agentxpipe import AgentXPipe
+from superagentx.exceptions import StopSuperAgentX
+from superagentx.handler.base import BaseHandler
+from superagentx.result import GoalResult
+from superagentx.task_engine import TaskEngine
+
+'''
+ Run Pytest:
+
+   1. pytest --log-cli-level=INFO tests/pipe/test_pipe_graph.py
+'''
+
+
+class SleepHandler(BaseHandler):
+
+    async def sleep(self, seconds: float):
+        await asyncio.sleep(seconds)
+        return {"slept": seconds}
+
+
+class TimedAgent(Agent):
+
+    def __init__(self, stop: bool = False, **kwargs):
+        super().__init__(**kwargs)
+        self.stop = stop
+
+    async def execute(self, **kwargs) -> GoalResult:
+        await asyncio.sleep(0.05)
+        goal_result = GoalResult(name=self.name, agent_id=self.agent_id, is_goal_satisfied=not self.stop)
+        if self.stop:
+            raise StopSuperAgentX(message='Goal not satisfied. Stopping execution.', goal_result=goal_result)
+        return goal_result
+
+
+def _agent(name: str, seconds: float, depends_on: list[Agent] | None = None) -> Agent:
+    return Agent(
+        name=name,
+        engines=[TaskEngine(handler=SleepHandler(), instructions=[{"sleep": {"seconds": seconds}}])],
+        depends_on=depends_on
+    )
+
+
+class TestPipeDependencyGraph:
+
+    async def test_independent_branch_does_not_wait(self):
+        slow = _agent('slow', 0.4)
+        fast = _agent('fast', 0.05)
+        after_fast = _agent('after_fast', 0.05, depends_on=[fast])
+        pipe = AgentXPipe(agents=[[slow, fast], after_fast])
+
+        started = time.perf_counter()
+        results = await pipe.flow(query_instruction='graph')
+        elapsed = time.perf_counter() - started
+
+        assert [result.name for result in results] == ['fast', 'after_fast', 'slow']
+        assert elapsed < 0.6
+
+    async def test_stage_dependencies_are_implicit(self):
+        first = _agent('first', 0.05)
+        second = _agent('second', 0.01)
+        root = _agent('root', 0.2, depends_on=[])
+        pipe = AgentXPipe(agents=[first, second, root])
+
+        graph = pipe._build_dependency_graph()
+        assert graph[second] == [first]
+        assert graph[root] == []
+
+        results = await pipe.flow(query_instruction='graph')
+        assert [result.name for result in results] == ['first', 'second', 'root']
+
+    async def test_stop_keeps_results_finished_at_the_same_time(self):
+        stopper = TimedAgent(name='stopper', stop=True, depends_on=[])
+        finished = [TimedAgent(name=f'finished-{idx}', depends_on=[]) for idx in range(3)]
+        after = _agent('after', 0.01, depends_on=[stopper])
+        pipe = AgentXPipe(agents=[stopper, *finished, after])
+
+        results = await pipe.flow(query_instruction='graph')
+
+        assert sorted(result.name for result in results) == ['finished-0', 'finished-1', 'finished-2', 'stopper']
+
+    async def test_cycle_is_rejected(self):
+        first = _agent('first', 0.01)
+        second = _agent('second', 0.01, depends_on=[first])
+        first.depends_on = [second]
+        pipe = AgentXPipe(agents=[first, second])
+
+        with pytest.raises(ValueError):
+            pipe._build_dependency_graph()
+
+    async def test_unknown_dependency_is_rejected(self):
+        outsider = _agent('outsider', 0.01)
+        pipe = AgentXPipe(agents=[_agent('inside', 0.01, depends_on=[outsider])])
+
+        with pytest.raises(ValueError):
+            pipe._build_dependency_graph()
@@ -0,0 +1,85 @@
+import asyncio
+
+from superagentx.agent import Agent
+from superagentx.agentxpipe import AgentXPipe
+from superagentx.base import BaseEngine
+from superagentx.memory_writer import MemoryWriter
+from superagentx.result import GoalResult
+
+'''
+ Run Pytest:
+
+   1. pytest --log-cli-level=INFO tests/pipe/test_pipe_memory.py
+'''
+
+
+class EchoEngine(BaseEngine):
+
+    async def start(self, input_prompt: str, **kwargs):
+        return {"old_memory": kwargs.get("old_memory")}
+
+
+class ReasonAgent(Agent):
+
+    async def execute(self, **kwargs) -> GoalResult:
+        return GoalResult(name=self.name, agent_id=self.agent_id, result={"name": self.name}, reason='done')
+
+
+class FakeMemory:
+
+    def __init__(self, write_delay: float = 0.0):
+        self.write_delay = write_delay
+        self.searches = 0
+        self.batches: list[list[dict]] = []
+
+    async def search(self, **kwargs):
+        self.searches += 1
+        return [{"role": "assistant", "content": "remembered"}]
+
+    async def add(self, **kwargs):
+        await self.add_many([kwargs])
+
+    async def add_many(self, items: list[dict]):
+        await asyncio.sleep(self.write_delay)
+        self.batches.append(items)
+
+
+class TestPipeMemory:
+
+    async def test_memory_is_retrieved_once_per_flow(self):
+        memory = FakeMemory()
+        agents = [
+            Agent(name='first', engines=[EchoEngine()]),
+            [Agent(name='second', engines=[EchoEngine()]), Agent(name='third', engines=[EchoEngine()])],
+            Agent(name='fourth', engines=[EchoEngine()])
+        ]
+        pipe = AgentXPipe(agents=agents, memory=memory)
+
+        results = await pipe.flow(query_instruction='memory')
+
+        assert memory.searches == 1
+        assert len(results) == 4
+        for goal_result in results:
+            assert goal_result.result[0]['old_memory'] == [{"role": "assistant", "content": "remembered"}]
+
+    async def test_memory_writes_are_flushed_when_the_flow_ends(self):
+        memory = FakeMemory(write_delay=0.05)
+        agents = [ReasonAgent(name=f'agent_{index}', engines=[EchoEngine()]) for index in range(4)]
+        pipe = AgentXPipe(agents=agents, memory=memory)
+
+        await pipe.flow(query_instruction='memory')
+
+        written = [item for batch in memory.batches for item in batch]
+        assert len(written) == 4
+        # Results recorded while a write is in progress are written together
+        assert len(memory.batches) < 4
+
+    async def test_memory_writer_batches_queued_items(self):
+        memory = FakeMemory(write_delay=0.01)
+        writer = MemoryWriter(memory, max_batch_size=3)
+        for index in range(7):
+            writer.add(data=index)
+        await writer.close()
+
+        assert [len(batch) for batch in memory.batches] == [3, 3, 1]
+        assert [item['data'] for batch in memory.batches for item in batch] == list(range(7))
@@ -0,0 +1,51 @@
+from superagentx.agent import Agent
+from superagentx.agentxpipe import AgentXPipe
+from superagentx.base import BaseEngine
+
+'''
+ Run Pytest:
+
+   1. pytest --log-cli-level=INFO tests/pipe/test_pipe_pre_result.py
+'''
+
+
+class ContextEngine(BaseEngine):
+
+    def __init__(self, size: int, **kwargs):
+        super().__init__(**kwargs)
+        self.size = size
+        self.pre_result = None
+
+    async def start(self, input_prompt: str, pre_result=None, **kwargs):
+        self.pre_result = pre_result
+        return 'x' * self.size
+
+
+class TestPipePreResult:
+
+    async def test_pre_result_within_token_budget(self):
+        engines = [ContextEngine(1000) for _ in range(6)]
+        pipe = AgentXPipe(
+            agents=[Agent(name=f'agent-{idx}', engines=[engine]) for idx, engine in enumerate(engines)],
+            pre_result_token_budget=1000
+        )
+
+        await pipe.flow(query_instruction='budget')
+
+        pre_result = engines[-1].pre_result
+        assert sum(len(text) for text in pre_result) <= 1000 * 4 + 200
+        # The newest result is kept in full, the one before is truncated and the oldest are left out
+        assert pre_result[-1].endswith('Is Goal Satisfied: None\n\n')
+        assert pre_result[-2].endswith('...(truncated)\n\n')
+        assert pre_result[0].startswith('3 earlier result(s) omitted')
+
+    async def test_pre_result_unbounded_by_default(self):
+        engines = [ContextEngine(2000) for _ in range(4)]
+        pipe = AgentXPipe(
+            agents=[Agent(name=f'agent-{idx}', engines=[engine]) for idx, engine in enumerate(engines)]
+        )
+
+        await pipe.flow(query_instruction='budget')
+
+        assert len(engines[-1].pre_result) == 3
+        assert all('x' * 2000 in text for text in engines[-1].pre_result)
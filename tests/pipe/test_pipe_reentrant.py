@@ -0,0 +1,52 @@
+import asyncio
+
+from superagentx.agent import Agent
+from superagentx.agentxpipe import AgentXPipe
+from superagentx.base import BaseEngine
+
+'''
+ Run Pytest:
+
+   1. pytest --log-cli-level=INFO tests/pipe/test_pipe_reentrant.py
+'''
+
+
+class QueryEngine(BaseEngine):
+
+    async def start(self, input_prompt: str, **kwargs):
+        await asyncio.sleep(0.01)
+        return {"query": input_prompt}
+
+
+class TestPipeReentrant:
+
+    async def test_concurrent_flows_on_one_pipe(self):
+        pipe = AgentXPipe(
+            agents=[
+                Agent(name='first', engines=[QueryEngine()]),
+                Agent(name='second', engines=[QueryEngine()])
+            ]
+        )
+
+        results = await asyncio.gather(
+            *[pipe.flow(query_instruction=f'query-{idx}') for idx in range(10)]
+        )
+
+        for idx, goal_results in enumerate(results):
+            assert [goal_result.name for goal_result in goal_results] == ['first', 'second']
+            assert goal_results[-1].result == [{"query": f'query-{idx}'}]
+
+    async def test_concurrent_runs_get_their_own_run_id(self):
+        pipe = AgentXPipe(agents=[Agent(name='first', engines=[QueryEngine()])])
+        run_ids = set()
+
+        async def _status(event: str, pipe_id: str, **kwargs):
+            if event == 'pipe_flow_start':
+                run_ids.add(pipe_id)
+
+        await asyncio.gather(
+            *[pipe.flow(query_instruction='query', status_callback=_status) for _ in range(3)]
+        )
+
+        assert len(run_ids) == 3
+        assert pipe.pipe_id in run_ids
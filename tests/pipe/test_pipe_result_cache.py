@@ -0,0 +1,151 @@
+import asyncio
+
+from superagentx.agent import Agent
+from superagentx.agentxpipe import AgentXPipe
+from superagentx.base import BaseEngine
+from superagentx.handler.base import BaseHandler
+from superagentx.result import GoalResult
+from superagentx.result_cache import InMemoryResultCache, ResultCache, SQLiteResultCache, fingerprint
+from superagentx.task_engine import TaskEngine
+
+'''
+ Run Pytest:
+
+   1. pytest --log-cli-level=INFO tests/pipe/test_pipe_result_cache.py
+'''
+
+
+class CountingEngine(BaseEngine):
+
+    def __init__(self, **kwargs):
+        super().__init__(**kwargs)
+        self.calls = 0
+
+    async def start(self, input_prompt: str, **kwargs):
+        self.calls += 1
+        return {"calls": self.calls}
+
+
+class BrokenResultCache(ResultCache):
+
+    async def get(self, key: str):
+        raise OSError('Cache unavailable')
+
+    async def set(self, key: str, results: list[GoalResult]):
+        raise TypeError('Results are not serializable')
+
+    async def clear(self):
+        pass
+
+
+class SearchHandler(BaseHandler):
+
+    def __init__(self, region: str = 'us', **kwargs):
+        super().__init__(**kwargs)
+        self.region = region
+
+    async def search(self, query: str):
+        return {"query": query, "region": self.region}
+
+
+def _search_agent(region: str = 'us', query: str = 'agents', **kwargs) -> Agent:
+    engine = TaskEngine(handler=SearchHandler(region=region), instructions=[{"search": {"query": query}}])
+    return Agent(goal='search', role='researcher', engines=[engine], **kwargs)
+
+
+def _result(name: str) -> GoalResult:
+    return GoalResult(name=name, agent_id=name, result={"name": name})
+
+
+class TestPipeResultCache:
+
+    async def test_repeated_query_returns_cached_results(self):
+        engine = CountingEngine()
+        agent = Agent(name='counter', goal='count', engines=[engine])
+        pipe = AgentXPipe(agents=[agent], result_cache=InMemoryResultCache(ttl=60))
+
+        first = await pipe.flow(query_instruction='How many calls?')
+        repeated = await pipe.flow(query_instruction='  how many   CALLS? ')
+        assert engine.calls == 1
+        assert repeated == first
+
+        await pipe.flow(query_instruction='How many calls?', conversation_id='other')
+        assert engine.calls == 2
+
+        # A changed configuration never reuses the cached results
+        agent.goal = 'count again'
+        await pipe.flow(query_instruction='How many calls?')
+        assert engine.calls == 3
+
+    async def test_cache_hit_sends_flow_events(self):
+        pipe = AgentXPipe(
+            agents=[Agent(name='counter', goal='count', engines=[CountingEngine()])],
+            result_cache=InMemoryResultCache(ttl=60)
+        )
+        await pipe.flow(query_instruction='How many calls?')
+
+        events = []
+
+        async def status_callback(**event):
+            events.append(event)
+
+        cached = await pipe.flow(query_instruction='How many calls?', status_callback=status_callback)
+
+        assert [(event["event"], event["cached"]) for event in events] == [
+            ('pipe_flow_start', True),
+            ('pipe_flow_end', True)
+        ]
+        assert events[-1]["result"] == cached
+
+    async def test_failing_cache_never_fails_the_flow(self):
+        engine = CountingEngine()
+        pipe = AgentXPipe(
+            agents=[Agent(name='counter', goal='count', engines=[engine])],
+            result_cache=BrokenResultCache()
+        )
+
+        for _ in range(2):
+            results = await pipe.flow(query_instruction='How many calls?')
+            assert results[0].error is None
+        assert engine.calls == 2
+
+    def test_fingerprint_of_the_configuration(self):
+        base = fingerprint([_search_agent()])
+
+        # Generated agent names differ in every process
+        assert fingerprint([_search_agent()]) == base
+        assert fingerprint([_search_agent(name='search')]) != base
+        assert fingerprint([_search_agent(region='eu')]) != base
+        assert fingerprint([_search_agent(query='pipes')]) != base
+        assert fingerprint([_search_agent(tool_args={"limit": 5})]) != base
+
+    async def test_cache_expires_and_evicts_least_recently_used(self):
+        cache = InMemoryResultCache(ttl=0.05, max_size=2)
+        await cache.set('a', [_result('a')])
+        await cache.set('b', [_result('b')])
+        assert await cache.get('a') is not None
+        await cache.set('c', [_result('c')])
+        assert await cache.get('b') is None
+        assert (await cache.get('a'))[0].name == 'a'
+
+        await asyncio.sleep(0.06)
+        assert await cache.get('c') is None
+
+    async def test_sqlite_cache_is_kept_across_instances(self, tmp_path):
+        db_path = tmp_path / 'cache.db'
+        cache = SQLiteResultCache(db_path, max_size=2)
+        try:
+            await cache.set('a', [_result('a')])
+            await cache.set('b', [_result('b')])
+            await cache.get('a')
+            await cache.set('c', [_result('c')])
+        finally:
+            await cache.close()
+
+        cache = SQLiteResultCache(db_path, max_size=2)
+        try:
+            assert (await cache.get('a'))[0].result == {"name": 'a'}
+            assert await cache.get('b') is None
+            assert (await cache.get('c'))[0].name == 'c'
+        finally:
+            await cache.close()
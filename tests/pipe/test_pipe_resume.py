@@ -0,0 +1,147 @@
+import json
+from types import SimpleNamespace
+
+import pytest
+
+from superagentx.agent import Agent
+from superagentx.agentxpipe import AgentXPipe
+from superagentx.base import BaseEngine
+from superagentx.prompt import PromptTemplate
+from superagentx.verifiers import RegexVerifier
+
+'''
+ Run Pytest:
+
+   1. pytest --log-cli-level=INFO tests/pipe/test_pipe_resume.py
+'''
+
+
+class FlakyEngine(BaseEngine):
+
+    def __init__(self, failures: int = 0, **kwargs):
+        super().__init__(**kwargs)
+        self.failures = failures
+        self.calls = 0
+
+    async def start(self, input_prompt: str, **kwargs):
+        self.calls += 1
+        if self.calls <= self.failures:
+            raise RuntimeError('engine unavailable')
+        return {"calls": self.calls}
+
+
+class Crash(BaseException):
+    pass
+
+
+class DraftEngine(BaseEngine):
+
+    def __init__(self, outputs: list, **kwargs):
+        super().__init__(**kwargs)
+        self.outputs = outputs
+        self.calls = 0
+
+    async def start(self, input_prompt: str, **kwargs):
+        output = self.outputs[self.calls]
+        self.calls += 1
+        if output is Crash:
+            raise Crash()
+        return output
+
+
+class RejectingLLM:
+    llm_config = {"llm_type": 'fake'}
+
+    async def achat_completion(self, **kwargs):
+        content = json.dumps({"reason": 'not final', "result": 'draft', "is_goal_satisfied": False})
+        return SimpleNamespace(choices=[SimpleNamespace(message=SimpleNamespace(content=content))])
+
+
+def _writer(engine: DraftEngine, max_retry: int) -> Agent:
+    return Agent(
+        name='writer',
+        goal='Write the final report',
+        llm=RejectingLLM(),
+        prompt_template=PromptTemplate(),
+        engines=[engine],
+        verifiers=[RegexVerifier(r'final.*')],
+        max_retry=max_retry,
+        retry_delay=0
+    )
+
+
+class TestPipeResume:
+
+    async def test_resume_skips_completed_agents(self, tmp_path, monkeypatch):
+        monkeypatch.setenv('SQLITE_DB_PATH', str(tmp_path / 'resume.db'))
+        first = FlakyEngine()
+        second = FlakyEngine(failures=1)
+        pipe = AgentXPipe(
+            agents=[
+                Agent(name='first', engines=[first], max_retry=1),
+                Agent(name='second', engines=[second], max_retry=1)
+            ],
+            workflow_store=True
+        )
+
+        results = await pipe.flow(query_instruction='resume')
+        assert [goal_result.name for goal_result in results] == ['first']
+
+        results = await pipe.flow(query_instruction='resume', resume_pipe_id=pipe.pipe_id)
+        assert [goal_result.name for goal_result in results] == ['first', 'second']
+        assert results[0].result == [{"calls": 1}]
+        assert first.calls == 1
+        assert second.calls == 2
+
+    async def test_resume_a_later_run_by_its_run_id(self, tmp_path, monkeypatch):
+        monkeypatch.setenv('SQLITE_DB_PATH', str(tmp_path / 'resume.db'))
+        first = FlakyEngine()
+        second = FlakyEngine(failures=2)
+        pipe = AgentXPipe(
+            agents=[
+                Agent(name='first', engines=[first], max_retry=1),
+                Agent(name='second', engines=[second], max_retry=1)
+            ],
+            workflow_store=True
+        )
+        await pipe.flow(query_instruction='warm up')
+
+        # Not the first run of the pipe, so it is only resumable by the run id the caller chose
+        results = await pipe.flow(query_instruction='resume', run_id='nightly-report')
+        assert [goal_result.name for goal_result in results] == ['first']
+
+        results = await pipe.flow(query_instruction='resume', resume_pipe_id='nightly-report')
+        assert [goal_result.name for goal_result in results] == ['first', 'second']
+        assert first.calls == 2
+        assert second.calls == 3
+
+    async def test_rejected_attempt_is_not_restored(self, tmp_path, monkeypatch):
+        monkeypatch.setenv('SQLITE_DB_PATH', str(tmp_path / 'resume.db'))
+        engine = DraftEngine(['draft', Crash, 'final report'])
+        pipe = AgentXPipe(agents=[_writer(engine, max_retry=2)], workflow_store=True)
+
+        # The process dies on the retry of a rejected attempt
+        with pytest.raises(Crash):
+            await pipe.flow(query_instruction='report')
+
+        results = await pipe.flow(query_instruction='report', resume_pipe_id=pipe.pipe_id)
+        assert results[0].is_goal_satisfied
+        assert results[0].result == 'final report'
+        assert engine.calls == 3
+
+    async def test_unsatisfied_agent_runs_again_on_resume(self, tmp_path, monkeypatch):
+        monkeypatch.setenv('SQLITE_DB_PATH', str(tmp_path / 'resume.db'))
+        engine = DraftEngine(['draft', 'final report'])
+        pipe = AgentXPipe(agents=[_writer(engine, max_retry=1)], workflow_store=True)
+
+        results = await pipe.flow(query_instruction='report')
+        assert results[0].is_goal_satisfied is False
+
+        results = await pipe.flow(query_instruction='report', resume_pipe_id=pipe.pipe_id)
+        assert results[0].is_goal_satisfied
+        assert engine.calls == 2
+
+    async def test_resume_requires_workflow_store(self):
+        pipe = AgentXPipe(agents=[Agent(name='first', engines=[FlakyEngine()])])
+        with pytest.raises(ValueError):
+            await pipe.flow(query_instruction='resume', resume_pipe_id='missing')
@@ -0,0 +1,76 @@
+import asyncio
+
+from superagentx.agent import Agent
+from superagentx.agentxpipe import AgentXPipe
+from superagentx.base import BaseEngine
+from superagentx.exceptions import StopSuperAgentX
+from superagentx.result import GoalResult
+
+'''
+ Run Pytest:
+
+   1. pytest --log-cli-level=INFO tests/pipe/test_pipe_stream.py
+'''
+
+
+class DelayEngine(BaseEngine):
+
+    def __init__(self, delay: float, **kwargs):
+        super().__init__(**kwargs)
+        self.delay = delay
+
+    async def start(self, input_prompt: str, **kwargs):
+        await asyncio.sleep(self.delay)
+        return {"delay": self.delay}
+
+
+class StoppingAgent(Agent):
+
+    async def execute(self, **kwargs) -> GoalResult:
+        await asyncio.sleep(0.05)
+        raise StopSuperAgentX(
+            message='Goal not satisfied. Stopping execution.',
+            goal_result=GoalResult(name=self.name, agent_id=self.agent_id, is_goal_satisfied=False)
+        )
+
+
+class TestPipeStream:
+
+    async def test_flow_stream_yields_parallel_results_as_they_finish(self):
+        slow = Agent(name='slow', engines=[DelayEngine(0.3)])
+        fast = Agent(name='fast', engines=[DelayEngine(0.01)])
+        pipe = AgentXPipe(agents=[[slow, fast]])
+
+        loop = asyncio.get_running_loop()
+        start = loop.time()
+        arrivals = []
+        async for goal_result in pipe.flow_stream(query_instruction='stream'):
+            arrivals.append((goal_result.name, loop.time() - start))
+
+        assert [name for name, _ in arrivals] == ['fast', 'slow']
+        # The fast result is delivered before the slow agent of the same stage completes
+        assert arrivals[0][1] < 0.2
+
+    async def test_flow_stream_matches_flow(self):
+        agents = [
+            Agent(name='first', engines=[DelayEngine(0.01)]),
+            Agent(name='second', engines=[DelayEngine(0.01)])
+        ]
+        pipe = AgentXPipe(agents=agents)
+
+        streamed = [goal_result.name async for goal_result in pipe.flow_stream(query_instruction='stream')]
+        flowed = [goal_result.name for goal_result in await pipe.flow(query_instruction='stream')]
+        assert streamed == flowed == ['first', 'second']
+
+    async def test_stop_in_parallel_stage_matches_flow(self):
+        after = Agent(name='after', engines=[DelayEngine(0.01)])
+        pipe = AgentXPipe(agents=[
+            [StoppingAgent(name='stopper'), Agent(name='fast', engines=[DelayEngine(0.01)])],
+            after
+        ])
+
+        streamed = [goal_result.name async for goal_result in pipe.flow_stream(query_instruction='stream')]
+        flowed = [goal_result.name for goal_result in await pipe.flow(query_instruction='stream')]
+
+        # The stop ends the pipe after its stage, the stopped result is returned like a sequential stop
+        assert sorted(streamed) == sorted(flowed) == ['fast', 'stopper']
@@ -0,0 +1,58 @@
+import os
+
+from superagentx.agent import Agent
+from superagentx.agentxpipe import AgentXPipe
+from superagentx.base import BaseEngine
+from superagentx.db_store.db_storage import SQLiteStorage
+from superagentx.pipeimpl.workerpool import WorkerPoolPipe
+
+'''
+ Run Pytest:
+
+   1. pytest --log-cli-level=INFO tests/pipe/test_pipe_workerpool.py
+'''
+
+
+class PidEngine(BaseEngine):
+
+    async def start(self, input_prompt: str, **kwargs):
+        return {"pid": os.getpid()}
+
+
+def build_pipe() -> AgentXPipe:
+    return AgentXPipe(
+        agents=[
+            Agent(name='first', engines=[PidEngine()]),
+            Agent(name='second', engines=[PidEngine()])
+        ],
+        workflow_store=True
+    )
+
+
+class TestPipeWorkerPool:
+
+    async def test_flows_run_in_worker_processes(self, tmp_path, monkeypatch):
+        monkeypatch.setenv('SQLITE_DB_PATH', str(tmp_path / 'pool.db'))
+        async with WorkerPoolPipe(pipe_factory=build_pipe, workers=2, poll_interval=0.05) as pool:
+            pipe_ids = [await pool.submit(f'query {index}') for index in range(4)]
+            results = [await pool.result(pipe_id, timeout=60) for pipe_id in pipe_ids]
+
+        for goal_results in results:
+            assert [goal_result.name for goal_result in goal_results] == ['first', 'second']
+            assert goal_results[0].result[0]['pid'] != os.getpid()
+
+    async def test_claim_and_release(self, tmp_path):
+        storage = SQLiteStorage(str(tmp_path / 'claim.db'))
+        await storage.setup()
+        try:
+            await storage.enqueue_pipe(pipe_id='run-1', input_query='query', conversation_id='conversation')
+
+            claimed = await storage.claim_pipe('worker-1')
+            assert claimed == {"pipe_id": 'run-1', "input_query": 'query', "conversation_id": 'conversation'}
+            # A claimed run is not handed out twice
+            assert await storage.claim_pipe('worker-2') is None
+
+            assert await storage.release_pipes('worker-1') == ['run-1']
+            assert (await storage.claim_pipe('worker-2'))["pipe_id"] == 'run-1'
+        finally:
+            await storage.close()
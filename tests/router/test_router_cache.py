@@ -0,0 +1,77 @@
+import asyncio
+
+from superagentx.agent import Agent
+from superagentx.db_store.db_storage import SQLiteStorage
+from superagentx.router.router_engine import RouterEngine
+from superagentx.router.selection import LatencyAwareSelection
+
+'''
+ Run Pytest:
+
+   1. pytest --log-cli-level=INFO tests/router/test_router_cache.py
+'''
+
+
+class CountingCondition:
+
+    def __init__(self, roles: list[str]):
+        self.roles = roles
+        self.calls = 0
+
+    def __call__(self, context: dict) -> list[str]:
+        self.calls += 1
+        return self.roles
+
+
+class TestRouterCache:
+
+    async def test_routing_decisions_are_cached_by_query_and_candidates(self):
+        search = Agent(name='search', role='search')
+        summary = Agent(name='summary', role='summary')
+        condition = CountingCondition(['search'])
+        router = RouterEngine(condition_fn=condition, mode='condition', cache_ttl=0.1)
+
+        assert await router.route([search, summary], {"query": "Find the news"}) == [search]
+        assert await router.route([search, summary], {"query": "  find the NEWS"}) == [search]
+        assert condition.calls == 1
+
+        # Another candidate set is another decision
+        await router.route([summary, search], {"query": "Find the news"})
+        assert condition.calls == 2
+
+        await asyncio.sleep(0.11)
+        await router.route([search, summary], {"query": "Find the news"})
+        assert condition.calls == 3
+
+    async def test_latency_aware_selection_prefers_fast_reliable_agents(self, tmp_path):
+        storage = SQLiteStorage(str(tmp_path / 'metrics.db'))
+        await storage.setup()
+        try:
+            for duration, success in [(100, True)] * 3 + [(300, True)] * 2:
+                await storage.record_metric(
+                    name='agent.duration_ms', value=duration, labels={"agent": 'fast', "success": success}
+                )
+            for duration, success in [(200, True), (200, False), (200, False)]:
+                await storage.record_metric(
+                    name='agent.duration_ms', value=duration, labels={"agent": 'flaky', "success": success}
+                )
+            await storage.record_metric(name='agent.duration_ms', value=1, labels={"agent": 'new', "success": True})
+
+            stats = await storage.get_agent_stats()
+            assert stats['fast'] == {"count": 5, "mean_ms": 180, "success_rate": 1.0}
+
+            fast, flaky, new = Agent(name='fast'), Agent(name='flaky'), Agent(name='new')
+            policy = LatencyAwareSelection(storage=storage, max_agents=2)
+            # `new` has too few samples and ranks as an average agent, between `fast` (180) and `flaky` (600)
+            assert await policy.select([flaky, new, fast]) == [fast, new]
+
+            router = RouterEngine(
+                condition_fn=lambda context: ['analyst'],
+                mode='condition',
+                selection_policy=LatencyAwareSelection(storage=storage)
+            )
+            for agent in (fast, flaky, new):
+                agent.role = 'analyst'
+            assert await router.route([flaky, new, fast], {"query": "analyse"}) == [fast]
+        finally:
+            await storage.close()
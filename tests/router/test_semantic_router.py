@@ -0,0 +1,54 @@
+from superagentx.agent import Agent
+from superagentx.router.router_engine import RouterEngine
+
+'''
+ Run Pytest:
+
+   1. pytest --log-cli-level=INFO tests/router/test_semantic_router.py
+'''
+
+_TOPICS = ['weather', 'finance', 'travel']
+
+
+class KeywordEmbedder:
+    """Embeds a text as the counts of a few topic words, deterministic and offline."""
+
+    def __init__(self):
+        self.calls = 0
+
+    async def aembed(self, *, text: str, **kwargs) -> list[float]:
+        self.calls += 1
+        text = text.lower()
+        return [float(text.count(topic)) for topic in _TOPICS]
+
+
+class TestSemanticRouter:
+
+    async def test_routes_by_similarity_and_embeds_agents_once(self):
+        weather = Agent(name='weather', role='weather analyst', goal='Report the weather', capabilities=['forecast'])
+        finance = Agent(name='finance', role='finance analyst', goal='Report the stock market')
+        travel = Agent(name='travel', role='travel planner', goal='Plan a travel itinerary with weather checks')
+        agents = [weather, finance, travel]
+        embedder = KeywordEmbedder()
+        router = RouterEngine(mode='semantic', embed_llm=embedder, similarity_threshold=0.4)
+
+        await router.prepare(agents)
+        assert embedder.calls == 3
+
+        selected = await router.route(agents, {"query": "What is the weather tomorrow?"})
+        assert selected == [weather, travel]
+        selected = await router.route(agents, {"query": "How is my finance portfolio doing?"})
+        assert selected == [finance]
+        # Agents are embedded once, every routing decision embeds only the query
+        assert embedder.calls == 5
+
+    async def test_top_k_and_changed_agents(self):
+        weather = Agent(name='weather', role='weather analyst')
+        travel = Agent(name='travel', role='travel planner with weather')
+        embedder = KeywordEmbedder()
+        router = RouterEngine(mode='semantic', embed_llm=embedder, similarity_threshold=0.1, top_k=1)
+
+        assert await router.route([travel, weather], {"query": "weather"}) == [weather]
+
+        weather.role = 'finance analyst'
+        assert await router.route([travel, weather], {"query": "weather"}) == [travel]